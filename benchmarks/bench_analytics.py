@@ -0,0 +1,100 @@
+"""Speed of the NumPy report summaries against grouping the same expenses
+row by row in Python.
+
+    python benchmarks/bench_analytics.py --rows 100000 --rows 1000000
+"""
+
+# pylint: disable=wrong-import-position
+
+from argparse import ArgumentParser
+from collections import defaultdict
+from datetime import datetime, timedelta
+from statistics import quantiles as statistics_quantiles
+from time import perf_counter
+
+import numpy as np
+from kink import di
+
+di["db_url"] = "sqlite://"
+
+from expense_tracker import analytics
+from expense_tracker.analytics import ExpenseArrays
+
+CATEGORIES = 40
+
+
+def make_arrays(rows: int) -> ExpenseArrays:
+    rng = np.random.default_rng(42)
+    start = np.datetime64("2015-01-01", "us")
+
+    return ExpenseArrays(
+        np.arange(1, rows + 1, dtype=np.int64),
+        rng.integers(1, 100_000, rows),
+        np.sort(start + rng.integers(0, 10 * 365 * 86_400_000_000, rows).astype("timedelta64[us]")),
+        rng.integers(0, CATEGORIES + 1, rows).astype(np.int32),
+        (None, *(f"Category{i}" for i in range(CATEGORIES))),
+    )
+
+
+def row_by_row(rows: list[tuple[int, int, datetime, int]]) -> None:
+    """What a report built on expense rows has to do."""
+    by_category: dict[int, list[int]] = defaultdict(lambda: [0, 0])
+    by_month: dict[tuple[int, int], list[int]] = defaultdict(lambda: [0, 0])
+    by_weekday = [[0, 0] for _ in range(7)]
+    amounts: dict[int, list[int]] = defaultdict(list)
+
+    for _, cents, date, code in rows:
+        for group in (by_category[code], by_month[date.year, date.month],
+                      by_weekday[date.weekday()]):
+            group[0] += cents
+            group[1] += 1
+        amounts[code].append(cents)
+
+    for values in amounts.values():
+        statistics_quantiles(values, n=100, method="inclusive")
+
+    sorted(rows, key=lambda row: -row[1])[:5]  # pylint: disable=expression-not-assigned
+
+
+def vectorized(arrays: ExpenseArrays) -> None:
+    analytics.by_category(arrays)
+    analytics.by_month(arrays)
+    analytics.by_weekday(arrays)
+    analytics.percentiles_by_category(arrays, [50, 90, 99])
+    analytics.top_expenses(arrays, 5)
+
+
+def run(rows: int) -> None:
+    arrays = make_arrays(rows)
+    records = list(zip(
+        arrays.ids.tolist(),
+        arrays.cents.tolist(),
+        [datetime(1970, 1, 1) + timedelta(microseconds=int(us))
+         for us in arrays.dates.astype(np.int64)],
+        arrays.categories.tolist(),
+    ))
+
+    start = perf_counter()
+    row_by_row(records)
+    python = perf_counter() - start
+
+    start = perf_counter()
+    vectorized(arrays)
+    numpy = perf_counter() - start
+
+    print(f"\n{rows:,} rows")
+    print(f"  row by row   {python:8.3f}s")
+    print(f"  NumPy        {numpy:8.3f}s  ({python / numpy:.0f}x)")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    args = parser.parse_args()
+
+    for rows in args.rows or [100_000, 1_000_000]:
+        run(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Concurrent summary queries: the async repository on one event loop
+against the sync repository on a thread pool.
+
+    python benchmarks/bench_async_concurrency.py --rows 200000 --queries 2000 --concurrency 50
+"""
+
+# pylint: disable=wrong-import-position
+
+import asyncio
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from kink import di
+
+TMP_DIR = TemporaryDirectory()
+di["db_url"] = f"sqlite:///{TMP_DIR.name}/bench.db"
+
+from expense_tracker.database import (
+    ASYNC_DATABASE, BASE, get_async_db, get_db, get_engine
+)
+from expense_tracker.repositories import (
+    AsyncSQLAlchemyExpenseRepository, SQLAlchemyExpenseRepository
+)
+
+
+CATEGORIES = ["Food", "Transport", "Rent", "Utilities", "Leisure"]
+
+
+def seed(repo: SQLAlchemyExpenseRepository, rows: int) -> None:
+    start = datetime(2024, 1, 1)
+    repo.bulk_insert(
+        {
+            "description": f"Expense {i}",
+            "amount": float(i % 500),
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "date": start + timedelta(minutes=i * 5),
+        }
+        for i in range(rows)
+    )
+
+
+def query_args(queries: int) -> list[tuple[str, tuple]]:
+    calls = []
+
+    for i in range(queries):
+        month = i % 12 + 1
+        calls.append([
+            ("category_summary", (CATEGORIES[i % len(CATEGORIES)],)),
+            ("monthly_totals", (month, 2024)),
+            ("period_totals", (datetime(2024, month, 1), datetime(2024, month, 15))),
+        ][i % 3])
+
+    return calls
+
+
+def run_sync(repo: SQLAlchemyExpenseRepository, calls, concurrency: int) -> float:
+    start = perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda call: getattr(repo, call[0])(*call[1]), calls))
+
+    return perf_counter() - start
+
+
+async def run_async(repo: AsyncSQLAlchemyExpenseRepository, calls, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(name, args):
+        async with semaphore:
+            return await getattr(repo, name)(*args)
+
+    start = perf_counter()
+    await asyncio.gather(*(one(name, args) for name, args in calls))
+    elapsed = perf_counter() - start
+
+    await ASYNC_DATABASE.aclose()
+    return elapsed
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, action="append")
+    args = parser.parse_args()
+
+    BASE.metadata.create_all(bind=get_engine())
+    sync_repo = SQLAlchemyExpenseRepository(get_db)
+    async_repo = AsyncSQLAlchemyExpenseRepository(get_async_db)
+    seed(sync_repo, args.rows)
+    calls = query_args(args.queries)
+
+    print(f"\n{args.rows:,} rows, {args.queries:,} summary queries")
+
+    for concurrency in args.concurrency or [1, 10, 50]:
+        sync_elapsed = run_sync(sync_repo, calls, concurrency)
+        async_elapsed = asyncio.run(run_async(async_repo, calls, concurrency))
+
+        print(f"  concurrency {concurrency:>4}")
+        for name, elapsed in [("sync + threads", sync_elapsed), ("async", async_elapsed)]:
+            print(f"    {name:<16} {elapsed:8.3f}s {args.queries / elapsed:10,.0f} queries/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Insert throughput of ``bulk_import`` (ORM unit of work) against ``bulk_insert``
+(batched Core executemany) on a throwaway SQLite database.
+
+    python benchmarks/bench_bulk_insert.py --rows 200000 --batch-size 10000
+"""
+
+# pylint: disable=wrong-import-position
+
+from argparse import ArgumentParser
+from datetime import datetime
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from kink import di
+
+TMP_DIR = TemporaryDirectory()
+di["db_url"] = f"sqlite:///{TMP_DIR.name}/bench.db"
+
+from sqlalchemy import delete
+
+from expense_tracker.database import BASE, get_db, get_engine
+from expense_tracker.models import Expense
+from expense_tracker.repositories import SQLAlchemyExpenseRepository
+
+
+def make_rows(rows: int) -> list[dict]:
+    now = datetime.now()
+    return [
+        {
+            "description": f"Expense {i}",
+            "amount": float(i % 500),
+            "category": "Food",
+            "notes": None,
+            "date": now,
+        }
+        for i in range(rows)
+    ]
+
+
+def run(rows: int, batch_size: int) -> None:
+    repo = SQLAlchemyExpenseRepository(get_db)
+    data = make_rows(rows)
+
+    print(f"\n{rows:,} rows")
+
+    cases = {
+        "bulk_import (ORM)": lambda: repo.bulk_import(
+            [Expense(**row) for row in data]),
+        f"bulk_insert ({batch_size:,}/batch)": lambda: repo.bulk_insert(
+            data, batch_size),
+    }
+
+    for name, case in cases.items():
+        start = perf_counter()
+        inserted = case()
+        elapsed = perf_counter() - start
+
+        assert inserted == rows
+        print(f"  {name:<26} {elapsed:8.3f}s {rows / elapsed:12,.0f} rows/s")
+
+        with get_engine().begin() as connection:
+            connection.execute(delete(Expense.__table__))
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    args = parser.parse_args()
+
+    BASE.metadata.create_all(bind=get_engine())
+
+    for rows in args.rows or [10_000, 100_000]:
+        run(rows, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
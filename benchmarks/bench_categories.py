@@ -0,0 +1,181 @@
+"""File size and category query latency with categories stored as text on
+every expense versus integer ids into the `categories` table.
+
+    python benchmarks/bench_categories.py --rows 1000000 --rows 5000000
+
+Both layouts hold the same expenses and have the same indexes. Large sizes
+take a while to generate; databases are cached in --cache-dir.
+"""
+
+# pylint: disable=wrong-import-position
+
+import json
+
+from argparse import ArgumentParser
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from tempfile import gettempdir
+from time import perf_counter
+
+from kink import di
+
+di["db_url"] = "sqlite://"
+
+from sqlalchemy import (
+    Column, DateTime, Integer, MetaData, String, Table,
+    create_engine, func, select, text
+)
+
+from expense_tracker.migrations import upgrade
+from expense_tracker.money import Money
+from expense_tracker.repositories.queries import list_query, period_totals_query
+
+CATEGORIES = [
+    "Groceries", "Restaurants", "Transport", "Utilities", "Entertainment",
+    "Healthcare", "Insurance", "Household", "Subscriptions", "Education",
+    "Clothing", "Travel", "Gifts", "Charity", "Personal care", "Pets",
+]
+
+# 16 categories, amounts up to 999.99, dated over ~10 years.
+ROWS = """
+WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < {last})
+SELECT 'Expense', {category}, (i * 7919) % 100000,
+       datetime('2015-01-01', '+' || (i / 3000) || ' days')
+FROM n
+"""
+
+# The text layout, typed like `Expense` so both sides pay for the same
+# result processing.
+TEXT_EXPENSES = Table(
+    "expenses",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("description", String(100)),
+    Column("category", String(50)),
+    Column("amount_cents", Money, key="amount"),
+    Column("date", DateTime),
+    Column("notes", String(200)),
+)
+
+TEXT_SCHEMA = [
+    "CREATE TABLE expenses (id INTEGER PRIMARY KEY, description VARCHAR(100) NOT NULL, "
+    "category VARCHAR(50), amount_cents BIGINT NOT NULL, date DATETIME NOT NULL, "
+    "notes VARCHAR(200))",
+    "CREATE INDEX ix_expenses_category ON expenses (category)",
+    "CREATE INDEX ix_expenses_date ON expenses (date)",
+    "CREATE INDEX ix_expenses_category_date ON expenses (category, date)",
+]
+
+
+def populate_text(engine, rows: int) -> None:
+    category = (
+        f"json_extract('{json.dumps(CATEGORIES)}', "
+        f"'$[' || (i % {len(CATEGORIES)}) || ']')"
+    )
+
+    with engine.begin() as connection:
+        for statement in TEXT_SCHEMA:
+            connection.execute(text(statement))
+
+        connection.execute(text(
+            "INSERT INTO expenses (description, category, amount_cents, date)"
+            + ROWS.format(category=category, last=rows - 1)))
+
+
+def populate_ids(engine, rows: int) -> None:
+    upgrade(engine)
+
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO categories (id, name) VALUES "
+            + ", ".join(f"({i + 1}, '{name}')" for i, name in enumerate(CATEGORIES))
+        ))
+        connection.execute(text(
+            "INSERT INTO expenses (description, category_id, amount_cents, date)"
+            + ROWS.format(category=f"1 + i % {len(CATEGORIES)}", last=rows - 1)))
+
+    with engine.begin() as connection:
+        connection.execute(text("DELETE FROM expense_rollups"))
+
+
+def timed(connection, query, repeat: int = 5) -> float:
+    samples = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        connection.execute(query).all()
+        samples.append(perf_counter() - start)
+
+    return median(samples) * 1000
+
+
+def measure_text(connection, start: datetime, end: datetime) -> dict[str, float]:
+    expenses = TEXT_EXPENSES.c
+
+    return {
+        "GROUP BY category": timed(connection, (
+            select(expenses.category, func.sum(expenses.amount), func.count(expenses.id))
+            .where(expenses.date >= start)
+            .where(expenses.date < end)
+            .group_by(expenses.category)
+            .order_by(expenses.category)
+        )),
+        "filter by category": timed(connection, (
+            select(TEXT_EXPENSES)
+            .where(expenses.category == "Travel")
+            .order_by(expenses.id)
+        )),
+    }
+
+
+def measure_ids(connection, start: datetime, end: datetime) -> dict[str, float]:
+    return {
+        "GROUP BY category": timed(connection, period_totals_query(start, end, None)),
+        "filter by category": timed(connection, list_query("travel", None, None)),
+    }
+
+
+def run(rows: int, cache_dir: Path) -> None:
+    start, end = datetime(2015, 1, 1), datetime(2100, 1, 1)
+    results = {}
+
+    for layout, populate, measure in (
+        ("text", populate_text, measure_text),
+        ("ids", populate_ids, measure_ids),
+    ):
+        path = cache_dir / f"expenses_categories_{layout}_{rows}.db"
+        engine = create_engine(f"sqlite:///{path}")
+
+        if not path.exists():
+            populate(engine, rows)
+
+            with engine.connect() as connection:
+                connection.execute(text("VACUUM"))
+
+        with engine.connect() as connection:
+            results[layout] = {
+                "file size (MB)": path.stat().st_size / 1_000_000,
+                **measure(connection, start, end),
+            }
+
+        engine.dispose()
+
+    print(f"\n{rows:,} rows (median ms)          text         ids")
+    for name, before in results["text"].items():
+        print(f"  {name:<22} {before:10.2f}  {results['ids'][name]:10.2f}")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    parser.add_argument("--cache-dir", type=Path, default=Path(gettempdir()))
+    args = parser.parse_args()
+    args.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    for rows in args.rows or [1_000_000, 5_000_000]:
+        run(rows, args.cache_dir)
+
+
+if __name__ == "__main__":
+    main()
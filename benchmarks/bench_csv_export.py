@@ -0,0 +1,107 @@
+"""Peak memory and wall time of the streaming CSV export against the
+original DataFrame-based export, reading from a throwaway SQLite ledger.
+
+    python benchmarks/bench_csv_export.py --rows 100000 --rows 500000
+
+Peak memory is the tracemalloc high-water mark of the export step alone.
+"""
+
+# pylint: disable=wrong-import-position
+
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import pandas as pd
+from kink import di
+
+TMP_DIR = TemporaryDirectory()
+di["db_url"] = f"sqlite:///{TMP_DIR.name}/bench.db"
+
+from sqlalchemy import delete
+
+from expense_tracker.database import BASE, get_db, get_engine
+from expense_tracker.models import Expense, ExpenseRollup
+from expense_tracker.repositories import SQLAlchemyExpenseRepository
+from expense_tracker.services import PandasCSVService
+
+
+def dataframe_export(expenses: list[Expense], export_path: Path) -> None:
+    """The implementation ``export_expenses`` used before streaming."""
+    data = [
+        {
+            "ID": e.id,
+            "Description": e.description,
+            "Category": e.category or "",
+            "Amount": e.amount,
+            "Date": e.date.strftime("%Y-%m-%d"),
+            "Notes": e.notes or "",
+        }
+        for e in expenses
+    ]
+
+    pd.DataFrame(data).to_csv(export_path, index=False)
+
+
+def measure(export) -> tuple[float, float]:
+    tracemalloc.start()
+    start = perf_counter()
+    export()
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak / 2**20
+
+
+def run(rows: int, out_dir: Path) -> None:
+    repo = SQLAlchemyExpenseRepository(get_db)
+    service = PandasCSVService()
+    start = datetime(2020, 1, 1)
+
+    repo.bulk_insert(
+        {
+            "description": f"Expense {i}",
+            "category": "Food",
+            "amount": float(i % 500),
+            "notes": "Imported",
+            "date": start + timedelta(minutes=i),
+        }
+        for i in range(rows)
+    )
+
+    cases = {
+        "DataFrame (original)": lambda: dataframe_export(
+            repo.list(), out_dir / "dataframe.csv"),
+        "streaming csv": lambda: service.export_expenses(
+            repo.iter_expenses(), out_dir, "streaming"),
+    }
+
+    print(f"\n{rows:,} rows")
+
+    for name, case in cases.items():
+        elapsed, peak = measure(case)
+        print(f"  {name:<22} {elapsed:8.3f}s {peak:10.1f} MiB peak")
+
+    with get_engine().begin() as connection:
+        connection.execute(delete(Expense.__table__))
+        connection.execute(delete(ExpenseRollup.__table__))
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    args = parser.parse_args()
+
+    BASE.metadata.create_all(bind=get_engine())
+
+    with TemporaryDirectory() as out_dir:
+        for rows in args.rows or [10_000, 100_000]:
+            run(rows, Path(out_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Throughput benchmark for the CSV import engines.
+
+Compares the original ``iterrows`` loop with the vectorized ``import_expenses``
+and the chunked ``iter_import_batches`` engine of ``PandasCSVService``.
+
+    python benchmarks/bench_csv_import.py --rows 100000 --rows 500000
+"""
+
+# pylint: disable=wrong-import-position
+
+from argparse import ArgumentParser
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+from kink import di
+
+di["db_url"] = "sqlite://"
+
+from expense_tracker.models import Expense
+from expense_tracker.services import PandasCSVService
+
+
+def write_csv(path: Path, rows: int) -> None:
+    rng = np.random.default_rng(42)
+    categories = np.array(["Food", "Transport", "Rent", "Health", "Fun"])
+
+    pd.DataFrame(
+        {
+            "Description": np.char.add("Expense ", np.arange(rows).astype(str)),
+            "Amount": rng.uniform(1, 500, rows).round(2),
+            "Category": categories[rng.integers(0, len(categories), rows)],
+            "Notes": np.where(rng.random(rows) < 0.5, "Imported", None),
+        }
+    ).to_csv(path, index=False)
+
+
+def iterrows_import(file: Path) -> list[Expense]:
+    """The implementation ``import_expenses`` used before the columnar engine."""
+    expenses = []
+    df = pd.read_csv(file)
+    lower_columns = {col.lower(): col for col in df.columns}
+
+    for _, row in df.iterrows():
+        expenses.append(
+            Expense(
+                description=row.get(lower_columns.get("description")),
+                amount=float(row.get(lower_columns.get("amount")) or 0.0),
+                category=row.get(lower_columns.get("category")),
+                notes=row.get(lower_columns.get("notes")),
+                date=datetime.now(),
+            )
+        )
+
+    return expenses
+
+
+def run(rows: int) -> None:
+    service = PandasCSVService()
+
+    engines = {
+        "iterrows (original)": iterrows_import,
+        "import_expenses": service.import_expenses,
+        "iter_import_batches": lambda file: [
+            row for batch in service.iter_import_batches(file) for row in batch
+        ],
+    }
+
+    with TemporaryDirectory() as tmp:
+        file = Path(tmp) / "expenses.csv"
+        write_csv(file, rows)
+
+        print(f"\n{rows:,} rows")
+
+        for name, engine in engines.items():
+            start = perf_counter()
+            parsed = engine(file)
+            elapsed = perf_counter() - start
+
+            assert len(parsed) == rows
+            print(f"  {name:<22} {elapsed:8.3f}s {rows / elapsed:12,.0f} rows/s")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    args = parser.parse_args()
+
+    for rows in args.rows or [10_000, 100_000]:
+        run(rows)
+
+
+if __name__ == "__main__":
+    main()
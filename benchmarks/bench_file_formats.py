@@ -0,0 +1,84 @@
+"""File size, export time and import parse time of the CSV, Parquet and
+Arrow IPC file services on the same expenses.
+
+    python benchmarks/bench_file_formats.py --rows 100000 --rows 1000000
+
+Needs the arrow extras: pip install expense-tracker[arrow]
+"""
+
+# pylint: disable=wrong-import-position
+
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from kink import di
+
+di["db_url"] = "sqlite://"
+
+from expense_tracker.records import ExpenseRecord
+from expense_tracker.services import PandasCSVService
+from expense_tracker.services.arrow_file_service import ArrowFileService
+
+CATEGORIES = ["Food", "Transport", "Rent", "Health", "Fun", None]
+
+
+def make_expenses(rows: int) -> list[ExpenseRecord]:
+    start = datetime(2020, 1, 1)
+
+    return [
+        ExpenseRecord(
+            id=i + 1,
+            description=f"Expense {i}",
+            category=CATEGORIES[i % len(CATEGORIES)],
+            amount=((i * 7919) % 100000) / 100,
+            date=start + timedelta(minutes=i),
+            notes="Imported" if i % 2 else None,
+        )
+        for i in range(rows)
+    ]
+
+
+def run(rows: int) -> None:
+    expenses = make_expenses(rows)
+    services = {
+        "csv": PandasCSVService(),
+        "parquet": ArrowFileService("parquet"),
+        "arrow": ArrowFileService("arrow"),
+    }
+
+    print(f"\n{rows:,} rows        size (MB)   export (s)   import (s)")
+
+    with TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+
+        for name, service in services.items():
+            start = perf_counter()
+            service.export_expenses(expenses, directory, name)
+            exported = perf_counter() - start
+
+            file = directory / f"{name}.{name}"
+
+            start = perf_counter()
+            parsed = sum(len(batch) for batch in service.iter_import_batches(file))
+            imported = perf_counter() - start
+
+            assert parsed == rows
+            print(
+                f"  {name:<14} {file.stat().st_size / 1_000_000:10.2f}"
+                f"   {exported:10.3f}   {imported:10.3f}")
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    args = parser.parse_args()
+
+    for rows in args.rows or [100_000, 1_000_000]:
+        run(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Query latency of the repository read paths before and after the expense
+indexes are created, on SQLite databases of increasing size.
+
+    python benchmarks/bench_indexes.py --rows 10000 --rows 1000000 --rows 10000000
+
+Large sizes take a while to generate; databases are cached in --cache-dir.
+"""
+
+# pylint: disable=wrong-import-position
+
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from statistics import median
+from tempfile import gettempdir
+from time import perf_counter
+
+from kink import di
+
+di["db_url"] = "sqlite://"
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from expense_tracker.categories import CATEGORY_CACHE
+from expense_tracker.database import BASE
+from expense_tracker.migrations import upgrade
+from expense_tracker.models import Expense
+from expense_tracker.repositories import SQLAlchemyExpenseRepository
+
+CATEGORIES = [f"Category{i}" for i in range(40)]
+START = datetime(2015, 1, 1)
+
+
+def populate(engine, rows: int, batch_size: int = 50_000) -> None:
+    BASE.metadata.create_all(bind=engine)
+
+    with engine.begin() as connection:
+        for index in Expense.__table__.indexes:
+            connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+        category_ids = [CATEGORY_CACHE.id_for(connection, name) for name in CATEGORIES]
+
+        for offset in range(0, rows, batch_size):
+            connection.execute(
+                insert(Expense.__table__),
+                [
+                    {
+                        "description": f"Expense {i}",
+                        "category_id": category_ids[i % len(category_ids)],
+                        "amount": float(i % 500),
+                        "date": START + timedelta(minutes=7 * i),
+                    }
+                    for i in range(offset, min(offset + batch_size, rows))
+                ],
+            )
+
+
+def timed(query, repeat: int = 5) -> float:
+    samples = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        query()
+        samples.append(perf_counter() - start)
+
+    return median(samples) * 1000
+
+
+def measure(repo: SQLAlchemyExpenseRepository, last: datetime) -> dict[str, float]:
+    return {
+        "list(category)": timed(lambda: repo.list("Category7")),
+        "category_summary": timed(lambda: repo.category_summary("Category7")),
+        "monthly_summary": timed(
+            lambda: repo.monthly_summary(last.month, last.year)),
+    }
+
+
+def run(rows: int, cache_dir: Path) -> None:
+    path = cache_dir / f"expenses_{rows}.db"
+    engine = create_engine(f"sqlite:///{path}")
+
+    if not path.exists():
+        populate(engine, rows)
+
+    with engine.begin() as connection:
+        for index in Expense.__table__.indexes:
+            connection.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+    session_local = sessionmaker(bind=engine)
+
+    @contextmanager
+    def get_db():
+        with session_local() as db:
+            yield db
+
+    repo = SQLAlchemyExpenseRepository(get_db)
+    last = START + timedelta(minutes=7 * (rows - 1))
+
+    before = measure(repo, last)
+    upgrade(engine)
+    after = measure(repo, last)
+
+    print(f"\n{rows:,} rows (median ms)")
+    for name, latency in before.items():
+        print(f"  {name:<18} {latency:10.2f} -> {after[name]:10.2f}")
+
+    engine.dispose()
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    parser.add_argument("--cache-dir", type=Path, default=Path(gettempdir()))
+    args = parser.parse_args()
+    args.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    for rows in args.rows or [10_000, 1_000_000, 10_000_000]:
+        run(rows, args.cache_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Aggregation speed and accuracy of amounts stored as integer cents versus
+the old float column, on SQLite databases of increasing size.
+
+    python benchmarks/bench_money.py --rows 1000000 --rows 10000000
+
+Both tables hold the same amounts. Large sizes take a while to generate;
+databases are cached in --cache-dir.
+"""
+
+# pylint: disable=wrong-import-position
+# pylint: disable=not-callable
+
+from argparse import ArgumentParser
+from decimal import Decimal
+from pathlib import Path
+from statistics import median
+from tempfile import gettempdir
+from time import perf_counter
+
+from kink import di
+
+di["db_url"] = "sqlite://"
+
+from sqlalchemy import create_engine, func, select, text
+
+from expense_tracker.migrations import upgrade
+from expense_tracker.models import Expense
+
+# Cents are spread over 0.00–999.99 with 40 categories, dated over ~10 years.
+POPULATE = """
+INSERT INTO {table} (description, category_id, {column}, date)
+WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < {last})
+SELECT 'Expense', 1 + i % 40, {value},
+       datetime('2015-01-01', '+' || (i / 3000) || ' days')
+FROM n
+"""
+
+
+def populate(engine, rows: int) -> None:
+    upgrade(engine)
+
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE legacy_expenses ("
+            "id INTEGER PRIMARY KEY, description VARCHAR(100) NOT NULL, "
+            "category_id INTEGER, amount FLOAT NOT NULL, date DATETIME NOT NULL)"
+        ))
+        connection.execute(text(
+            "INSERT INTO categories (id, name) VALUES "
+            + ", ".join(f"({i + 1}, 'Category{i}')" for i in range(40))
+        ))
+
+        # Same indexes as `expenses`, so the planner treats both tables alike.
+        for index in Expense.__table__.indexes:
+            columns = ", ".join(column.name for column in index.columns)
+            connection.execute(text(
+                f"CREATE INDEX legacy_{index.name} ON legacy_expenses ({columns})"))
+
+        connection.execute(text(POPULATE.format(
+            table="expenses", column="amount_cents",
+            value="(i * 7919) % 100000", last=rows - 1)))
+        connection.execute(text(POPULATE.format(
+            table="legacy_expenses", column="amount",
+            value="((i * 7919) % 100000) / 100.0", last=rows - 1)))
+
+
+def timed(query, repeat: int = 5) -> tuple[float, object]:
+    samples = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        result = query()
+        samples.append(perf_counter() - start)
+
+    return median(samples) * 1000, result
+
+
+def run(rows: int, cache_dir: Path) -> None:
+    path = cache_dir / f"expenses_money_{rows}.db"
+    engine = create_engine(f"sqlite:///{path}")
+
+    if not path.exists():
+        populate(engine, rows)
+
+    with engine.connect() as connection:
+        def cents_total():
+            return connection.scalar(select(func.sum(Expense.amount)))
+
+        def float_total():
+            return connection.scalar(text("SELECT SUM(amount) FROM legacy_expenses"))
+
+        def cents_by_category():
+            return connection.execute(
+                select(Expense.category_id, func.sum(Expense.amount))
+                .group_by(Expense.category_id)).all()
+
+        def float_by_category():
+            return connection.execute(text(
+                "SELECT category_id, SUM(amount) FROM legacy_expenses "
+                "GROUP BY category_id")).all()
+
+        def decimal_resum():
+            # What callers had to do to get an exact total from the float column.
+            return sum(
+                (Decimal(str(amount)) for amount in connection.scalars(
+                    text("SELECT amount FROM legacy_expenses"))),
+                Decimal(0),
+            )
+
+        exact = Decimal(connection.scalar(text(
+            "SELECT SUM(amount_cents) FROM expenses"))) / 100
+
+        results = {
+            "SUM float": timed(float_total),
+            "SUM cents": timed(cents_total),
+            "GROUP BY float": timed(float_by_category),
+            "GROUP BY cents": timed(cents_by_category),
+            "Decimal re-sum": timed(decimal_resum, repeat=1),
+        }
+
+    print(f"\n{rows:,} rows (median ms, error against the exact total)")
+    for name, (latency, result) in results.items():
+        error = ""
+        if not isinstance(result, list):
+            error = f"{Decimal(str(result)) - exact:+}"
+        print(f"  {name:<16} {latency:10.2f}  {error}")
+
+    engine.dispose()
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    parser.add_argument("--cache-dir", type=Path, default=Path(gettempdir()))
+    args = parser.parse_args()
+    args.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    for rows in args.rows or [1_000_000, 10_000_000]:
+        run(rows, args.cache_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Wall time of `list` printing every expense with each --output format,
+with stdout redirected as in a pipe.
+
+    python benchmarks/bench_output.py --rows 10000 --rows 50000
+
+'rich' is the full table layout a pipe got before; the streamed formats
+write each row as it is read.
+"""
+
+# pylint: disable=wrong-import-position
+
+import os
+from argparse import ArgumentParser
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from kink import di
+
+TMP_DIR = TemporaryDirectory()
+di["db_url"] = f"sqlite:///{TMP_DIR.name}/bench.db"
+
+from sqlalchemy import delete
+
+from expense_tracker.commands.expenses import list_user_expenses
+from expense_tracker.commands.expenses.file_formats import FileFormat
+from expense_tracker.commands.expenses.output_formats import OutputFormat
+from expense_tracker.database import get_db, get_engine
+from expense_tracker.migrations import upgrade
+from expense_tracker.models import Expense, ExpenseRollup
+from expense_tracker.protocols import ExpenseRepository
+from expense_tracker.repositories import SQLAlchemyExpenseRepository
+
+
+def measure(output: OutputFormat) -> float:
+    with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+        start = perf_counter()
+        list_user_expenses(
+            category="", limit=None, after_id=None, page_size=100, export=False,
+            directory=Path.cwd(), filename="", file_format=FileFormat.CSV,
+            output=output,
+        )
+        return perf_counter() - start
+
+
+def run(rows: int) -> None:
+    repo = SQLAlchemyExpenseRepository(get_db)
+    di[ExpenseRepository] = repo
+    start = datetime(2020, 1, 1)
+
+    repo.bulk_insert(
+        {
+            "description": f"Expense {i}",
+            "category": f"Category {i % 20}",
+            "amount": float(i % 500),
+            "notes": "Imported",
+            "date": start + timedelta(minutes=i),
+        }
+        for i in range(rows)
+    )
+
+    print(f"\n{rows:,} rows")
+
+    for output in OutputFormat:
+        print(f"  {output.value:<6} {measure(output):8.3f}s")
+
+    with get_engine().begin() as connection:
+        connection.execute(delete(Expense.__table__))
+        connection.execute(delete(ExpenseRollup.__table__))
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    args = parser.parse_args()
+
+    upgrade(get_engine())
+
+    for rows in args.rows or [10_000, 50_000]:
+        run(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Peak memory and wall time of read paths returning `ExpenseRecord` rows
+from Core selects against the identity-mapped `Expense` entities they
+returned before, reading from a throwaway SQLite ledger.
+
+    python benchmarks/bench_read_rows.py --rows 100000 --rows 500000
+
+Peak memory is the tracemalloc high-water mark of each read alone; the
+listings are held until the read returns, as the commands hold them.
+"""
+
+# pylint: disable=wrong-import-position
+
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from kink import di
+
+TMP_DIR = TemporaryDirectory()
+di["db_url"] = f"sqlite:///{TMP_DIR.name}/bench.db"
+
+from sqlalchemy import delete, select
+
+from expense_tracker.database import get_db, get_engine
+from expense_tracker.migrations import upgrade
+from expense_tracker.models import Expense, ExpenseRollup
+from expense_tracker.periods import month_range
+from expense_tracker.repositories import SQLAlchemyExpenseRepository
+from expense_tracker.services import PandasCSVService
+
+START = datetime(2020, 1, 1)
+BATCH_SIZE = 1_000
+
+
+def orm_list() -> list[Expense]:
+    """How ``list`` read expenses before: one entity per row."""
+    with get_db() as db:
+        return db.scalars(select(Expense).order_by(Expense.id)).all()
+
+
+def orm_month(month: int, year: int) -> list[Expense]:
+    start, end = month_range(year, month)
+
+    with get_db() as db:
+        return db.scalars(
+            select(Expense)
+            .where(Expense.date >= start)
+            .where(Expense.date < end)
+            .order_by(Expense.date, Expense.id)
+        ).all()
+
+
+def orm_stream():
+    with get_db() as db:
+        yield from db.scalars(
+            select(Expense).order_by(Expense.id).execution_options(yield_per=BATCH_SIZE))
+
+
+def measure(read) -> tuple[float, float]:
+    tracemalloc.start()
+    start = perf_counter()
+    read()
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak / 2**20
+
+
+def run(rows: int, out_dir: Path) -> None:
+    repo = SQLAlchemyExpenseRepository(get_db)
+    service = PandasCSVService()
+
+    # Rows every minute, so the first month holds up to ~44,640 of them.
+    repo.bulk_insert(
+        {
+            "description": f"Expense {i}",
+            "category": f"Category {i % 20}",
+            "amount": float(i % 500),
+            "notes": "Imported",
+            "date": START + timedelta(minutes=i),
+        }
+        for i in range(rows)
+    )
+
+    cases = {
+        "list": (orm_list, repo.list),
+        "monthly_summary": (
+            lambda: orm_month(START.month, START.year),
+            lambda: repo.monthly_summary(START.month, START.year),
+        ),
+        "streaming csv export": (
+            lambda: service.export_expenses(orm_stream(), out_dir, "entities"),
+            lambda: service.export_expenses(
+                repo.iter_expenses(batch_size=BATCH_SIZE), out_dir, "records"),
+        ),
+    }
+
+    print(f"\n{rows:,} rows                    entities           records")
+
+    for name, (before, after) in cases.items():
+        results = [measure(before), measure(after)]
+        print(f"  {name:<22}" + "".join(
+            f" {elapsed:7.3f}s {peak:7.1f} MiB" for elapsed, peak in results))
+
+    with get_engine().begin() as connection:
+        connection.execute(delete(Expense.__table__))
+        connection.execute(delete(ExpenseRollup.__table__))
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    args = parser.parse_args()
+
+    upgrade(get_engine())
+
+    with TemporaryDirectory() as out_dir:
+        for rows in args.rows or [100_000, 500_000]:
+            run(rows, Path(out_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Per-call latency of ``add`` through the repository in-process, through a
+running server, and as a fresh ``expense-tracker add`` process with and
+without a server to talk to.
+
+    python benchmarks/bench_server.py --calls 2000 --processes 10
+"""
+
+# pylint: disable=wrong-import-position
+
+import subprocess
+import sys
+from argparse import ArgumentParser
+from datetime import datetime
+from os import environ
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import perf_counter
+
+from kink import di
+
+TMP_DIR = TemporaryDirectory()
+DB_URL = f"sqlite:///{TMP_DIR.name}/bench.db"
+SOCKET = f"{TMP_DIR.name}/bench.sock"
+di["db_url"] = DB_URL
+
+from expense_tracker.database import BASE, get_db, get_engine
+from expense_tracker.records import ExpenseRecord
+from expense_tracker.remote import RemoteExpenseRepository
+from expense_tracker.repositories import SQLAlchemyExpenseRepository
+from expense_tracker.server import ExpenseServer
+
+
+def timed(name: str, calls: int, case) -> None:
+    start = perf_counter()
+
+    for _ in range(calls):
+        case()
+
+    elapsed = perf_counter() - start
+    print(f"  {name:<28} {elapsed / calls * 1000:10.2f} ms/call")
+
+
+def cli_add(socket: str) -> None:
+    subprocess.run(
+        [sys.executable, "-m", "expense_tracker", "add", "Coffee", "3.5"],
+        env={**environ, "DATABASE_URL": DB_URL, "EXPENSE_TRACKER_SOCKET": socket},
+        capture_output=True,
+        check=True,
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1_000)
+    parser.add_argument("--processes", type=int, default=10)
+    args = parser.parse_args()
+
+    BASE.metadata.create_all(bind=get_engine())
+    local = SQLAlchemyExpenseRepository(get_db)
+    server = ExpenseServer(SOCKET, local)
+    Thread(target=server.serve_forever, daemon=True).start()
+    remote = RemoteExpenseRepository(SOCKET, fallback=lambda: local)
+
+    expense = ExpenseRecord(None, "Coffee", "Food", 3.5, datetime.now(), None)
+
+    print()
+    timed("add (in-process)", args.calls, lambda: local.add(expense))
+    timed("add (server)", args.calls, lambda: remote.add(expense))
+    timed("expense-tracker add", args.processes, lambda: cli_add(""))
+    timed("expense-tracker add (server)", args.processes, lambda: cli_add(SOCKET))
+
+    remote.close()
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main()
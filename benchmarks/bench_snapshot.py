@@ -0,0 +1,132 @@
+"""Read latency of the SQLite repository against a memory-mapped Arrow
+snapshot of the same expenses, on databases of increasing size.
+
+    python benchmarks/bench_snapshot.py --rows 1000000 --rows 5000000
+
+Large sizes take a while to generate; databases are cached in --cache-dir.
+Needs the arrow extras: pip install expense-tracker[arrow]
+"""
+
+# pylint: disable=wrong-import-position
+
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+from tempfile import gettempdir
+from time import perf_counter
+
+from kink import di
+
+di["db_url"] = "sqlite://"
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from expense_tracker.migrations import upgrade
+from expense_tracker.repositories import SQLAlchemyExpenseRepository
+from expense_tracker.repositories.snapshot import export_snapshot
+from expense_tracker.snapshot import SnapshotExpenseRepository
+
+CATEGORY_COUNT = 40
+
+# 40 categories, amounts up to 999.99, dated from 2015 at ~3000 a day.
+# Dates use SQLAlchemy's storage format so range filters compare alike.
+POPULATE = """
+INSERT INTO expenses (description, category_id, amount_cents, date)
+WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < {last})
+SELECT 'Expense', 1 + i % 40, (i * 7919) % 100000,
+       datetime('2015-01-01', '+' || (i / 3000) || ' days') || '.000000'
+FROM n
+"""
+
+
+def populate(engine, rows: int) -> None:
+    upgrade(engine)
+
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO categories (id, name) VALUES "
+            + ", ".join(f"({i + 1}, 'Category{i}')" for i in range(CATEGORY_COUNT))
+        ))
+        connection.execute(text(POPULATE.format(last=rows - 1)))
+
+    upgrade(engine)  # fills the rollups
+
+
+def timed(query, repeat: int = 5) -> float:
+    samples = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        query()
+        samples.append(perf_counter() - start)
+
+    return median(samples) * 1000
+
+
+def measure(repo, year: int) -> dict[str, float]:
+    return {
+        "list(category, 100)": timed(lambda: repo.list("Category7", limit=100)),
+        "category_summary": timed(lambda: repo.category_summary("Category7")),
+        "monthly_summary": timed(lambda: repo.monthly_summary(6, year)),
+        "period_totals(year)": timed(lambda: repo.period_totals(
+            datetime(year, 1, 1), datetime(year + 1, 1, 1))),
+    }
+
+
+def run(rows: int, cache_dir: Path) -> None:
+    path = cache_dir / f"expenses_snapshot_{rows}.db"
+    engine = create_engine(f"sqlite:///{path}")
+
+    if not path.exists():
+        populate(engine, rows)
+
+    session_local = sessionmaker(bind=engine)
+
+    @contextmanager
+    def get_db():
+        with session_local() as db:
+            yield db
+
+    snapshot_path = cache_dir / f"expenses_snapshot_{rows}.arrow"
+
+    start = perf_counter()
+    with get_db() as db:
+        export_snapshot(db, snapshot_path)
+    written = perf_counter() - start
+
+    start = perf_counter()
+    snapshot = SnapshotExpenseRepository(snapshot_path)
+    snapshot.table  # pylint: disable=pointless-statement
+    opened = perf_counter() - start
+
+    year = 2015 + rows // 3000 // 365 // 2
+    database = measure(SQLAlchemyExpenseRepository(get_db), year)
+    mapped = measure(snapshot, year)
+
+    print(
+        f"\n{rows:,} rows: snapshot written in {written:.1f}s "
+        f"({snapshot_path.stat().st_size / 1_000_000:.0f} MB), "
+        f"mapped in {opened * 1000:.1f} ms")
+    print("  (median ms)             sqlite    snapshot")
+    for name, latency in database.items():
+        print(f"  {name:<22} {latency:10.2f}  {mapped[name]:10.2f}")
+
+    engine.dispose()
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, action="append")
+    parser.add_argument("--cache-dir", type=Path, default=Path(gettempdir()))
+    args = parser.parse_args()
+    args.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    for rows in args.rows or [1_000_000, 5_000_000]:
+        run(rows, args.cache_dir)
+
+
+if __name__ == "__main__":
+    main()
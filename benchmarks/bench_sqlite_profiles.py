@@ -0,0 +1,83 @@
+"""Repository throughput under each SQLite profile in ``SQLITE_PROFILES``.
+
+Every profile gets a fresh database file. ``add`` commits once per row, so
+it shows the cost of the journal and sync settings most clearly.
+
+    python benchmarks/bench_sqlite_profiles.py --rows 100000 --adds 2000
+"""
+
+# pylint: disable=wrong-import-position
+
+from argparse import ArgumentParser
+from datetime import datetime, timedelta
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from kink import di
+
+TMP_DIR = TemporaryDirectory()
+di["db_url"] = f"sqlite:///{TMP_DIR.name}/bench.db"
+
+from expense_tracker.database import (
+    BASE, SQLITE_PROFILES, configure_database, get_db, get_engine
+)
+from expense_tracker.models import Expense
+from expense_tracker.repositories import SQLAlchemyExpenseRepository
+
+
+CATEGORIES = ["Food", "Transport", "Rent", "Utilities", "Leisure"]
+
+
+def make_expenses(rows: int) -> list[Expense]:
+    start = datetime(2024, 1, 1)
+    return [
+        Expense(
+            description=f"Expense {i}",
+            amount=float(i % 500),
+            category=CATEGORIES[i % len(CATEGORIES)],
+            date=start + timedelta(minutes=i),
+        )
+        for i in range(rows)
+    ]
+
+
+def timed(name: str, count: int, case) -> None:
+    start = perf_counter()
+    case()
+    elapsed = perf_counter() - start
+
+    print(f"  {name:<24} {elapsed:8.3f}s {count / elapsed:12,.0f} rows/s")
+
+
+def run(profile: str, rows: int, adds: int) -> None:
+    configure_database(
+        f"sqlite:///{TMP_DIR.name}/{profile}.db",
+        sqlite_pragmas=SQLITE_PROFILES[profile],
+    )
+    BASE.metadata.create_all(bind=get_engine())
+    repo = SQLAlchemyExpenseRepository(get_db)
+
+    print(f"\n{profile}")
+
+    timed("bulk_import", rows, lambda: repo.bulk_import(make_expenses(rows)))
+    timed(f"add x{adds:,}", adds, lambda: [
+        repo.add(expense) for expense in make_expenses(adds)])
+    timed("list", rows + adds, repo.list)
+    timed("list (Food)", (rows + adds) // len(CATEGORIES),
+          lambda: repo.list(category="Food"))
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--adds", type=int, default=1_000)
+    parser.add_argument(
+        "--profile", choices=list(SQLITE_PROFILES), action="append")
+    args = parser.parse_args()
+
+    for profile in args.profile or SQLITE_PROFILES:
+        run(profile, args.rows, args.adds)
+
+
+if __name__ == "__main__":
+    main()
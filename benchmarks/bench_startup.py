@@ -0,0 +1,78 @@
+"""CLI startup cost: ``python -X importtime`` breakdown of importing the
+entry point, plus wall time of ``expense-tracker --help`` and of one
+read command.
+
+    python benchmarks/bench_startup.py --runs 10 --top 15
+"""
+
+import subprocess
+import sys
+from argparse import ArgumentParser
+from statistics import median
+from time import perf_counter
+
+ENTRY_POINT = "from expense_tracker.__main__ import app"
+HEAVY_MODULES = ("pandas", "numpy", "sqlalchemy")
+
+
+def import_times() -> list[tuple[int, int, str]]:
+    """Return ``(self_us, cumulative_us, module)`` for every import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", ENTRY_POINT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = []
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line.split(":", 1)[1].split("|")
+        times.append((int(self_us), int(cumulative_us), module.strip()))
+
+    return times
+
+
+def wall_time(args: list[str], runs: int) -> float:
+    samples = []
+
+    for _ in range(runs):
+        start = perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "expense_tracker", *args],
+            capture_output=True,
+            check=True,
+        )
+        samples.append(perf_counter() - start)
+
+    return median(samples) * 1000
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    times = import_times()
+    total = next(c for _, c, module in times if module == "expense_tracker.cli")
+    loaded = {module for _, _, module in times}
+
+    print(f"import expense_tracker.cli: {total / 1000:.1f} ms cumulative")
+    print("heavy modules imported:",
+          ", ".join(m for m in HEAVY_MODULES if m in loaded) or "none")
+
+    print(f"\nslowest imports (self time, top {args.top})")
+    for self_us, _, module in sorted(times, reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  {module}")
+
+    print(f"\nwall time (median of {args.runs})")
+    print(f"  --help        {wall_time(['--help'], args.runs):8.1f} ms")
+    print(f"  summary       {wall_time(['summary'], args.runs):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
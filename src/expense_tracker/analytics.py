@@ -0,0 +1,216 @@
+"""Vectorized summaries over the expenses of a period.
+
+Repositories load the columns a report needs into NumPy arrays once
+(`ExpenseArrays`); every summary here is then a handful of array
+operations (`bincount`, `cumsum`, `sort`, `argpartition`) instead of
+a query or a loop per group. Amounts stay in integer cents throughout.
+"""
+
+from datetime import datetime
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .money import CENTS
+
+
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+class ExpenseArrays(NamedTuple):
+    """Columns of the expenses in a report, in (date, id) order.
+    `categories` holds codes into `names`; code 0 is uncategorised."""
+    ids: np.ndarray
+    cents: np.ndarray
+    dates: np.ndarray
+    categories: np.ndarray
+    names: tuple[Optional[str], ...]
+
+    @classmethod
+    def empty(cls) -> "ExpenseArrays":
+        return cls(
+            np.empty(0, np.int64),
+            np.empty(0, np.int64),
+            np.empty(0, "datetime64[us]"),
+            np.empty(0, np.int32),
+            (None,),
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+
+class GroupTotal(NamedTuple):
+    label: str
+    total: float
+    count: int
+    mean: float
+    share: float
+
+
+class MonthTotal(NamedTuple):
+    year: int
+    month: int
+    total: float
+    count: int
+    running_total: float
+
+
+class CategoryPercentiles(NamedTuple):
+    category: Optional[str]
+    count: int
+    values: tuple[float, ...]
+
+
+class TopExpense(NamedTuple):
+    id: int
+    amount: float
+    date: datetime
+    category: Optional[str]
+
+
+def _group_totals(
+    keys: np.ndarray,
+    cents: np.ndarray,
+    size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-key (cents, count) for integer keys in ``range(size)``. Sums go
+    through float64 weights, exact while a total stays under 2**53 cents."""
+    counts = np.bincount(keys, minlength=size)
+    totals = np.rint(np.bincount(keys, weights=cents, minlength=size)).astype(np.int64)
+    return totals, counts
+
+
+def _group_rows(
+    labels: Sequence[str],
+    totals: np.ndarray,
+    counts: np.ndarray,
+    grand_total: int,
+) -> list[GroupTotal]:
+    means = np.divide(totals, counts, out=np.zeros(len(totals)), where=counts > 0)
+    shares = totals / grand_total * 100 if grand_total else np.zeros(len(totals))
+
+    return [
+        GroupTotal(label, total / CENTS, count, mean / CENTS, share)
+        for label, total, count, mean, share in zip(
+            labels, totals.tolist(), counts.tolist(), means.tolist(), shares.tolist())
+    ]
+
+
+def total(arrays: ExpenseArrays) -> float:
+    return int(arrays.cents.sum()) / CENTS
+
+
+def by_category(arrays: ExpenseArrays) -> list[GroupTotal]:
+    """Totals per category with any expenses, largest first."""
+    totals, counts = _group_totals(arrays.categories, arrays.cents, len(arrays.names))
+    present = np.flatnonzero(counts)
+    present = present[np.argsort(-totals[present], kind="stable")]
+
+    return _group_rows(
+        [arrays.names[code] or "-" for code in present.tolist()],
+        totals[present],
+        counts[present],
+        int(arrays.cents.sum()),
+    )
+
+
+def by_weekday(arrays: ExpenseArrays) -> list[GroupTotal]:
+    """Totals per day of the week, Monday first."""
+    days = arrays.dates.astype("datetime64[D]").astype(np.int64)
+    weekdays = (days + 3) % 7  # 1970-01-01 was a Thursday
+    totals, counts = _group_totals(weekdays, arrays.cents, len(WEEKDAYS))
+
+    return _group_rows(WEEKDAYS, totals, counts, int(arrays.cents.sum()))
+
+
+def by_month(arrays: ExpenseArrays) -> list[MonthTotal]:
+    """Totals per calendar month with a running total, oldest first.
+    Months without expenses inside the range are included as zeros."""
+    if not arrays.size:
+        return []
+
+    months = arrays.dates.astype("datetime64[M]").astype(np.int64)
+    first = int(months.min())
+    totals, counts = _group_totals(
+        months - first, arrays.cents, int(months.max()) - first + 1)
+    running = np.cumsum(totals)
+
+    return [
+        MonthTotal(1970 + month // 12, month % 12 + 1, total / CENTS, count, run / CENTS)
+        for month, total, count, run in zip(
+            range(first, first + len(totals)),
+            totals.tolist(), counts.tolist(), running.tolist())
+    ]
+
+
+def percentiles(arrays: ExpenseArrays, quantiles: Sequence[float]) -> tuple[float, ...]:
+    """Percentiles (0–100) of single expense amounts."""
+    if not arrays.size:
+        return tuple(0.0 for _ in quantiles)
+
+    values = np.percentile(arrays.cents, quantiles)
+    return tuple((values / CENTS).tolist())
+
+
+def percentiles_by_category(
+    arrays: ExpenseArrays,
+    quantiles: Sequence[float],
+) -> list[CategoryPercentiles]:
+    """Percentiles of expense amounts within each category, by name.
+
+    One sort orders amounts inside every category at once: codes and
+    amounts are packed into a single int64 key, which sorts much faster
+    than a `lexsort` of the two. Each percentile is then read at its
+    interpolated position in each group, as `np.percentile` does with the
+    default linear method."""
+    if not arrays.size:
+        return []
+
+    lowest = int(arrays.cents.min())
+    shift = max(int(arrays.cents.max()) - lowest, 1).bit_length()
+
+    if len(arrays.names).bit_length() + shift > 62:
+        order = np.lexsort((arrays.cents, arrays.categories))
+        codes, cents = arrays.categories[order], arrays.cents[order]
+    else:
+        keys = (arrays.categories.astype(np.int64) << shift) | (arrays.cents - lowest)
+        keys.sort()
+        codes, cents = keys >> shift, (keys & ((1 << shift) - 1)) + lowest
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    counts = np.diff(np.r_[starts, len(codes)])
+
+    positions = starts[:, None] + (counts[:, None] - 1) * (np.asarray(quantiles) / 100)
+    low = np.floor(positions).astype(np.int64)
+    high = np.ceil(positions).astype(np.int64)
+    values = cents[low] + (cents[high] - cents[low]) * (positions - low)
+
+    rows = [
+        CategoryPercentiles(arrays.names[code], count, tuple(row))
+        for code, count, row in zip(
+            codes[starts].tolist(), counts.tolist(), (values / CENTS).tolist())
+    ]
+
+    return sorted(rows, key=lambda row: (row.category is not None, row.category or ""))
+
+
+def top_expenses(arrays: ExpenseArrays, count: int) -> list[TopExpense]:
+    """The ``count`` largest expenses, largest first."""
+    if count < 1 or not arrays.size:
+        return []
+
+    count = min(count, arrays.size)
+    largest = np.argpartition(arrays.cents, -count)[-count:]
+    largest = largest[np.lexsort((arrays.ids[largest], -arrays.cents[largest]))]
+
+    return [
+        TopExpense(
+            int(arrays.ids[i]),
+            int(arrays.cents[i]) / CENTS,
+            arrays.dates[i].astype(datetime),
+            arrays.names[arrays.categories[i]],
+        )
+        for i in largest.tolist()
+    ]
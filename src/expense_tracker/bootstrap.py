@@ -1,25 +1,130 @@
 # pylint: disable=import-outside-toplevel
-# pylint: disable=unused-import
+# pylint: disable=unnecessary-lambda
 
 from os import getenv, path
-from pathlib import Path
 from kink import di
 
+from .protocols import AsyncExpenseRepository, ExpenseRepository, ExpenseCSVService
+
+
+def _db_session_context():
+    from .database import DATABASE, get_db
+    from .migrations import ensure_schema
+
+    DATABASE.add_engine_hook(ensure_schema)
+    return get_db
+
+
+def _async_db_session_context():
+    from .database import DATABASE, get_async_db
+    from .migrations import ensure_schema
+
+    # The schema check is synchronous; run it once on the sync engine so
+    # the async engine only ever serves queries.
+    DATABASE.add_engine_hook(ensure_schema)
+    DATABASE.engine  # pylint: disable=pointless-statement
+    return get_async_db
+
+
+def _async_expense_repository():
+    from .repositories import AsyncSQLAlchemyExpenseRepository
+    return di[AsyncSQLAlchemyExpenseRepository]
+
+
+def _sql_alchemy_expense_repository():
+    from .repositories import SQLAlchemyExpenseRepository
+    return di[SQLAlchemyExpenseRepository]
+
+
+def local_expense_repository():
+    from .repositories import CachingExpenseRepository, SQLAlchemyExpenseRepository
+
+    repository = di[SQLAlchemyExpenseRepository]
+
+    if di["repository_cache_size"] > 0:
+        repository = CachingExpenseRepository(
+            repository, di["repository_cache_size"], di["repository_cache_ttl"])
+
+    return repository
+
+
+def _snapshot_repository(path: str):
+    try:
+        from .snapshot import SnapshotExpenseRepository
+    except ImportError as exc:
+        raise ImportError(
+            f"{exc}. Install the arrow extras: "
+            "pip install expense-tracker[arrow]") from exc
+
+    return SnapshotExpenseRepository(path)
+
+
+def _expense_repository():
+    from .remote import RemoteExpenseRepository, server_is_running
+
+    if di["snapshot_path"]:
+        return _snapshot_repository(di["snapshot_path"])
+
+    if server_is_running(di["server_socket"]):
+        # The fallback only answers uncached reads; the server caches.
+        return RemoteExpenseRepository(
+            di["server_socket"], fallback=_sql_alchemy_expense_repository)
+
+    return local_expense_repository()
+
+
+def _csv_service():
+    from .services import PandasCSVService
+    return di[PandasCSVService]
+
+
+def _arrow_file_service(file_format: str):
+    try:
+        from .services.arrow_file_service import ArrowFileService
+    except ImportError as exc:
+        raise ImportError(
+            f"{exc}. Install the arrow extras: "
+            "pip install expense-tracker[arrow]") from exc
+
+    return ArrowFileService(file_format)
+
 
 def initialize():
+    """Register the application services. Nothing heavy is imported and
+    nothing touches the filesystem here: SQLAlchemy, the engine, the schema
+    check and pandas are all set up on first use."""
     script_path = path.abspath(__file__)
     script_directory = path.dirname(script_path)
 
-    db_path = Path(script_directory + "/db")
-    db_path.mkdir(exist_ok=True)
+    if "db_url" not in di:
+        DEFAULT_DB_URL = f"sqlite:///{script_directory}/db/expenses_db.db"
+        di["db_url"] = getenv("DATABASE_URL", DEFAULT_DB_URL)
 
-    DEFAULT_DB_URL = f"sqlite:///{script_directory}/db/expenses_db.db"
-    di["db_url"] = getenv("DATABASE_URL", DEFAULT_DB_URL)
+    if "db_sqlite_profile" not in di:
+        di["db_sqlite_profile"] = getenv("DATABASE_SQLITE_PROFILE", "stock")
 
-    from .database import get_db, BASE, ENGINE
-    from .models import Expense
-    BASE.metadata.create_all(bind=ENGINE)
-    di["db_session_context"] = get_db
+    if "server_socket" not in di:
+        from .remote import default_socket_path
+        di["server_socket"] = getenv(
+            "EXPENSE_TRACKER_SOCKET", default_socket_path(di["db_url"]))
 
-    from .repositories import SQLAlchemyExpenseRepository
-    from .services import PandasCSVService
+    if "snapshot_path" not in di:
+        di["snapshot_path"] = getenv("EXPENSE_TRACKER_SNAPSHOT", "")
+
+    if "repository_cache_size" not in di:
+        di["repository_cache_size"] = int(getenv("EXPENSE_TRACKER_CACHE_SIZE", "0"))
+
+    if "repository_cache_ttl" not in di:
+        di["repository_cache_ttl"] = float(getenv("EXPENSE_TRACKER_CACHE_TTL", "60"))
+
+    if "db_session_context" not in di:
+        di["db_session_context"] = lambda _: _db_session_context()
+
+    if "async_db_session_context" not in di:
+        di["async_db_session_context"] = lambda _: _async_db_session_context()
+
+    di[ExpenseRepository] = lambda _: _expense_repository()
+    di[AsyncExpenseRepository] = lambda _: _async_expense_repository()
+    di[ExpenseCSVService] = lambda _: _csv_service()
+    di["parquet_file_service"] = lambda _: _arrow_file_service("parquet")
+    di["arrow_file_service"] = lambda _: _arrow_file_service("arrow")
@@ -0,0 +1,111 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    size: int
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: float
+    tag: Any
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire `ttl` seconds after
+    they are stored. Each entry carries a tag that `invalidate` can match on.
+
+    `generation` changes on every invalidation; pass the value read before
+    computing a result to `put` so a result computed concurrently with a
+    write is never stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError("`max_entries` must be an integer greater than 0.")
+
+        if ttl <= 0:
+            raise ValueError("`ttl` must be greater than 0.")
+
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = Lock()
+        self._generation = 0
+        self._hits = self._misses = self._evictions = 0
+        self._expirations = self._invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry.expires_at <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        tag: Any = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+
+            self._entries[key] = _Entry(value, self._clock() + self._ttl, tag)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, matches: Callable[[Any], bool]) -> int:
+        """Drop every entry whose tag satisfies `matches`."""
+        with self._lock:
+            self._generation += 1
+            stale = [key for key, entry in self._entries.items() if matches(entry.tag)]
+
+            for key in stale:
+                del self._entries[key]
+
+            self._invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        self.invalidate(lambda _: True)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions,
+                self._expirations, self._invalidations, len(self._entries),
+            )
@@ -0,0 +1,149 @@
+"""Category names live once in the `categories` table; expenses and rollups
+refer to them by integer id. Names are normalized on write, and the id of
+each name is cached in-process so writes rarely need a lookup."""
+
+from threading import Lock
+from typing import Any, Iterable, Mapping, Optional
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Connection, Engine, Insert, ScalarSelect, event, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .models import Category
+
+
+CATEGORIES = Category.__table__
+
+# Rollup key for expenses without a category.
+UNCATEGORISED = 0
+
+
+def normalize_category(category: str) -> str:
+    return category.lower().capitalize()
+
+
+def category_id_query(category: str) -> ScalarSelect:
+    """The id of ``category`` as a scalar subquery, so filters compare
+    integers without a separate lookup first."""
+    return (
+        select(CATEGORIES.c.id)
+        .where(CATEGORIES.c.name == normalize_category(category))
+        .scalar_subquery()
+    )
+
+
+class CategoryCache:
+    """Name to id map per engine. Categories are never renamed or deleted,
+    so committed entries stay valid. Ids created in a transaction are only
+    shared once it commits, so a rollback cannot leave a dangling id."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._ids: WeakKeyDictionary[Engine, dict[str, int]] = WeakKeyDictionary()
+        self._pending: WeakKeyDictionary[Connection, dict[str, int]] = WeakKeyDictionary()
+
+    def id_for(self, connection: Connection, category: Optional[str]) -> Optional[int]:
+        """Return the id of ``category``, creating it on first use."""
+        if not category:
+            return None
+
+        name = normalize_category(category)
+        ids = self._ids.get(connection.engine, {})
+
+        if (category_id := ids.get(name)) is not None:
+            return category_id
+
+        pending = self._pending.get(connection, {})
+
+        if (category_id := pending.get(name)) is not None:
+            return category_id
+
+        category_id = _select_category_id(connection, name)
+
+        if category_id is None:
+            if (category_id := _insert_category(connection, name)) is not None:
+                self._add_pending(connection, name, category_id)
+                return category_id
+
+            # Another writer created it between the lookup and the insert;
+            # its row is committed, so it is shared like any other.
+            category_id = _select_category_id(connection, name)
+
+        with self._lock:
+            self._ids.setdefault(connection.engine, {})[name] = category_id
+
+        return category_id
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+
+    def _add_pending(self, connection: Connection, name: str, category_id: int) -> None:
+        with self._lock:
+            self._pending.setdefault(connection, {})[name] = category_id
+
+            if not event.contains(connection, "commit", self._commit):
+                event.listen(connection, "commit", self._commit)
+                event.listen(connection, "rollback", self._rollback)
+
+    def _commit(self, connection: Connection) -> None:
+        with self._lock:
+            if created := self._pending.pop(connection, None):
+                self._ids.setdefault(connection.engine, {}).update(created)
+
+    def _rollback(self, connection: Connection) -> None:
+        with self._lock:
+            self._pending.pop(connection, None)
+
+
+def _select_category_id(connection: Connection, name: str) -> Optional[int]:
+    return connection.scalar(select(CATEGORIES.c.id).where(CATEGORIES.c.name == name))
+
+
+def _insert_category(connection: Connection, name: str) -> Optional[int]:
+    """Insert ``name`` and return its new id, or None when another writer
+    already created it."""
+    if (statement := _insert_category_if_missing(connection.dialect.name)) is not None:
+        result = connection.execute(statement.values(name=name))
+        return result.inserted_primary_key[0] if result.rowcount == 1 else None
+
+    # Fallback for dialects without an upsert we use.
+    try:
+        with connection.begin_nested():
+            return connection.execute(
+                insert(CATEGORIES).values(name=name)).inserted_primary_key[0]
+    except IntegrityError:
+        return None
+
+
+def _insert_category_if_missing(dialect: str) -> Optional[Insert]:
+    dialect_insert = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(dialect)
+
+    if dialect_insert is None:
+        return None
+
+    return dialect_insert(CATEGORIES).on_conflict_do_nothing(index_elements=[CATEGORIES.c.name])
+
+
+CATEGORY_CACHE = CategoryCache()
+
+
+def with_category_id(db: Session, values: Mapping[str, Any]) -> dict[str, Any]:
+    """Replace the "category" name in ``values`` with its "category_id"."""
+    values = dict(values)
+
+    if "category" in values:
+        values["category_id"] = CATEGORY_CACHE.id_for(
+            db.connection(), values.pop("category"))
+
+    return values
+
+
+def with_category_ids(
+    db: Session,
+    rows: Iterable[Mapping[str, Any]],
+) -> list[dict[str, Any]]:
+    return [with_category_id(db, row) for row in rows]
+
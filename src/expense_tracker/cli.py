@@ -1,12 +1,21 @@
 # pylint: disable=import-outside-toplevel
 
+from functools import cache
+
 from .bootstrap import initialize
 
 
+@cache
 def create_app():
     initialize()
     from .commands import expenses
     return expenses.app
 
 
-app = create_app()
+def __getattr__(name: str):
+    # Importing this module must not configure the container; the app is
+    # built on first access, as the entry point in __main__ does.
+    if name == "app":
+        return create_app()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
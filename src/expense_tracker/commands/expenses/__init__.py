@@ -1,6 +1,11 @@
 from .add_expenses import add_expense
 from .delete_expenses import delete_expense
 from .list_expenses import list_user_expenses
-from .summarize_expenses import monthly_summary, summarize_user_expenses
+from .summarize_expenses import monthly_summary, period_summary, summarize_user_expenses
+from .recategorize_expenses import recategorize_expenses
+from .report_expenses import expense_report
+from .rollup_expenses import rebuild_rollups
+from .serve_expenses import serve
+from .snapshot_expenses import snapshot
 from .update_expenses import update_expense
 from .command_router import app
@@ -1,17 +1,25 @@
 # pylint: disable=not-callable
+# pylint: disable=import-outside-toplevel
 
+from enum import Enum
+from contextlib import closing
+from functools import partial
+from glob import glob
+from os import cpu_count
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Optional
 from datetime import datetime
+from time import perf_counter, time
 
 from kink import di
 from typer import Argument, Option, Exit
 from rich import print as rich_print
 
-from ...models import Expense
-from ...protocols import ExpenseRepository, ExpenseCSVService
+from ...protocols import ExpenseRepository
+from ...records import ExpenseRecord
 
 from .command_router import app
+from .file_formats import FILE_FORMAT, FileFormat, file_service
 
 
 EXPENSE_DESCRIPTION = Annotated[
@@ -47,10 +55,62 @@ EXPENSE_NOTES = Annotated[
     )
 ]
 
-BULK_FILE_PATH = Annotated[
-    Path,
+BULK_FILE_PATHS = Annotated[
+    list[Path],
     Argument(
-        help="Path to CSV file for bulk import."
+        help=(
+            "Files for bulk import. Directories import every file of the "
+            "--format they contain and glob patterns are expanded."
+        )
+    )
+]
+
+
+class ImportEngine(str, Enum):
+    ORM = "orm"
+    COLUMNAR = "columnar"
+
+
+IMPORT_ENGINE = Annotated[
+    ImportEngine,
+    Option(
+        "--engine",
+        help=(
+            "Import engine. 'columnar' streams the file in vectorized chunks "
+            "into batched Core INSERT statements, 'orm' parses the whole "
+            "file into Expense objects before saving them."
+        ),
+    )
+]
+
+CHUNK_SIZE = Annotated[
+    int,
+    Option(
+        "--chunk-size",
+        help="Rows per chunk read by the columnar engine.",
+        min=1
+    )
+]
+
+WORKERS = Annotated[
+    Optional[int],
+    Option(
+        "--workers",
+        "-w",
+        help=(
+            "Processes used to parse files with the columnar engine. "
+            "Defaults to one per file, up to the number of CPUs."
+        ),
+        min=1
+    )
+]
+
+BATCH_SIZE = Annotated[
+    int,
+    Option(
+        "--batch-size",
+        help="Rows per INSERT batch (and transaction) for the columnar engine.",
+        min=1
     )
 ]
 
@@ -65,7 +125,8 @@ def add_expense(
     """Add a single expense."""
     repo: ExpenseRepository = di[ExpenseRepository]
 
-    expense = Expense(
+    expense = ExpenseRecord(
+        id=None,
         description=description,
         amount=amount,
         category=category,
@@ -77,18 +138,135 @@ def add_expense(
     rich_print(f"\n[green]Expense added with ID {created_id}[/green]\n")
 
 
+# Characters that make an import path a glob pattern.
+GLOB_CHARACTERS = frozenset("*?[")
+
+
+def expand_import_paths(paths: list[Path], suffix: str = "csv") -> list[Path]:
+    files: dict[Path, None] = {}
+
+    for path in paths:
+        if path.is_dir():
+            matches = sorted(path.glob(f"*.{suffix}"))
+        elif not GLOB_CHARACTERS.isdisjoint(str(path)):
+            matches = sorted(Path(match) for match in glob(str(path)))
+        else:
+            matches = [path]
+
+        if not matches:
+            raise FileNotFoundError(
+                f"No {suffix.upper()} files found at {path}.")
+
+        files.update(dict.fromkeys(matches))
+
+    return list(files)
+
+
 @app.command("bulk")
-def bulk_import(file: BULK_FILE_PATH):
-    """Import multiple expenses from a CSV file."""
+def bulk_import(
+    files: BULK_FILE_PATHS,
+    engine: IMPORT_ENGINE = ImportEngine.COLUMNAR,
+    chunk_size: CHUNK_SIZE = 50_000,
+    batch_size: BATCH_SIZE = 5_000,
+    workers: WORKERS = None,
+    file_format: FILE_FORMAT = FileFormat.CSV,
+):
+    """Import expenses from one or more CSV, Parquet or Arrow files.
+
+    Each batch is committed as it is written, so a file that fails part
+    way keeps the batches before the failure; the report counts them."""
     repo: ExpenseRepository = di[ExpenseRepository]
-    csv_service: ExpenseCSVService = di[ExpenseCSVService]
+    import_service = file_service(file_format)
 
     try:
-        expenses = csv_service.import_expenses(file)
-    except (FileNotFoundError, ValueError, Exception) as exc:
+        files = expand_import_paths(files, file_format.value)
+    except FileNotFoundError as exc:
         rich_print(f"\n[red]{exc}[/red]\n")
         raise Exit(code=2)
 
-    added_count = repo.bulk_import(expenses)
-    rich_print(
-        f"\n[green]{added_count} expenses added from {file.name}[/green]\n")
+    started = perf_counter()
+    results: dict[Path, tuple[int, float]] = {}
+    failures: dict[Path, BaseException] = {}
+    file_counts = dict.fromkeys(files, 0)
+
+    if engine is ImportEngine.COLUMNAR:
+        from ...pipeline import parse_files
+        from .progress import import_progress
+
+        workers = workers or min(len(files), cpu_count() or 1)
+        parse = partial(import_service.iter_import_batches, chunksize=chunk_size)
+
+        try:
+            # Closed explicitly so the worker pool is shut down before a
+            # failure is reported.
+            with import_progress() as progress, \
+                    closing(parse_files(parse, files, workers)) as batches:
+                tasks = {
+                    file: progress.add_task(f"Importing {file.name}", total=None)
+                    for file in files
+                }
+
+                for batch in batches:
+                    file = batch.file
+
+                    if batch.error is not None:
+                        failures[file] = batch.error
+                    elif batch.rows is None:
+                        # From when a worker started parsing the file, so its
+                        # parse time and any wait for the writer are counted.
+                        elapsed = time() - batch.started
+                        results[file] = (file_counts[file], elapsed)
+                    else:
+                        file_counts[file] += repo.bulk_insert(batch.rows, batch_size)
+                        progress.update(tasks[file], completed=file_counts[file])
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            rich_print(f"\n[red]{exc}[/red]")
+
+            for file, added_count in file_counts.items():
+                if file not in results and added_count:
+                    rich_print(f"[yellow]{file.name}: {_partial(added_count)}[/yellow]")
+
+            rich_print("")
+            raise Exit(code=2)
+    else:
+        for file in files:
+            file_started = perf_counter()
+
+            try:
+                added_count = repo.bulk_import(import_service.import_expenses(file))
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                failures[file] = exc
+                continue
+
+            results[file] = (added_count, perf_counter() - file_started)
+
+    for file, exc in failures.items():
+        rich_print(f"\n[red]{file.name}: {exc}[/red]")
+
+        if added_count := file_counts[file]:
+            rich_print(f"[yellow]{file.name}: {_partial(added_count)}[/yellow]")
+
+    for file, (added_count, elapsed) in results.items():
+        rich_print(
+            f"\n[green]{added_count} expenses added from {file.name}[/green] "
+            f"[dim]({_rate(added_count, elapsed)})[/dim]")
+
+    if len(files) > 1:
+        total = sum(added_count for added_count, _ in results.values())
+        rich_print(
+            f"\n[bold green]{total} expenses added from {len(results)} of "
+            f"{len(files)} files[/bold green] "
+            f"[dim]({_rate(total, perf_counter() - started)})[/dim]")
+
+    rich_print("")
+
+    if failures:
+        raise Exit(code=2)
+
+
+def _partial(count: int) -> str:
+    return f"{count} expenses from batches before the failure were added"
+
+
+def _rate(count: int, elapsed: float) -> str:
+    return f"{count / elapsed if elapsed else 0.0:,.0f} rows/s"
@@ -1,3 +1,23 @@
-from typer import Typer
+from typing import Any
 
-app = Typer(name="expense-tracker")
+from click import Context
+from typer import Exit, Typer
+from typer.core import TyperGroup
+from rich import print as rich_print
+
+from ...errors import SnapshotError
+
+
+class ExpenseTrackerGroup(TyperGroup):
+    """Reports snapshot errors from any command, such as a write while
+    EXPENSE_TRACKER_SNAPSHOT is set, as a message and exit code 2."""
+
+    def invoke(self, ctx: Context) -> Any:
+        try:
+            return super().invoke(ctx)
+        except SnapshotError as exc:
+            rich_print(f"\n[red]{exc}[/red]\n")
+            raise Exit(code=2)
+
+
+app = Typer(name="expense-tracker", cls=ExpenseTrackerGroup)
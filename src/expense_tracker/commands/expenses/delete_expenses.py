@@ -1,31 +1,61 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
 from kink import di
 from typer import Argument, Exit
 from rich import print as rich_print
 
 from ...protocols import ExpenseRepository
+from ...records import ExpenseFilter
 from .command_router import app
+from .expense_filters import (
+    FILTER_CATEGORY, FILTER_DESCRIPTION, FILTER_END, FILTER_MONTH,
+    FILTER_START, FILTER_YEAR, build_expense_filter
+)
 
 
-EXPENSE_ID = Annotated[
-    int,
+EXPENSE_IDS = Annotated[
+    Optional[list[int]],
     Argument(
-        help="The ID of the expense.",
+        help="IDs of the expenses to delete.",
         min=1
     )
 ]
 
 
 @app.command("delete")
-def delete_expense(expense_id: EXPENSE_ID):
-    """Delete an expense."""
+def delete_expense(
+    expense_ids: EXPENSE_IDS = None,
+    category: FILTER_CATEGORY = None,
+    month: FILTER_MONTH = None,
+    year: FILTER_YEAR = None,
+    start: FILTER_START = None,
+    end: FILTER_END = None,
+    description: FILTER_DESCRIPTION = None,
+):
+    """Delete expenses by ID, or every expense matching the filters in a
+    single statement."""
     repo: ExpenseRepository = di[ExpenseRepository]
 
-    expense = repo.get(expense_id)
-    if expense is None:
-        rich_print(f"\n[red]Expense {expense_id} not found[/red]\n")
+    try:
+        expense_filter = build_expense_filter(
+            expense_ids, category, month, year, start, end, description)
+    except ValueError as exc:
+        rich_print(f"\n[red]{exc}[/red]\n")
         raise Exit(code=2)
 
-    repo.delete(expense)
-    rich_print(f"\n[green]Expense {expense_id} succesfully deleted[/green]")
+    if not any(value is not None for value in expense_filter):
+        rich_print("\n[red]Pass expense IDs or at least one filter[/red]\n")
+        raise Exit(code=2)
+
+    if len(expense_ids or []) == 1 and expense_filter._replace(ids=None) == ExpenseFilter():
+        expense_id = expense_ids[0]
+
+        if repo.delete_by_id(expense_id) is None:
+            rich_print(f"\n[red]Expense {expense_id} not found[/red]\n")
+            raise Exit(code=2)
+
+        rich_print(f"\n[green]Expense {expense_id} succesfully deleted[/green]")
+        return
+
+    deleted_count = repo.delete_many(expense_filter)
+    rich_print(f"\n[green]{deleted_count} expenses deleted[/green]\n")
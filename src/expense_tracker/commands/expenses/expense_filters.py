@@ -0,0 +1,94 @@
+from datetime import date, datetime, timedelta
+from typing import Annotated, Optional, Sequence
+
+from typer import Option
+
+from ...periods import month_range, year_range
+from ...records import ExpenseFilter
+
+
+FILTER_CATEGORY = Annotated[
+    Optional[str],
+    Option(
+        "--category",
+        "-c",
+        help="Only expenses in this category."
+    ),
+]
+
+FILTER_MONTH = Annotated[
+    Optional[int],
+    Option(
+        "--month",
+        "-m",
+        help="Only expenses in this month (1–12) of --year.",
+        min=1,
+        max=12
+    ),
+]
+
+FILTER_YEAR = Annotated[
+    Optional[int],
+    Option(
+        "--year",
+        "-y",
+        help="Only expenses in this year. Defaults to the current year with --month.",
+    ),
+]
+
+FILTER_START = Annotated[
+    Optional[datetime],
+    Option(
+        "--start",
+        formats=["%Y-%m-%d"],
+        help="Only expenses on or after this day.",
+    ),
+]
+
+FILTER_END = Annotated[
+    Optional[datetime],
+    Option(
+        "--end",
+        formats=["%Y-%m-%d"],
+        help="Only expenses on or before this day.",
+    ),
+]
+
+FILTER_DESCRIPTION = Annotated[
+    Optional[str],
+    Option(
+        "--description",
+        "-d",
+        help="Only expenses whose description matches this LIKE pattern, e.g. 'Uber%'.",
+    ),
+]
+
+
+def build_expense_filter(
+    ids: Optional[Sequence[int]] = None,
+    category: Optional[str] = None,
+    month: Optional[int] = None,
+    year: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    description: Optional[str] = None,
+) -> ExpenseFilter:
+    """Turn the filter options into an `ExpenseFilter`. Raises ValueError
+    when the options conflict."""
+    if (month is not None or year is not None) and (start or end):
+        raise ValueError("Use either --month/--year or --start/--end, not both.")
+
+    if month is not None:
+        start, end = month_range(year or date.today().year, month)
+    elif year is not None:
+        start, end = year_range(year)
+    elif end is not None:
+        end = end + timedelta(days=1)  # --end is inclusive
+
+    return ExpenseFilter(
+        ids=list(ids) if ids else None,
+        category=category,
+        start=start,
+        end=end,
+        description=description,
+    )
@@ -0,0 +1,40 @@
+from enum import Enum
+from typing import Annotated
+
+from kink import di
+from typer import Option, Exit
+from rich import print as rich_print
+from rich.markup import escape
+
+from ...protocols import ExpenseCSVService
+
+
+class FileFormat(str, Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+    ARROW = "arrow"
+
+
+FILE_FORMAT = Annotated[
+    FileFormat,
+    Option(
+        "--format",
+        help=(
+            "File format. 'parquet' and 'arrow' keep typed columns and need "
+            "the arrow extras: pip install expense-tracker[arrow]."
+        ),
+    ),
+]
+
+
+def file_service(file_format: FileFormat) -> ExpenseCSVService:
+    """The import/export service for ``file_format``. Parquet and Arrow IPC
+    share the `ExpenseCSVService` interface, so commands use either."""
+    if file_format is FileFormat.CSV:
+        return di[ExpenseCSVService]
+
+    try:
+        return di[f"{file_format.value}_file_service"]
+    except ImportError as exc:
+        rich_print(f"\n[red]{escape(str(exc))}[/red]\n")
+        raise Exit(code=2)
@@ -1,13 +1,21 @@
+from itertools import chain, islice
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Iterator, Optional, Sequence
 
 from kink import di
-from typer import Option, Exit
+from typer import Option
 from rich import print as rich_print
 from rich.table import Table
 
-from ...protocols import ExpenseRepository, ExpenseCSVService
+from ...protocols import ExpenseRepository
 from .command_router import app
+from .file_formats import FILE_FORMAT, FileFormat, file_service
+from .output_formats import (
+    OUTPUT_FORMAT, OutputFormat, notice, preview_rows, write_expenses
+)
+
+if TYPE_CHECKING:
+    from ...records import ExpenseRecord
 
 
 CATEGORY_FILTER = Annotated[
@@ -19,12 +27,40 @@ CATEGORY_FILTER = Annotated[
     ),
 ]
 
+LIMIT = Annotated[
+    Optional[int],
+    Option(
+        "--limit",
+        "-l",
+        help="Maximum number of expenses to show.",
+        min=1
+    ),
+]
+
+AFTER_ID = Annotated[
+    Optional[int],
+    Option(
+        "--after-id",
+        help="Only show expenses with an ID greater than this one.",
+        min=0
+    ),
+]
+
+PAGE_SIZE = Annotated[
+    int,
+    Option(
+        "--page-size",
+        help="Rows fetched and rendered per table page.",
+        min=1
+    ),
+]
+
 EXPORT_DIR = Annotated[
     Path,
     Option(
         "--directory",
         "-d",
-        help="Directory for CSV export."
+        help="Directory for the exported file."
     ),
 ]
 
@@ -42,32 +78,21 @@ EXPORT_FLAG = Annotated[
     Option(
         "--export",
         "-e",
-        help="Whether to export results to a CSV file."
+        help="Export the expenses to a file (see --format) instead of printing them."
     ),
 ]
 
 
-@app.command("list")
-def list_user_expenses(
-    category: CATEGORY_FILTER = "",
-    export: EXPORT_FLAG = False,
-    directory: EXPORT_DIR = Path.cwd(),
-    filename: EXPORT_FILENAME = "",
-):
-    """List all expenses, optionally filtered by category."""
-    repo: ExpenseRepository = di[ExpenseRepository]
-    csv_service: ExpenseCSVService = di[ExpenseCSVService]
-
-    expenses = repo.list(category or None)
-    if not expenses:
-        rich_print("\n[yellow]No expenses found[/yellow]\n")
-        return
+def iter_pages(
+    expenses: Iterator["ExpenseRecord"],
+    page_size: int
+) -> Iterator[Sequence["ExpenseRecord"]]:
+    while page := list(islice(expenses, page_size)):
+        yield page
 
-    if export:
-        csv_service.export_expenses(expenses, directory, filename or None)
-        rich_print("\n[green]Expenses exported successfully[/green]\n")
 
-    table = Table(title="Expenses", show_lines=True)
+def expenses_page_table(expenses: Sequence["ExpenseRecord"], title: str = "") -> Table:
+    table = Table(title=title or None, show_lines=True)
     table.add_column("ID", justify="right", style="cyan")
     table.add_column("Description", style="bold white")
     table.add_column("Category", style="magenta")
@@ -85,6 +110,68 @@ def list_user_expenses(
             e.notes or "-",
         )
 
-    rich_print("")
-    rich_print(table)
-    rich_print("")
+    return table
+
+
+def print_pages(expenses: Iterator["ExpenseRecord"], page_size: int) -> "ExpenseRecord":
+    """Print expenses as one rich table per page and return the last one."""
+    title, last = "Expenses", None
+
+    for page in iter_pages(expenses, page_size):
+        rich_print(expenses_page_table(page, title=title))
+        title, last = "", page[-1]
+
+    return last
+
+
+@app.command("list")
+def list_user_expenses(
+    category: CATEGORY_FILTER = "",
+    limit: LIMIT = None,
+    after_id: AFTER_ID = None,
+    page_size: PAGE_SIZE = 100,
+    export: EXPORT_FLAG = False,
+    directory: EXPORT_DIR = Path.cwd(),
+    filename: EXPORT_FILENAME = "",
+    file_format: FILE_FORMAT = FileFormat.CSV,
+    output: OUTPUT_FORMAT = OutputFormat.RICH,
+):
+    """List expenses page by page, optionally filtered by category."""
+    repo: ExpenseRepository = di[ExpenseRepository]
+
+    expenses = repo.iter_expenses(
+        category or None, limit, after_id, batch_size=page_size)
+
+    if (first := next(expenses, None)) is None:
+        notice(output, "\n[yellow]No expenses found[/yellow]\n")
+        return
+
+    expenses = chain([first], expenses)
+
+    if export:
+        # Exported from the stream already open, so the ledger is read once.
+        file_service(file_format).export_expenses(expenses, directory, filename or None)
+        notice(output, "\n[green]Expenses exported successfully[/green]\n")
+        return
+
+    max_rows = preview_rows(output)
+
+    if output is OutputFormat.RICH:
+        rich_print("")
+        last_id = print_pages(islice(expenses, max_rows), page_size).id
+        rich_print("")
+    else:
+        last_id = write_expenses(expenses, output).id
+
+    truncated = max_rows is not None and next(expenses, None) is not None
+
+    if truncated:
+        notice(output, (
+            f"[dim]Showing the first {max_rows} expenses. "
+            "Use --output plain, tsv or jsonl to stream all of them.[/dim]"
+        ))
+
+    if truncated or (
+        limit is not None and repo.list(category or None, limit=1, after_id=last_id)
+    ):
+        notice(output, f"[dim]More expenses available: use --after-id {last_id}[/dim]\n")
@@ -0,0 +1,124 @@
+import csv
+import json
+import sys
+from enum import Enum
+from typing import Annotated, Any, Callable, Iterable, Optional
+
+from typer import Option
+from rich import print as rich_print
+
+from ...records import ExpenseRecord, PeriodTotals
+
+
+class OutputFormat(str, Enum):
+    RICH = "rich"
+    PLAIN = "plain"
+    TSV = "tsv"
+    JSONL = "jsonl"
+
+
+# Rows drawn as a rich table when stdout is a terminal. Laying out a
+# table costs far more per row than the query that fetched it.
+PREVIEW_ROWS = 200
+
+OUTPUT_FORMAT = Annotated[
+    OutputFormat,
+    Option(
+        "--output",
+        "-o",
+        help=(
+            "How expenses are printed. 'rich' draws tables, showing at most "
+            f"{PREVIEW_ROWS} rows on a terminal; 'plain', 'tsv' and 'jsonl' stream "
+            "every row as it is read and suit pipes."
+        ),
+    ),
+]
+
+EXPENSE_FIELDS = ("id", "description", "category", "amount", "date", "notes")
+TOTAL_FIELDS = ("category", "entries", "total")
+
+PLAIN_EXPENSE = "{:>8}  {:<10}  {:>12}  {:<20}  {}"
+PLAIN_TOTAL = "{:<20}  {:>8}  {:>12}"
+
+
+def stdout_is_terminal() -> bool:
+    return sys.stdout.isatty()
+
+
+def preview_rows(output: OutputFormat) -> Optional[int]:
+    """How many rows a rich table may show, or None for all of them."""
+    if output is OutputFormat.RICH and stdout_is_terminal():
+        return PREVIEW_ROWS
+
+    return None
+
+
+def notice(output: OutputFormat, message: str) -> None:
+    """Print a status message. Streamed formats keep stdout for rows, so
+    their messages go to stderr."""
+    if output is OutputFormat.RICH:
+        rich_print(message)
+    else:
+        rich_print(message, file=sys.stderr)
+
+
+def write_expenses(
+    expenses: Iterable[ExpenseRecord],
+    output: OutputFormat,
+) -> Optional[ExpenseRecord]:
+    """Write expenses to stdout in a streamed ``output`` format, one line
+    each as they are read, and return the last one written."""
+    write = _line_writer(
+        output,
+        EXPENSE_FIELDS,
+        PLAIN_EXPENSE.format("ID", "Date", "Amount", "Category", "Description"),
+    )
+    last = None
+
+    for last in expenses:
+        if output is OutputFormat.PLAIN:
+            line = PLAIN_EXPENSE.format(
+                last.id, f"{last.date:%Y-%m-%d}", f"{last.amount:.2f}",
+                last.category or "-", last.description)
+            write(f"{line}  {last.notes}" if last.notes else line)
+        else:
+            write((
+                last.id, last.description, last.category, last.amount,
+                last.date.isoformat(sep=" "), last.notes,
+            ))
+
+    return last
+
+
+def write_totals(totals: PeriodTotals, output: OutputFormat) -> None:
+    """Write per-category totals to stdout, one line each."""
+    write = _line_writer(
+        output, TOTAL_FIELDS, PLAIN_TOTAL.format("Category", "Entries", "Total"))
+
+    for category, total, count in totals.categories:
+        if output is OutputFormat.PLAIN:
+            write(PLAIN_TOTAL.format(category or "-", count, f"{total:.2f}"))
+        else:
+            write((category, count, total))
+
+
+def _line_writer(
+    output: OutputFormat,
+    fields: tuple[str, ...],
+    plain_header: str,
+) -> Callable[[Any], None]:
+    """Write the header for ``output`` and return a function writing one
+    row: a formatted line for plain output, a tuple of ``fields`` values
+    otherwise."""
+    out = sys.stdout
+
+    if output is OutputFormat.TSV:
+        writer = csv.writer(out, delimiter="\t", lineterminator="\n")
+        writer.writerow(fields)
+        return lambda row: writer.writerow(["" if v is None else v for v in row])
+
+    if output is OutputFormat.JSONL:
+        return lambda row: out.write(json.dumps(dict(zip(fields, row))) + "\n")
+
+    out.write(plain_header + "\n")
+    return lambda line: out.write(line + "\n")
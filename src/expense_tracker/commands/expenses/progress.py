@@ -0,0 +1,20 @@
+from rich.progress import (
+    Progress, ProgressColumn, SpinnerColumn, Task, TextColumn, TimeElapsedColumn
+)
+from rich.text import Text
+
+
+class RowRateColumn(ProgressColumn):
+    def render(self, task: Task) -> Text:
+        return Text(f"{task.speed or 0:,.0f} rows/s", style="progress.data.speed")
+
+
+def import_progress() -> Progress:
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        TextColumn("{task.completed:,.0f} rows"),
+        RowRateColumn(),
+        TimeElapsedColumn(),
+        transient=True,
+    )
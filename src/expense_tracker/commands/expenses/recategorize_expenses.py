@@ -0,0 +1,60 @@
+from typing import Annotated, Optional
+
+from kink import di
+from typer import Argument, Option, Exit
+from rich import print as rich_print
+
+from ...protocols import ExpenseRepository
+from .command_router import app
+from .expense_filters import (
+    FILTER_CATEGORY, FILTER_DESCRIPTION, FILTER_END, FILTER_MONTH,
+    FILTER_START, FILTER_YEAR, build_expense_filter
+)
+
+
+NEW_CATEGORY = Annotated[
+    str,
+    Argument(
+        help="Category to move the matching expenses to."
+    )
+]
+
+EXPENSE_IDS = Annotated[
+    Optional[list[int]],
+    Option(
+        "--id",
+        help="Only these expense IDs. Repeat for several.",
+        min=1
+    )
+]
+
+
+@app.command("recategorize")
+def recategorize_expenses(
+    new_category: NEW_CATEGORY,
+    expense_ids: EXPENSE_IDS = None,
+    category: FILTER_CATEGORY = None,
+    month: FILTER_MONTH = None,
+    year: FILTER_YEAR = None,
+    start: FILTER_START = None,
+    end: FILTER_END = None,
+    description: FILTER_DESCRIPTION = None,
+):
+    """Move every expense matching the filters to another category in a
+    single statement."""
+    repo: ExpenseRepository = di[ExpenseRepository]
+
+    try:
+        expense_filter = build_expense_filter(
+            expense_ids, category, month, year, start, end, description)
+    except ValueError as exc:
+        rich_print(f"\n[red]{exc}[/red]\n")
+        raise Exit(code=2)
+
+    if not any(value is not None for value in expense_filter):
+        rich_print("\n[red]Pass at least one filter[/red]\n")
+        raise Exit(code=2)
+
+    updated_count = repo.update_many(expense_filter, {"category": new_category})
+    rich_print(
+        f"\n[green]{updated_count} expenses recategorized as {new_category}[/green]\n")
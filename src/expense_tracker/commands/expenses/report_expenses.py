@@ -0,0 +1,190 @@
+# pylint: disable=import-outside-toplevel
+
+from typing import TYPE_CHECKING, Annotated, Optional, Sequence
+
+from kink import di
+from typer import Option, Exit
+from rich import print as rich_print
+from rich.table import Table
+
+from ...protocols import ExpenseRepository
+from .command_router import app
+from .summarize_expenses import (
+    CATEGORY_FILTER, FISCAL_START, PERIOD_END, PERIOD_QUARTER, PERIOD_START,
+    PERIOD_YEAR, period_label, resolve_period
+)
+
+if TYPE_CHECKING:
+    from ...analytics import (
+        CategoryPercentiles, GroupTotal, MonthTotal, TopExpense
+    )
+
+
+TOP_COUNT = Annotated[
+    int,
+    Option(
+        "--top",
+        "-n",
+        help="Number of largest expenses to list. 0 hides the list.",
+        min=0
+    ),
+]
+
+PERCENTILES = Annotated[
+    Optional[list[float]],
+    Option(
+        "--percentile",
+        "-p",
+        help=(
+            "Percentile (0–100) of expense amounts to report. "
+            "Repeatable; defaults to 50, 90 and 99."
+        ),
+        min=0,
+        max=100
+    ),
+]
+
+
+def group_table(title: str, heading: str, groups: Sequence["GroupTotal"]) -> Table:
+    table = Table(title=title)
+    table.add_column(heading, style="magenta")
+    table.add_column("Entries", justify="right", style="cyan")
+    table.add_column("Total", justify="right", style="green")
+    table.add_column("Average", justify="right", style="green")
+    table.add_column("Share", justify="right", style="dim")
+
+    for group in groups:
+        table.add_row(
+            group.label,
+            str(group.count),
+            f"${group.total:.2f}",
+            f"${group.mean:.2f}",
+            f"{group.share:.1f}%",
+        )
+
+    return table
+
+
+def month_table(title: str, months: Sequence["MonthTotal"]) -> Table:
+    table = Table(title=title)
+    table.add_column("Month", style="magenta")
+    table.add_column("Entries", justify="right", style="cyan")
+    table.add_column("Total", justify="right", style="green")
+    table.add_column("Running total", justify="right", style="bold green")
+
+    for month in months:
+        table.add_row(
+            f"{month.year}-{month.month:02d}",
+            str(month.count),
+            f"${month.total:.2f}",
+            f"${month.running_total:.2f}",
+        )
+
+    return table
+
+
+def percentile_table(
+    title: str,
+    quantiles: Sequence[float],
+    overall: tuple[int, Sequence[float]],
+    categories: Sequence["CategoryPercentiles"],
+) -> Table:
+    table = Table(title=title)
+    table.add_column("Category", style="magenta")
+    table.add_column("Entries", justify="right", style="cyan")
+
+    for quantile in quantiles:
+        table.add_column(f"p{quantile:g}", justify="right", style="green")
+
+    count, values = overall
+    table.add_row("All", str(count), *(f"${value:.2f}" for value in values), style="bold")
+
+    for row in categories:
+        table.add_row(
+            row.category or "-",
+            str(row.count),
+            *(f"${value:.2f}" for value in row.values),
+        )
+
+    return table
+
+
+def top_table(
+    title: str,
+    expenses: Sequence["TopExpense"],
+    descriptions: dict[int, str],
+) -> Table:
+    table = Table(title=title)
+    table.add_column("ID", justify="right", style="cyan")
+    table.add_column("Description", style="bold white")
+    table.add_column("Amount", justify="right", style="green")
+    table.add_column("Category", style="magenta")
+    table.add_column("Date", style="dim")
+
+    for e in expenses:
+        table.add_row(
+            str(e.id),
+            descriptions.get(e.id, "-"),
+            f"${e.amount:.2f}",
+            e.category or "-",
+            e.date.strftime("%Y-%m-%d"),
+        )
+
+    return table
+
+
+@app.command("report")
+def expense_report(
+    start: PERIOD_START = None,
+    end: PERIOD_END = None,
+    quarter: PERIOD_QUARTER = None,
+    year: PERIOD_YEAR = None,
+    fiscal_start: FISCAL_START = 1,
+    category: CATEGORY_FILTER = "",
+    top: TOP_COUNT = 5,
+    percentile: PERCENTILES = None,
+):
+    """Break a period down by category, month and weekday, with running
+    totals, amount percentiles and the largest expenses."""
+    from ... import analytics
+
+    repo: ExpenseRepository = di[ExpenseRepository]
+    quantiles = percentile or [50.0, 90.0, 99.0]
+
+    start, end = resolve_period(start, end, quarter, year, fiscal_start)
+    label = period_label(start, end)
+
+    try:
+        arrays = repo.expense_arrays(start, end, category or None)
+    except ValueError as exc:
+        rich_print(f"\n[red]{exc}[/red]\n")
+        raise Exit(code=2)
+
+    if not arrays.size:
+        rich_print(f"[yellow]No expenses found for {label}[/yellow]")
+        return
+
+    rich_print("")
+    rich_print(group_table(
+        f"By category, {label}", "Category", analytics.by_category(arrays)))
+    rich_print(month_table(f"By month, {label}", analytics.by_month(arrays)))
+    rich_print(group_table(
+        f"By weekday, {label}", "Weekday", analytics.by_weekday(arrays)))
+    rich_print(percentile_table(
+        f"Expense amounts, {label}",
+        quantiles,
+        (arrays.size, analytics.percentiles(arrays, quantiles)),
+        analytics.percentiles_by_category(arrays, quantiles),
+    ))
+
+    if largest := analytics.top_expenses(arrays, top):
+        descriptions = {
+            e.id: e.description for e in repo.get_many([e.id for e in largest])
+        }
+        rich_print(top_table(
+            f"Top {len(largest)} expenses, {label}", largest, descriptions))
+
+    rich_print(
+        f"\n[bold cyan]Total for {label}: [green]${analytics.total(arrays):.2f}[/green] "
+        f"[dim]({arrays.size} entries)[/dim][/bold cyan]\n"
+    )
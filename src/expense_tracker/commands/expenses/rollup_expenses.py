@@ -0,0 +1,39 @@
+from typing import Annotated
+
+from kink import di
+from typer import Option, Exit
+from rich import print as rich_print
+
+from ...protocols import ExpenseRepository
+from .command_router import app
+
+
+CHECK_ONLY = Annotated[
+    bool,
+    Option(
+        "--check",
+        help="Only report out-of-date rollups; exit with code 1 if any are found.",
+    ),
+]
+
+
+@app.command("rebuild-rollups")
+def rebuild_rollups(check: CHECK_ONLY = False):
+    """Recompute the monthly/category rollups from the expenses table."""
+    repo: ExpenseRepository = di[ExpenseRepository]
+
+    drifted = repo.rebuild_rollups(dry_run=check)
+
+    if not drifted:
+        rich_print("\n[green]Rollups are up to date[/green]\n")
+        return
+
+    for year, month, category in drifted:
+        rich_print(
+            f"[yellow]{year}-{month:02d} {category or '(uncategorised)'}[/yellow]")
+
+    if check:
+        rich_print(f"\n[red]{len(drifted)} rollups are out of date[/red]\n")
+        raise Exit(code=1)
+
+    rich_print(f"\n[green]{len(drifted)} rollups rebuilt[/green]\n")
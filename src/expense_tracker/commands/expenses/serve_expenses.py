@@ -0,0 +1,50 @@
+# pylint: disable=import-outside-toplevel
+
+from typing import Annotated, Optional
+
+from kink import di
+from typer import Option, Exit
+from rich import print as rich_print
+
+from .command_router import app
+
+
+SOCKET_PATH = Annotated[
+    Optional[str],
+    Option(
+        "--socket",
+        "-s",
+        help=(
+            "Unix socket to listen on. Defaults to $EXPENSE_TRACKER_SOCKET or "
+            "a per-database path that the other commands look for."
+        ),
+    )
+]
+
+
+@app.command("serve")
+def serve(socket: SOCKET_PATH = None):
+    """Keep the database open and answer the writes and list/summary/
+    month/period reads of other expense-tracker commands over a Unix
+    socket."""
+    from ...bootstrap import local_expense_repository
+    from ...database import get_engine
+    from ...server import ExpenseServer
+
+    path = socket or di["server_socket"]
+    repo = local_expense_repository()
+    get_engine()  # build the pool and check the schema before accepting calls
+
+    try:
+        server = ExpenseServer(path, repo)
+    except OSError as exc:
+        rich_print(f"\n[red]{exc}[/red]\n")
+        raise Exit(code=2)
+
+    rich_print(f"\n[green]Serving expenses on {path}[/green] [dim](Ctrl+C to stop)[/dim]\n")
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,47 @@
+# pylint: disable=import-outside-toplevel
+
+from pathlib import Path
+from typing import Annotated
+
+from kink import di
+from typer import Argument, Option, Exit
+from rich import print as rich_print
+from rich.markup import escape
+
+from .command_router import app
+
+
+SNAPSHOT_PATH = Annotated[
+    Path,
+    Argument(
+        help="Arrow file to write. An existing snapshot is replaced atomically.",
+    ),
+]
+
+BATCH_SIZE = Annotated[
+    int,
+    Option(
+        "--batch-size",
+        help="Rows read from the database and written per record batch.",
+        min=1
+    ),
+]
+
+
+@app.command("snapshot")
+def snapshot(path: SNAPSHOT_PATH, batch_size: BATCH_SIZE = 65_536):
+    """Write every expense to a memory-mapped Arrow snapshot. With
+    EXPENSE_TRACKER_SNAPSHOT set to it, list/summary/month/period read the
+    snapshot instead of the database."""
+    try:
+        from ...repositories.snapshot import export_snapshot
+    except ImportError as exc:
+        rich_print(
+            f"\n[red]{escape(str(exc))}. Install the arrow extras: "
+            "pip install expense-tracker\\[arrow][/red]\n")
+        raise Exit(code=2)
+
+    with di["db_session_context"]() as db:
+        count = export_snapshot(db, path, batch_size)
+
+    rich_print(f"\n[green]{count} expenses written to {path}[/green]\n")
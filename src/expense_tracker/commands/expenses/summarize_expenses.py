@@ -1,14 +1,24 @@
+from itertools import islice
 from pathlib import Path
-from typing import Annotated
-from datetime import datetime
+from typing import TYPE_CHECKING, Annotated, Iterator, Optional, Sequence
+from datetime import datetime, timedelta
 
 from kink import di
-from typer import Option, Argument
+from typer import Option, Argument, Exit
 from rich import print as rich_print
 from rich.table import Table
 
-from ...protocols import ExpenseRepository, ExpenseCSVService
+from ...periods import month_range, quarter_range, year_range
+from ...protocols import ExpenseRepository
+from ...records import PeriodTotals
 from .command_router import app
+from .file_formats import FILE_FORMAT, FileFormat, file_service
+from .output_formats import (
+    OUTPUT_FORMAT, OutputFormat, notice, preview_rows, write_expenses, write_totals
+)
+
+if TYPE_CHECKING:
+    from ...records import ExpenseRecord
 
 
 MONTH_NUMBER = Annotated[
@@ -20,6 +30,54 @@ MONTH_NUMBER = Annotated[
     ),
 ]
 
+PERIOD_START = Annotated[
+    Optional[datetime],
+    Option(
+        "--start",
+        formats=["%Y-%m-%d"],
+        help="First day of a custom range. Requires --end.",
+    ),
+]
+
+PERIOD_END = Annotated[
+    Optional[datetime],
+    Option(
+        "--end",
+        formats=["%Y-%m-%d"],
+        help="Last day (inclusive) of a custom range. Requires --start.",
+    ),
+]
+
+PERIOD_QUARTER = Annotated[
+    Optional[int],
+    Option(
+        "--quarter",
+        "-q",
+        help="Report on a calendar quarter (1–4) of --year.",
+        min=1,
+        max=4
+    ),
+]
+
+PERIOD_YEAR = Annotated[
+    Optional[int],
+    Option(
+        "--year",
+        "-y",
+        help="Year of the quarter or fiscal year. Defaults to the current year.",
+    ),
+]
+
+FISCAL_START = Annotated[
+    int,
+    Option(
+        "--fiscal-start",
+        help="Month (1–12) in which the fiscal year starts.",
+        min=1,
+        max=12
+    ),
+]
+
 CATEGORY_FILTER = Annotated[
     str,
     Option(
@@ -34,7 +92,7 @@ EXPORT_FLAG = Annotated[
     Option(
         "--export",
         "-e",
-        help="Whether to export the summary to a CSV file."
+        help="Whether to export the summary to a file (see --format)."
     ),
 ]
 
@@ -54,12 +112,115 @@ EXPORT_FILENAME = Annotated[
         "-f",
         help=(
             "Filename for export. "
-            "The '.csv' extension will be added automatically. "
+            "The extension of the --format will be added automatically. "
             "If omitted, a timestamped name will be used."
         ),
     ),
 ]
 
+TOTALS_ONLY = Annotated[
+    bool,
+    Option(
+        "--totals-only",
+        "-t",
+        help="Show the total and per-category breakdown without listing expenses.",
+    ),
+]
+
+
+def expenses_table(title: str, expenses: Sequence["ExpenseRecord"]) -> Table:
+    table = Table(title=title, show_lines=True)
+    table.add_column("ID", style="cyan", justify="right")
+    table.add_column("Description", style="bold white")
+    table.add_column("Amount", justify="right", style="green")
+    table.add_column("Category", style="magenta")
+    table.add_column("Date", style="dim")
+
+    for e in expenses:
+        table.add_row(
+            str(e.id),
+            e.description,
+            f"${e.amount:.2f}",
+            e.category or "-",
+            e.date.strftime("%Y-%m-%d"),
+        )
+
+    return table
+
+
+def category_totals_table(title: str, totals: PeriodTotals) -> Table:
+    table = Table(title=title)
+    table.add_column("Category", style="magenta")
+    table.add_column("Entries", justify="right", style="cyan")
+    table.add_column("Total", justify="right", style="green")
+
+    for category, total, count in totals.categories:
+        table.add_row(category or "-", str(count), f"${total:.2f}")
+
+    return table
+
+
+def print_period(
+    title: str,
+    totals: PeriodTotals,
+    expenses: Optional[Iterator["ExpenseRecord"]],
+    output: OutputFormat,
+) -> None:
+    """Print the category totals, or ``expenses`` when given, in ``output``
+    format. On a terminal the rich table shows a preview of the expenses."""
+    if output is not OutputFormat.RICH:
+        if expenses is None:
+            write_totals(totals, output)
+        else:
+            write_expenses(expenses, output)
+        return
+
+    rich_print("")
+
+    if expenses is None:
+        rich_print(category_totals_table(f"Totals for {title}", totals))
+        return
+
+    max_rows = preview_rows(output)
+    rich_print(expenses_table(f"Expenses for {title}", list(islice(expenses, max_rows))))
+
+    if max_rows is not None and totals.count > max_rows:
+        rich_print(
+            f"\n[dim]Showing the first {max_rows} of {totals.count} expenses. "
+            "Use --output plain, tsv or jsonl to stream all of them.[/dim]")
+
+
+def resolve_period(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    quarter: Optional[int],
+    year: Optional[int],
+    fiscal_start: int,
+) -> tuple[datetime, datetime]:
+    """Half-open bounds from the --start/--end, --quarter or --year and
+    --fiscal-start options, exiting with code 2 when they conflict."""
+    if (start is None) != (end is None):
+        rich_print("\n[red]--start and --end must be used together[/red]\n")
+        raise Exit(code=2)
+
+    if start is not None and quarter is not None:
+        rich_print("\n[red]Use either --start/--end or --quarter[/red]\n")
+        raise Exit(code=2)
+
+    year = year or datetime.now().year
+
+    if start is not None and end is not None:
+        return start, end + timedelta(days=1)
+
+    if quarter is not None:
+        return quarter_range(year, quarter)
+
+    return year_range(year, fiscal_start)
+
+
+def period_label(start: datetime, end: datetime) -> str:
+    return f"{start:%Y-%m-%d} to {end - timedelta(days=1):%Y-%m-%d}"
+
 
 @app.command("summary")
 def summarize_user_expenses(
@@ -67,15 +228,15 @@ def summarize_user_expenses(
     export: EXPORT_FLAG = False,
     directory: EXPORT_DIR = Path.cwd(),
     filename: EXPORT_FILENAME = "",
+    file_format: FILE_FORMAT = FileFormat.CSV,
 ):
     """View total expenses and count, optionally filtered by category."""
     repo: ExpenseRepository = di[ExpenseRepository]
-    csv_service: ExpenseCSVService = di[ExpenseCSVService]
 
     total, count = repo.category_summary(category or None)
 
     if export:
-        csv_service.export_summary(
+        file_service(file_format).export_summary(
             category or None,
             total,
             count,
@@ -94,49 +255,91 @@ def summarize_user_expenses(
 @app.command("month")
 def monthly_summary(
     month: MONTH_NUMBER,
+    totals_only: TOTALS_ONLY = False,
     export: EXPORT_FLAG = False,
     directory: EXPORT_DIR = Path.cwd(),
     filename: EXPORT_FILENAME = "",
+    file_format: FILE_FORMAT = FileFormat.CSV,
+    output: OUTPUT_FORMAT = OutputFormat.RICH,
 ):
     """View summary of expenses for a specific month of the current year."""
     repo: ExpenseRepository = di[ExpenseRepository]
-    csv_service: ExpenseCSVService = di[ExpenseCSVService]
 
     year = datetime.now().year
-    expenses = repo.monthly_summary(month, year)
+    totals = repo.monthly_totals(month, year)
 
-    if not expenses:
-        rich_print(
-            f"[yellow]No expenses found for {year}-{month:02d}[/yellow]")
+    if not totals.count:
+        notice(output, f"[yellow]No expenses found for {year}-{month:02d}[/yellow]")
         return
 
-    total = sum(e.amount for e in expenses)
-
     if export:
-        csv_service.export_monthly_summary(
-            expenses, total, year, month, directory, filename or None
+        file_service(file_format).export_monthly_summary(
+            repo.iter_between(*month_range(year, month)),
+            totals.total, year, month, directory, filename or None
         )
-        rich_print(
-            "\n[green]Monthly report exported successfully[/green]\n")
+        notice(output, "\n[green]Monthly report exported successfully[/green]\n")
 
-    table = Table(title=f"Expenses for {year}-{month:02d}", show_lines=True)
-    table.add_column("ID", style="cyan", justify="right")
-    table.add_column("Description", style="bold white")
-    table.add_column("Amount", justify="right", style="green")
-    table.add_column("Category", style="magenta")
-    table.add_column("Date", style="dim")
+    print_period(
+        f"{year}-{month:02d}",
+        totals,
+        None if totals_only else repo.iter_between(*month_range(year, month)),
+        output,
+    )
 
-    for e in expenses:
-        table.add_row(
-            str(e.id),
-            e.description,
-            f"${e.amount:.2f}",
-            e.category or "-",
-            e.date.strftime("%Y-%m-%d"),
+    notice(
+        output,
+        f"\n[bold cyan]Total for {year}-{month:02d}: [green]${totals.total:.2f}[/green][/bold cyan]\n"
+    )
+
+
+@app.command("period")
+def period_summary(
+    start: PERIOD_START = None,
+    end: PERIOD_END = None,
+    quarter: PERIOD_QUARTER = None,
+    year: PERIOD_YEAR = None,
+    fiscal_start: FISCAL_START = 1,
+    category: CATEGORY_FILTER = "",
+    totals_only: TOTALS_ONLY = False,
+    export: EXPORT_FLAG = False,
+    directory: EXPORT_DIR = Path.cwd(),
+    filename: EXPORT_FILENAME = "",
+    file_format: FILE_FORMAT = FileFormat.CSV,
+    output: OUTPUT_FORMAT = OutputFormat.RICH,
+):
+    """View expenses for a custom range, a quarter or a (fiscal) year."""
+    repo: ExpenseRepository = di[ExpenseRepository]
+
+    start, end = resolve_period(start, end, quarter, year, fiscal_start)
+
+    try:
+        totals = repo.period_totals(start, end, category or None)
+    except ValueError as exc:
+        rich_print(f"\n[red]{exc}[/red]\n")
+        raise Exit(code=2)
+
+    label = period_label(start, end)
+
+    if not totals.count:
+        notice(output, f"[yellow]No expenses found for {label}[/yellow]")
+        return
+
+    if export:
+        file_service(file_format).export_expenses(
+            repo.iter_between(start, end, category or None),
+            directory,
+            filename or None,
         )
+        notice(output, "\n[green]Period report exported successfully[/green]\n")
 
-    rich_print("")
-    rich_print(table)
-    rich_print(
-        f"\n[bold cyan]Total for {year}-{month:02d}: [green]${total:.2f}[/green][/bold cyan]\n"
+    print_period(
+        label,
+        totals,
+        None if totals_only else repo.iter_between(start, end, category or None),
+        output,
+    )
+
+    notice(
+        output,
+        f"\n[bold cyan]Total for {label}: [green]${totals.total:.2f}[/green][/bold cyan]\n"
     )
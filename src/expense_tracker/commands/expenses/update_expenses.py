@@ -64,19 +64,24 @@ def update_expense(
     """Update an existing expense."""
     repo: ExpenseRepository = di[ExpenseRepository]
 
-    expense = repo.get(expense_id)
-    if expense is None:
-        rich_print(f"\n[red]Expense {expense_id} not found[/red]\n")
-        raise Exit(code=2)
+    values = {}
 
     if description:
-        expense.description = description
+        values["description"] = description
     if amount > 0:
-        expense.amount = amount
+        values["amount"] = amount
     if category:
-        expense.category = category
+        values["category"] = category
     if notes:
-        expense.notes = notes
+        values["notes"] = notes
+
+    if values:
+        found = repo.update_by_id(expense_id, values) is not None
+    else:
+        found = repo.get(expense_id) is not None
+
+    if not found:
+        rich_print(f"\n[red]Expense {expense_id} not found[/red]\n")
+        raise Exit(code=2)
 
-    repo.update(expense)
     rich_print(f"\n[green]Expense {expense_id} successfully updated[/green]\n")
@@ -1,20 +1,303 @@
-from contextlib import contextmanager
+# pylint: disable=import-outside-toplevel
+
+from pathlib import Path
+from threading import RLock
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Iterator, Mapping, Optional
 from kink import di
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy import URL, Engine, create_engine, event, make_url
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
 
 
-ENGINE = create_engine(di["db_url"])
-SESSION_LOCAL = sessionmaker(autocommit=False, autoflush=False, bind=ENGINE)
 BASE = declarative_base()
 
+# PRAGMAs applied to every new SQLite connection, selected by name through
+# `DATABASE_SQLITE_PROFILE`, "stock" by default. The opt-in "performance"
+# profile trades durability of the last few transactions on power loss
+# (never corruption) for much faster commits and lets readers run alongside
+# a writer. WAL is persistent: the database file stays in WAL mode after
+# switching back to "stock".
+SQLITE_PROFILES: dict[str, dict[str, Any]] = {
+    "stock": {},
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64_000,  # KiB, i.e. 64 MB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+
+# Async drivers swapped into `db_url` when no `async_db_url` is configured.
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def async_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+
+    if driver is None or parsed.get_driver_name() in ASYNC_DRIVERS.values():
+        return url
+
+    return parsed.set(drivername=f"{parsed.get_backend_name()}+{driver}") \
+        .render_as_string(hide_password=False)
+
+
+def sqlite_profile(name: str) -> dict[str, Any]:
+    try:
+        return SQLITE_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown SQLite profile {name!r}, expected one of: "
+            f"{', '.join(SQLITE_PROFILES)}.") from None
+
+
+class Database:
+    """Lazily built, reconfigurable engine and session factory.
+
+    Nothing connects until the first call to `engine` or `session`. The URL
+    defaults to ``di["db_url"]`` and the pragmas to the profile named by
+    ``di["db_sqlite_profile"]`` at that point; `configure` swaps the URL,
+    engine options or SQLite pragmas and disposes the current engine so
+    the next use builds a new one. Creation is guarded by a lock, so the
+    instance can be shared between threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._url: Optional[str] = None
+        self._engine_options: dict[str, Any] = {}
+        self._sqlite_pragmas: Optional[dict[str, Any]] = None
+        self._engine_hooks: list[Callable[[Engine], Any]] = []
+        self._engine: Optional[Engine] = None
+        self._session_factory: Optional[sessionmaker[Session]] = None
+
+    def configure(
+        self,
+        url: Optional[str] = None,
+        engine_options: Optional[Mapping[str, Any]] = None,
+        sqlite_pragmas: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        with self._lock:
+            if url is not None:
+                self._url = url
+            if engine_options is not None:
+                self._engine_options = dict(engine_options)
+            if sqlite_pragmas is not None:
+                self._sqlite_pragmas = dict(sqlite_pragmas)
+
+            self.dispose()
+
+    def add_engine_hook(self, hook: Callable[[Engine], Any]) -> None:
+        """Call ``hook(engine)`` once for every engine this instance builds,
+        including one that already exists."""
+        with self._lock:
+            if hook in self._engine_hooks:
+                return
+
+            self._engine_hooks.append(hook)
+
+            if self._engine is not None:
+                hook(self._engine)
+
+    def dispose(self) -> None:
+        with self._lock:
+            if self._engine is not None:
+                self._engine.dispose()
+
+            self._engine = None
+            self._session_factory = None
+
+    @property
+    def url(self) -> str:
+        return self._url or di["db_url"]
+
+    @property
+    def sqlite_pragmas(self) -> dict[str, Any]:
+        if self._sqlite_pragmas is not None:
+            return self._sqlite_pragmas
+
+        if "db_sqlite_profile" in di:
+            return sqlite_profile(di["db_sqlite_profile"])
+
+        return {}
+
+    @property
+    def engine(self) -> Engine:
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    # Other threads read _engine without the lock, so it is
+                    # published only once every hook has run against it.
+                    engine = self._create_engine()
+
+                    try:
+                        for hook in self._engine_hooks:
+                            hook(engine)
+                    except BaseException:
+                        engine.dispose()
+                        raise
+
+                    self._engine = engine
+
+        return self._engine
+
+    @property
+    def session(self) -> sessionmaker[Session]:
+        if self._session_factory is None:
+            with self._lock:
+                if self._session_factory is None:
+                    self._session_factory = sessionmaker(
+                        autocommit=False, autoflush=False, bind=self.engine)
+
+        return self._session_factory
+
+    def _create_engine(self) -> Engine:
+        url = make_url(self.url)
+
+        if url.get_backend_name() == "sqlite" and url.database not in (None, "", ":memory:"):
+            Path(url.database).parent.mkdir(parents=True, exist_ok=True)
+
+        pragmas = self.sqlite_pragmas
+        engine = self._new_engine(url)
+
+        if pragmas and engine.dialect.name == "sqlite":
+            event.listen(
+                self._sync_engine(engine), "connect", self._pragma_listener(pragmas))
+
+        return engine
+
+    def _new_engine(self, url: URL) -> Engine:
+        return create_engine(url, **self._engine_options)
+
+    def _sync_engine(self, engine: Engine) -> Engine:
+        return engine
+
+    @staticmethod
+    def _pragma_listener(pragmas: Mapping[str, Any]) -> Callable[..., None]:
+        def apply_pragmas(dbapi_connection, _connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
+        return apply_pragmas
+
+
+class AsyncDatabase(Database):
+    """`Database` for `AsyncEngine` and `AsyncSession`. The URL defaults to
+    ``di["async_db_url"]``, or ``di["db_url"]`` with its async driver.
+
+    Needs the optional async dependencies: ``pip install expense-tracker[async]``.
+    """
+
+    @property
+    def url(self) -> str:
+        if self._url:
+            return self._url
+
+        if "async_db_url" in di:
+            return di["async_db_url"]
+
+        return async_url(di["db_url"])
+
+    @property
+    def session(self) -> Any:
+        if self._session_factory is None:
+            with self._lock:
+                if self._session_factory is None:
+                    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+                    # Attributes can't be lazily refreshed after a commit
+                    # without an await, so keep them loaded.
+                    self._session_factory = async_sessionmaker(
+                        bind=self.engine, autoflush=False, expire_on_commit=False)
+
+        return self._session_factory
+
+    def dispose(self) -> None:
+        # AsyncEngine.dispose() must be awaited; dropping the pool here lets
+        # its connections close as they are garbage collected.
+        with self._lock:
+            if self._engine is not None:
+                self._engine.sync_engine.dispose(close=False)
+
+            self._engine = None
+            self._session_factory = None
+
+    async def aclose(self) -> None:
+        with self._lock:
+            engine, self._engine, self._session_factory = self._engine, None, None
+
+        if engine is not None:
+            await engine.dispose()
+
+    def _new_engine(self, url: URL) -> Any:
+        options = dict(self._engine_options)
+
+        if url.get_backend_name() == "sqlite":
+            # aiosqlite runs each connection on a non-daemon thread, so a
+            # pooled connection that is never closed keeps the interpreter
+            # from exiting. SQLite connections are cheap to open per session.
+            options.setdefault("poolclass", NullPool)
+
+        try:
+            from sqlalchemy.ext.asyncio import create_async_engine
+
+            return create_async_engine(url, **options)
+        except ImportError as exc:
+            raise ImportError(
+                f"{exc}. Install the async extras: "
+                "pip install expense-tracker[async]") from exc
+
+    def _sync_engine(self, engine: Any) -> Engine:
+        return engine.sync_engine
+
+
+DATABASE = Database()
+ASYNC_DATABASE = AsyncDatabase()
+
+
+def get_engine() -> Engine:
+    return DATABASE.engine
+
+
+def configure_database(
+    url: Optional[str] = None,
+    engine_options: Optional[Mapping[str, Any]] = None,
+    sqlite_pragmas: Optional[Mapping[str, Any]] = None,
+) -> None:
+    DATABASE.configure(url, engine_options, sqlite_pragmas)
+
 
 @contextmanager
-def get_db():
-    db = SESSION_LOCAL()
+def get_db() -> Iterator[Session]:
+    db = DATABASE.session()
 
     try:
         yield db
     finally:
         db.close()
+
+
+@asynccontextmanager
+async def get_async_db() -> AsyncIterator[Any]:
+    async with ASYNC_DATABASE.session() as db:
+        yield db
+
+
+def __getattr__(name: str) -> Any:
+    # `ENGINE` used to be built at import time; keep it importable.
+    if name == "ENGINE":
+        return DATABASE.engine
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
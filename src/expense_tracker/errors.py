@@ -0,0 +1,17 @@
+"""Errors every command reports as a message instead of a traceback.
+
+Only the standard library is imported here, so the CLI can catch them
+without importing the modules that raise them.
+"""
+
+
+class SnapshotError(Exception):
+    """The configured snapshot cannot answer a call."""
+
+
+class ReadOnlySnapshotError(SnapshotError, RuntimeError):
+    """A write was attempted against a snapshot."""
+
+
+class SnapshotNotFoundError(SnapshotError, FileNotFoundError):
+    """The configured snapshot file does not exist."""
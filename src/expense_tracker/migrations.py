@@ -0,0 +1,167 @@
+from typing import Callable
+
+from sqlalchemy import (
+    Column, Engine, Integer, Table, delete, inspect, insert, select, text
+)
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from .categories import CATEGORY_CACHE
+from .database import BASE
+from .models import Expense, ExpenseRollup
+from .rollups import rebuild_rollups
+
+
+# Bump whenever a migration is added so existing databases re-run upgrade().
+SCHEMA_VERSION = 4
+
+SCHEMA_VERSION_TABLE = Table(
+    "schema_version",
+    BASE.metadata,
+    Column("version", Integer, nullable=False),
+)
+
+
+def create_missing_indexes(engine: Engine) -> list[str]:
+    """`create_all` skips tables that already exist, including any index
+    declared on them afterwards, so add those indexes here."""
+    created = []
+
+    for table in BASE.metadata.sorted_tables:
+        existing = {index["name"] for index in inspect(engine).get_indexes(table.name)}
+
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name not in existing:
+                index.create(bind=engine)
+                created.append(f"create index {index.name}")
+
+    return created
+
+
+def store_money_as_cents(engine: Engine) -> list[str]:
+    """Replace the float `amount` column with integer `amount_cents`. The
+    rollup table only holds derived totals, so it is recreated empty and
+    refilled by `populate_rollups`."""
+    changes = []
+
+    if "amount" in _column_names(engine, Expense.__tablename__):
+        with engine.begin() as connection:
+            connection.execute(text(
+                "ALTER TABLE expenses "
+                "ADD COLUMN amount_cents BIGINT NOT NULL DEFAULT 0"))
+            connection.execute(text(
+                "UPDATE expenses "
+                "SET amount_cents = CAST(ROUND(amount * 100) AS BIGINT)"))
+            connection.execute(text("ALTER TABLE expenses DROP COLUMN amount"))
+
+        changes.append("convert expenses.amount to amount_cents")
+
+    if "total" in _column_names(engine, ExpenseRollup.__tablename__):
+        ExpenseRollup.__table__.drop(bind=engine)
+        ExpenseRollup.__table__.create(bind=engine)
+        changes.append("recreate expense_rollups with total_cents")
+
+    return changes
+
+
+def move_categories_to_table(engine: Engine) -> list[str]:
+    """Replace the free-text `expenses.category` column with `category_id`,
+    storing each normalized name once in `categories`. Rollups are keyed by
+    category id now, so they are recreated and refilled by
+    `populate_rollups`."""
+    changes = []
+
+    if "category" in _column_names(engine, Expense.__tablename__):
+        with engine.begin() as connection:
+            connection.execute(text(
+                "ALTER TABLE expenses "
+                "ADD COLUMN category_id INTEGER REFERENCES categories (id)"))
+
+            for name in connection.scalars(text(
+                    "SELECT DISTINCT category FROM expenses "
+                    "WHERE category IS NOT NULL AND category != ''")).all():
+                connection.execute(
+                    text("UPDATE expenses SET category_id = :id WHERE category = :name"),
+                    {"id": CATEGORY_CACHE.id_for(connection, name), "name": name},
+                )
+
+            # Indexes on the old column have to go before the column can.
+            for index in inspect(connection).get_indexes(Expense.__tablename__):
+                if "category" in index["column_names"]:
+                    connection.execute(text(f"DROP INDEX {index['name']}"))
+
+            connection.execute(text("ALTER TABLE expenses DROP COLUMN category"))
+
+        changes.append("move expenses.category to categories")
+
+    if "category" in _column_names(engine, ExpenseRollup.__tablename__):
+        ExpenseRollup.__table__.drop(bind=engine)
+        ExpenseRollup.__table__.create(bind=engine)
+        changes.append("recreate expense_rollups by category_id")
+
+    return changes
+
+
+def _column_names(engine: Engine, table: str) -> set[str]:
+    return {column["name"] for column in inspect(engine).get_columns(table)}
+
+
+def populate_rollups(engine: Engine) -> list[str]:
+    """Fill the rollup table for databases that predate it."""
+    with Session(engine) as db:
+        if db.scalar(select(ExpenseRollup.year).limit(1)) is not None:
+            return []
+
+        if db.scalar(select(Expense.id).limit(1)) is None:
+            return []
+
+        rebuild_rollups(db)
+        db.commit()
+
+    return ["populate expense_rollups"]
+
+
+MIGRATIONS: list[Callable[[Engine], list[str]]] = [
+    store_money_as_cents,
+    move_categories_to_table,
+    create_missing_indexes,
+    populate_rollups,
+]
+
+
+def upgrade(engine: Engine) -> list[str]:
+    """Bring an existing database up to the current models and return a
+    description of each change made. Every migration is idempotent."""
+    BASE.metadata.create_all(bind=engine)
+
+    changes = []
+
+    for migration in MIGRATIONS:
+        changes.extend(migration(engine))
+
+    return changes
+
+
+def schema_version(engine: Engine) -> int:
+    try:
+        with engine.connect() as connection:
+            return connection.scalar(
+                select(SCHEMA_VERSION_TABLE.c.version)) or 0
+    except DBAPIError:
+        return 0
+
+
+def ensure_schema(engine: Engine) -> list[str]:
+    """Run `upgrade` only when the database is not stamped with the current
+    `SCHEMA_VERSION`, so an up-to-date database costs a single query."""
+    if schema_version(engine) >= SCHEMA_VERSION:
+        return []
+
+    changes = upgrade(engine)
+
+    with engine.begin() as connection:
+        connection.execute(delete(SCHEMA_VERSION_TABLE))
+        connection.execute(
+            insert(SCHEMA_VERSION_TABLE).values(version=SCHEMA_VERSION))
+
+    return changes
@@ -1,25 +1,103 @@
+# pylint: disable=import-outside-toplevel
+
 from typing import Optional
 from datetime import datetime
 
-from sqlalchemy import String, Float, DateTime
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import (
+    Connection, DateTime, ForeignKey, Index, Integer, String, event, select
+)
+from sqlalchemy.orm import (
+    Mapped, Mapper, column_property, mapped_column, attributes
+)
 
 from .database import BASE
+from .money import Money
+from .records import ExpenseRecord
+
+
+class Category(BASE):
+    """A normalized category name, referenced by id from expenses."""
+    __tablename__ = "categories"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
+
+    def __repr__(self) -> str:
+        return f"Category(id={self.id!r}, name={self.name!r})"
 
 
 class Expense(BASE):
+    """An expense. `category` reads the name behind `category_id`; setting
+    it stores the id of the normalized name on flush."""
     __tablename__ = "expenses"
+    __table_args__ = (
+        Index("ix_expenses_category_date", "category_id", "date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     description: Mapped[str] = mapped_column(String(100), nullable=False)
-    category: Mapped[Optional[str]] = mapped_column(String(50))
-    amount: Mapped[float] = mapped_column(Float, nullable=False)
+    category_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("categories.id"), index=True)
+    category: Mapped[Optional[str]] = column_property(
+        select(Category.name)
+        .where(Category.id == category_id)
+        .correlate_except(Category)
+        .scalar_subquery()
+    )
+    amount: Mapped[float] = mapped_column(
+        "amount_cents", Money, key="amount", nullable=False)
     date: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.now, nullable=False)
+        DateTime, default=datetime.now, nullable=False, index=True)
     notes: Mapped[Optional[str]] = mapped_column(String(200))
 
+    @classmethod
+    def from_record(cls, record: ExpenseRecord) -> "Expense":
+        return cls(**record._asdict())
+
+    def to_record(self) -> ExpenseRecord:
+        return ExpenseRecord(
+            self.id, self.description, self.category,
+            self.amount, self.date, self.notes,
+        )
+
     def __repr__(self) -> str:
         return (
             f"Expense(id={self.id!r}, description={self.description!r},"
             f"category={self.category!r}, amount={self.amount!r}, date={self.date!r})"
         )
+
+
+@event.listens_for(Expense, "before_insert")
+@event.listens_for(Expense, "before_update")
+def _store_category_id(_mapper: Mapper, connection: Connection, expense: Expense) -> None:
+    from .categories import CATEGORY_CACHE, normalize_category
+
+    added = attributes.get_history(expense, "category").added
+
+    if not added:
+        return
+
+    category = added[0] or None
+    expense.category_id = CATEGORY_CACHE.id_for(connection, category)
+    attributes.set_committed_value(
+        expense, "category", category and normalize_category(category))
+
+
+class ExpenseRollup(BASE):
+    """Running total and count of expenses per (year, month, category id).
+    Uncategorised expenses are kept under category id 0. Totals are stored
+    in cents, like `Expense.amount`."""
+    __tablename__ = "expense_rollups"
+
+    year: Mapped[int] = mapped_column(Integer, primary_key=True)
+    month: Mapped[int] = mapped_column(Integer, primary_key=True)
+    category_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    total: Mapped[float] = mapped_column(
+        "total_cents", Money, key="total", nullable=False, default=0.0)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"ExpenseRollup(year={self.year!r}, month={self.month!r}, "
+            f"category_id={self.category_id!r}, total={self.total!r}, count={self.count!r})"
+        )
@@ -0,0 +1,42 @@
+# pylint: disable=abstract-method
+
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Optional, Union
+
+from sqlalchemy import BigInteger, Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+CENTS = 100
+
+Amount = Union[int, float, Decimal]
+
+
+def to_cents(amount: Amount) -> int:
+    """Round a currency amount to a whole number of cents, halves away from
+    zero like SQL ``ROUND(amount * 100)`` in the cents migration."""
+    if isinstance(amount, int):
+        return amount * CENTS
+
+    # Decimal(float) is exact, so a float is rounded from the same product
+    # the database computes.
+    cents = amount * CENTS if isinstance(amount, Decimal) else Decimal(amount * CENTS)
+    return int(cents.to_integral_value(ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> float:
+    return cents / CENTS
+
+
+class Money(TypeDecorator):
+    """A currency amount stored as integer cents. Python code keeps working
+    in float units; only the database sees cents, so `SUM` over money
+    columns is exact integer arithmetic and is converted back once."""
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[Amount], dialect: Dialect) -> Optional[int]:
+        return None if value is None else to_cents(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[float]:
+        return None if value is None else from_cents(value)
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+
+def _check_year(year: int) -> None:
+    if not isinstance(year, int):
+        raise ValueError("`year` must be type `int`.")
+
+
+def check_range(start: datetime, end: datetime) -> None:
+    if not isinstance(start, datetime) or not isinstance(end, datetime):
+        raise TypeError("`start` and `end` must be of type datetime.")
+
+    if start >= end:
+        raise ValueError("`start` must be before `end`.")
+
+
+def month_range(year: int, month: int) -> tuple[datetime, datetime]:
+    """Half-open ``[start, end)`` bounds of a calendar month."""
+    _check_year(year)
+
+    if not isinstance(month, int):
+        raise ValueError("`month` must be type `int`.")
+
+    if not 1 <= month <= 12:
+        raise ValueError("`month` must be between 1 and 12")
+
+    start = datetime(year, month, 1)
+    end = datetime(year + month // 12, month % 12 + 1, 1)
+    return start, end
+
+
+def quarter_range(year: int, quarter: int) -> tuple[datetime, datetime]:
+    """Half-open ``[start, end)`` bounds of a calendar quarter."""
+    if not isinstance(quarter, int) or not 1 <= quarter <= 4:
+        raise ValueError("`quarter` must be an integer between 1 and 4")
+
+    start, _ = month_range(year, 3 * quarter - 2)
+    _, end = month_range(year, 3 * quarter)
+    return start, end
+
+
+def year_range(year: int, start_month: int = 1) -> tuple[datetime, datetime]:
+    """Half-open ``[start, end)`` bounds of a (fiscal) year beginning in
+    ``start_month`` of ``year``."""
+    start, _ = month_range(year, start_month)
+    end, _ = month_range(year + 1, start_month)
+    return start, end
@@ -0,0 +1,160 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import Manager
+from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from time import time
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+Batch = list[dict[str, Any]]
+BatchParser = Callable[[Path], Iterable[Batch]]
+
+_DONE = object()
+_POLL_INTERVAL = 0.1
+
+
+class _Failure:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+class FileBatch(NamedTuple):
+    """One parsed batch of ``file``. ``rows`` is None once the file is
+    exhausted, or when parsing failed with ``error``. ``started`` is the
+    wall-clock `time()` at which parsing of the file began, comparable
+    across worker processes; None when the worker never reported it."""
+    file: Path
+    rows: Optional[Batch]
+    error: Optional[BaseException] = None
+    started: Optional[float] = None
+
+
+def flatten(batches: Iterable[Iterable[T]]) -> Iterator[T]:
+    for batch in batches:
+        yield from batch
+
+
+def prefetch(items: Iterable[T], depth: int = 2) -> Iterator[T]:
+    """Pull ``items`` on a background thread, keeping at most ``depth``
+    of them buffered so the producer runs while the consumer works. If the
+    consumer stops early, the producer stops at its next item."""
+    if depth < 1:
+        raise ValueError("`depth` must be greater than 0.")
+
+    buffer: Queue = Queue(maxsize=depth)
+    stopped = Event()
+
+    def put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except Full:
+                pass
+
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as exc:  # pylint: disable=broad-exception-caught
+            put(_Failure(exc))
+        else:
+            put(_DONE)
+
+    Thread(target=produce, daemon=True).start()
+
+    try:
+        while (item := buffer.get()) is not _DONE:
+            if isinstance(item, _Failure):
+                raise item.exc
+
+            yield item
+    finally:
+        stopped.set()
+
+
+def _parse_file(parse: BatchParser, file: Path) -> Iterator[FileBatch]:
+    started = time()
+
+    try:
+        for rows in prefetch(parse(file)):
+            yield FileBatch(file, rows, started=started)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        yield FileBatch(file, None, exc, started)
+    else:
+        yield FileBatch(file, None, started=started)
+
+
+def _parse_into_queue(parse: BatchParser, file: Path, queue: Any) -> None:
+    for item in _parse_file(parse, file):
+        queue.put(item)
+
+
+def parse_files(
+    parse: BatchParser,
+    files: Iterable[Path],
+    workers: int = 1,
+    depth: int = 2,
+) -> Iterator[FileBatch]:
+    """Parse ``files`` with ``parse`` and yield their batches to a single
+    consumer. With more than one worker the files are parsed in a process
+    pool and at most ``depth`` batches per worker wait in the queue."""
+    files = list(files)
+
+    if workers < 1:
+        raise ValueError("`workers` must be greater than 0.")
+
+    if workers == 1 or len(files) < 2:
+        for file in files:
+            yield from _parse_file(parse, file)
+        return
+
+    with Manager() as manager, ProcessPoolExecutor(workers) as pool:
+        queue = manager.Queue(maxsize=depth * workers)
+        futures: dict[Future, Path] = {
+            pool.submit(_parse_into_queue, parse, file, queue): file
+            for file in files
+        }
+        finished: set[Path] = set()
+
+        try:
+            while len(finished) < len(files):
+                try:
+                    item = queue.get(timeout=_POLL_INTERVAL)
+                except Empty:
+                    for item in _crashed_workers(futures, finished):
+                        finished.add(item.file)
+                        yield item
+                    continue
+
+                if item.rows is None:
+                    finished.add(item.file)
+
+                yield item
+        finally:
+            for future in futures:
+                future.cancel()
+
+            while not all(future.done() for future in futures):
+                try:
+                    queue.get(timeout=_POLL_INTERVAL)
+                except Empty:
+                    pass
+
+
+def _crashed_workers(
+    futures: dict[Future, Path],
+    finished: set[Path],
+) -> Iterator[FileBatch]:
+    for future, file in futures.items():
+        if file in finished or not future.done():
+            continue
+
+        if (exc := future.exception()) is not None:
+            yield FileBatch(file, None, exc)
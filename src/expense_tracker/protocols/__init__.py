@@ -1,2 +1,3 @@
 from .expense_repository import ExpenseRepository
-from .csv_read_write import ExpenseCSVService
\ No newline at end of file
+from .async_expense_repository import AsyncExpenseRepository
+from .csv_read_write import ExpenseCSVService
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Mapping, Protocol,
+    Optional, Sequence
+)
+from datetime import datetime
+
+from ..records import ExpenseFilter, ExpenseRecord, PeriodTotals, RollupKey
+
+
+if TYPE_CHECKING:
+    from ..analytics import ExpenseArrays
+    from ..models import Expense
+
+
+class AsyncExpenseRepository(Protocol):
+    async def get(self, expense_id: int) -> Expense | None:
+        ...
+
+    async def get_many(self, expense_ids: Iterable[int]) -> Sequence[ExpenseRecord]:
+        ...
+
+    async def add(self, expense: Expense | ExpenseRecord) -> int:
+        ...
+
+    async def bulk_import(self, expenses: Iterable[Expense]) -> int:
+        ...
+
+    async def bulk_insert(
+        self,
+        rows: Iterable[dict[str, Any]],
+        batch_size: int = ...,
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        ...
+
+    async def delete(self, expense: Expense) -> None:
+        ...
+
+    async def update(
+        self,
+        expense: Expense
+    ) -> Optional[Expense]:
+        ...
+
+    async def delete_by_id(self, expense_id: int) -> Optional[ExpenseRecord]:
+        ...
+
+    async def update_by_id(
+        self,
+        expense_id: int,
+        values: Mapping[str, Any],
+    ) -> Optional[ExpenseRecord]:
+        ...
+
+    async def delete_many(self, expense_filter: ExpenseFilter) -> int:
+        ...
+
+    async def update_many(
+        self,
+        expense_filter: ExpenseFilter,
+        values: Mapping[str, Any],
+    ) -> int:
+        ...
+
+    async def list(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Sequence[ExpenseRecord]:
+        ...
+
+    def iter_expenses(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        batch_size: int = ...,
+    ) -> AsyncIterator[ExpenseRecord]:
+        ...
+
+    async def category_summary(
+            self, category: Optional[str] = None) -> tuple[float, int]:
+        ...
+
+    async def between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> Sequence[ExpenseRecord]:
+        ...
+
+    def iter_between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+        batch_size: int = ...,
+    ) -> AsyncIterator[ExpenseRecord]:
+        ...
+
+    async def monthly_summary(self, month: int, year: int) -> Sequence[ExpenseRecord]:
+        ...
+
+    async def period_totals(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> PeriodTotals:
+        ...
+
+    async def monthly_totals(self, month: int, year: int) -> PeriodTotals:
+        ...
+
+    async def expense_arrays(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> ExpenseArrays:
+        ...
+
+    async def rebuild_rollups(self, dry_run: bool = False) -> Sequence[RollupKey]:
+        ...
@@ -1,14 +1,22 @@
-from typing import Protocol, Optional, Sequence
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING, Any, Iterable, Iterator, Protocol, Optional, Sequence
+)
 from pathlib import Path
 from datetime import datetime
 
-from ..models import Expense
+from ..records import ExpenseRecord
+
+
+if TYPE_CHECKING:
+    from ..models import Expense
 
 
 class ExpenseCSVService(Protocol):
     def export_expenses(
         self,
-        expenses: Sequence[Expense],
+        expenses: Iterable[Expense | ExpenseRecord],
         directory: Path,
         filename: Optional[str] = None,
     ) -> None: ...
@@ -25,7 +33,7 @@ class ExpenseCSVService(Protocol):
 
     def export_monthly_summary(
         self,
-        expenses: Sequence[Expense],
+        expenses: Iterable[Expense | ExpenseRecord],
         total: float,
         year: int,
         month: int,
@@ -34,3 +42,9 @@ class ExpenseCSVService(Protocol):
     ) -> None: ...
 
     def import_expenses(self, file: Path) -> Sequence[Expense]: ...
+
+    def iter_import_batches(
+        self,
+        file: Path,
+        chunksize: int = ...,
+    ) -> Iterator[list[dict[str, Any]]]: ...
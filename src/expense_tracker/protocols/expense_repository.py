@@ -1,15 +1,38 @@
-from typing import Protocol, Optional, Sequence
-from ..models import Expense
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Protocol,
+    Optional, Sequence
+)
+from datetime import datetime
+
+from ..records import ExpenseFilter, ExpenseRecord, PeriodTotals, RollupKey
+
+
+if TYPE_CHECKING:
+    from ..analytics import ExpenseArrays
+    from ..models import Expense
 
 
 class ExpenseRepository(Protocol):
     def get(self, expense_id: int) -> Expense | None:
         ...
 
-    def add(self, expense: Expense) -> int:
+    def get_many(self, expense_ids: Iterable[int]) -> Sequence[ExpenseRecord]:
+        ...
+
+    def add(self, expense: Expense | ExpenseRecord) -> int:
         ...
 
-    def bulk_import(self, expenses: Sequence[Expense]) -> None:
+    def bulk_import(self, expenses: Iterable[Expense]) -> int:
+        ...
+
+    def bulk_insert(
+        self,
+        rows: Iterable[dict[str, Any]],
+        batch_size: int = ...,
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> int:
         ...
 
     def delete(self, expense: Expense) -> None:
@@ -21,13 +44,85 @@ class ExpenseRepository(Protocol):
     ) -> Optional[Expense]:
         ...
 
+    def delete_by_id(self, expense_id: int) -> Optional[ExpenseRecord]:
+        ...
+
+    def update_by_id(
+        self,
+        expense_id: int,
+        values: Mapping[str, Any],
+    ) -> Optional[ExpenseRecord]:
+        ...
+
+    def delete_many(self, expense_filter: ExpenseFilter) -> int:
+        ...
+
+    def update_many(
+        self,
+        expense_filter: ExpenseFilter,
+        values: Mapping[str, Any],
+    ) -> int:
+        ...
+
     def list(
-            self, category: Optional[str] = None) -> Sequence[Expense]:
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Sequence[ExpenseRecord]:
+        ...
+
+    def iter_expenses(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        batch_size: int = ...,
+    ) -> Iterator[ExpenseRecord]:
         ...
 
     def category_summary(
             self, category: Optional[str] = None) -> tuple[float, int]:
         ...
 
-    def monthly_summary(self, month: int, year: int) -> Sequence[Expense]:
+    def between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> Sequence[ExpenseRecord]:
+        ...
+
+    def iter_between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+        batch_size: int = ...,
+    ) -> Iterator[ExpenseRecord]:
+        ...
+
+    def monthly_summary(self, month: int, year: int) -> Sequence[ExpenseRecord]:
+        ...
+
+    def period_totals(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> PeriodTotals:
+        ...
+
+    def monthly_totals(self, month: int, year: int) -> PeriodTotals:
+        ...
+
+    def expense_arrays(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> ExpenseArrays:
+        ...
+
+    def rebuild_rollups(self, dry_run: bool = False) -> Sequence[RollupKey]:
         ...
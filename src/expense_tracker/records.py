@@ -0,0 +1,41 @@
+from typing import NamedTuple, Optional, Sequence
+from datetime import datetime
+
+
+# (year, month, category name); the name is None for uncategorised
+# expenses, as in `CategoryTotal`.
+RollupKey = tuple[int, int, Optional[str]]
+
+
+class ExpenseRecord(NamedTuple):
+    """A plain, detached copy of an `Expense` row that can be built and
+    passed around without importing SQLAlchemy."""
+    id: Optional[int]
+    description: str
+    category: Optional[str]
+    amount: float
+    date: Optional[datetime]
+    notes: Optional[str]
+
+
+class CategoryTotal(NamedTuple):
+    category: Optional[str]
+    total: float
+    count: int
+
+
+class PeriodTotals(NamedTuple):
+    total: float
+    count: int
+    categories: Sequence[CategoryTotal]
+
+
+class ExpenseFilter(NamedTuple):
+    """Selects the expenses a batch update or delete applies to. Criteria
+    are combined with AND; `end` is exclusive and `description` is a SQL
+    LIKE pattern."""
+    ids: Optional[Sequence[int]] = None
+    category: Optional[str] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    description: Optional[str] = None
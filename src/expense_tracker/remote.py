@@ -0,0 +1,352 @@
+"""Client side of server mode: a JSON-lines protocol over a Unix domain
+socket and a repository that forwards calls to a running `serve` process.
+
+Only the standard library is imported here, so commands talking to the
+server skip the SQLAlchemy import and engine setup entirely.
+"""
+
+import json
+import socket
+from datetime import datetime
+from hashlib import sha1
+from itertools import islice
+from os import getuid
+from pathlib import Path
+from tempfile import gettempdir
+from threading import Lock
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, Mapping, Optional, Sequence
+
+from .records import CategoryTotal, ExpenseFilter, ExpenseRecord, PeriodTotals, RollupKey
+
+
+STREAM_BATCH_SIZE = 500
+
+# Rows sent per `bulk_insert` request.
+BULK_BATCH_SIZE = 5_000
+
+
+class RemoteError(RuntimeError):
+    """An error raised by the server that has no local equivalent."""
+
+
+# Errors re-raised as themselves so callers handle them as they would locally.
+_REMOTE_ERRORS: dict[str, type[Exception]] = {
+    "ValueError": ValueError,
+    "TypeError": TypeError,
+}
+
+
+def default_socket_path(db_url: str) -> str:
+    """One socket per user and database, so a server only ever answers
+    clients configured for the same database."""
+    digest = sha1(db_url.encode()).hexdigest()[:12]
+    return str(Path(gettempdir()) / f"expense-tracker-{getuid()}-{digest}.sock")
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$datetime": value.isoformat()}
+
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _object_hook(value: dict[str, Any]) -> Any:
+    if "$datetime" in value:
+        return datetime.fromisoformat(value["$datetime"])
+
+    return value
+
+
+def write_message(stream: BinaryIO, message: dict[str, Any]) -> None:
+    stream.write(json.dumps(message, default=_default).encode() + b"\n")
+    stream.flush()
+
+
+def read_message(stream: BinaryIO) -> Optional[dict[str, Any]]:
+    line = stream.readline()
+
+    if not line:
+        return None
+
+    return json.loads(line, object_hook=_object_hook)
+
+
+def connect(path: str, timeout: Optional[float] = None) -> Optional[socket.socket]:
+    """Connect to the server at `path`, or return None if none is listening."""
+    if not path or not Path(path).exists():
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+
+    try:
+        client.connect(path)
+    except OSError:
+        client.close()
+        return None
+
+    return client
+
+
+def server_is_running(path: str) -> bool:
+    client = connect(path, timeout=1.0)
+
+    if client is None:
+        return False
+
+    client.close()
+    return True
+
+
+def _expenses(rows: list[list[Any]]) -> list[ExpenseRecord]:
+    return [ExpenseRecord(*row) for row in rows]
+
+
+def _expense(row: Optional[list[Any]]) -> Optional[ExpenseRecord]:
+    return None if row is None else ExpenseRecord(*row)
+
+
+def _period_totals(value: list[Any]) -> PeriodTotals:
+    total, count, categories = value
+    return PeriodTotals(total, count, [CategoryTotal(*c) for c in categories])
+
+
+def _rollup_keys(value: list[list[Any]]) -> list[RollupKey]:
+    return [tuple(key) for key in value]
+
+
+def _wire_expense(expense: Any) -> list[Any]:
+    return [
+        expense.id, expense.description, expense.category,
+        expense.amount, expense.date, expense.notes,
+    ]
+
+
+# How the result of each served method is rebuilt on the client. Every
+# write is served, so a cache in the server sees all of them.
+RESULT_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "add": lambda value: value,
+    "bulk_import": lambda value: value,
+    "bulk_insert": lambda value: value,
+    "delete_by_id": _expense,
+    "update_by_id": _expense,
+    "delete_many": lambda value: value,
+    "update_many": lambda value: value,
+    "rebuild_rollups": _rollup_keys,
+    "list": _expenses,
+    "between": _expenses,
+    "monthly_summary": _expenses,
+    "category_summary": tuple,
+    "monthly_totals": _period_totals,
+    "period_totals": _period_totals,
+}
+
+STREAMED_METHODS = frozenset({"iter_expenses", "iter_between"})
+
+# Reads answered by the in-process fallback repository.
+FALLBACK_METHODS = frozenset({"get", "get_many", "expense_arrays"})
+
+
+class RemoteExpenseRepository:
+    """`ExpenseRepository` backed by a running server.
+
+    The methods in `RESULT_DECODERS` and `STREAMED_METHODS`, which include
+    every write, are answered by the server and return `ExpenseRecord`
+    objects in place of `Expense`. The reads in `FALLBACK_METHODS` go to
+    the in-process repository returned by `fallback`, created on first use.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fallback: Callable[[], Any],
+        timeout: Optional[float] = None,
+    ) -> None:
+        self._path = path
+        self._fallback_factory = fallback
+        self._fallback: Any = None
+        self._timeout = timeout
+        self._lock = Lock()
+        self._socket: Optional[socket.socket] = None
+        self._stream: Optional[BinaryIO] = None
+
+    def _open(self) -> tuple[socket.socket, BinaryIO]:
+        client = connect(self._path, self._timeout)
+
+        if client is None:
+            raise RemoteError(f"No expense-tracker server at {self._path}.")
+
+        return client, client.makefile("rwb")
+
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            if self._stream is None:
+                self._socket, self._stream = self._open()
+
+            try:
+                write_message(self._stream, {
+                    "method": method, "args": args, "kwargs": kwargs})
+                reply = read_message(self._stream)
+            except OSError:
+                self.close()
+                raise
+
+            if reply is None:
+                self.close()
+                raise RemoteError("The expense-tracker server closed the connection.")
+
+        return RESULT_DECODERS[method](self._result(reply))
+
+    def _stream_call(self, method: str, *args: Any, **kwargs: Any) -> Iterator[ExpenseRecord]:
+        # Streams get their own connection so other calls can run meanwhile.
+        client, stream = self._open()
+
+        try:
+            write_message(stream, {"method": method, "args": args, "kwargs": kwargs})
+
+            while (reply := read_message(stream)) is not None:
+                if "items" not in reply:
+                    self._result(reply)
+                    return
+
+                yield from _expenses(reply["items"])
+
+            raise RemoteError("The expense-tracker server closed the connection.")
+        finally:
+            stream.close()
+            client.close()
+
+    @staticmethod
+    def _result(reply: dict[str, Any]) -> Any:
+        if "error" in reply:
+            error = reply["error"]
+            raise _REMOTE_ERRORS.get(error["type"], RemoteError)(error["message"])
+
+        return reply["result"]
+
+    def close(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+        if self._socket is not None:
+            self._socket.close()
+
+        self._stream = self._socket = None
+
+    def add(self, expense: Any) -> int:
+        return self._call("add", _wire_expense(expense))
+
+    def bulk_import(self, expenses: Iterable[Any]) -> int:
+        return self._call("bulk_import", [_wire_expense(e) for e in expenses])
+
+    def bulk_insert(
+        self,
+        rows: Iterable[dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE,
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        # Each request is a bounded batch, so a large import never builds
+        # one huge message.
+        iterator = iter(rows)
+        inserted_count = 0
+
+        while batch := list(islice(iterator, batch_size)):
+            inserted_count += self._call("bulk_insert", batch, batch_size)
+
+            if on_batch is not None:
+                on_batch(len(batch))
+
+        return inserted_count
+
+    def delete(self, expense: Any) -> None:
+        if expense.id is None:
+            raise ValueError("Only stored expenses can be deleted.")
+
+        self.delete_by_id(expense.id)
+
+    def delete_by_id(self, expense_id: int) -> Optional[ExpenseRecord]:
+        return self._call("delete_by_id", expense_id)
+
+    def update(self, expense: Any) -> None:
+        self.update_by_id(expense.id, {
+            "category": expense.category,
+            "description": expense.description,
+            "amount": expense.amount,
+            "date": expense.date,
+            "notes": expense.notes,
+        })
+
+    def update_by_id(
+        self,
+        expense_id: int,
+        values: Mapping[str, Any],
+    ) -> Optional[ExpenseRecord]:
+        return self._call("update_by_id", expense_id, dict(values))
+
+    def delete_many(self, expense_filter: ExpenseFilter) -> int:
+        return self._call("delete_many", expense_filter)
+
+    def update_many(self, expense_filter: ExpenseFilter, values: Mapping[str, Any]) -> int:
+        return self._call("update_many", expense_filter, dict(values))
+
+    def rebuild_rollups(self, dry_run: bool = False) -> Sequence[RollupKey]:
+        return self._call("rebuild_rollups", dry_run)
+
+    def list(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Sequence[ExpenseRecord]:
+        return self._call("list", category, limit, after_id)
+
+    def iter_expenses(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[ExpenseRecord]:
+        return self._stream_call("iter_expenses", category, limit, after_id, batch_size)
+
+    def category_summary(self, category: Optional[str] = None) -> tuple[float, int]:
+        return self._call("category_summary", category)
+
+    def between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> Sequence[ExpenseRecord]:
+        return self._call("between", start, end, category)
+
+    def iter_between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[ExpenseRecord]:
+        return self._stream_call("iter_between", start, end, category, batch_size)
+
+    def monthly_summary(self, month: int, year: int) -> Sequence[ExpenseRecord]:
+        return self._call("monthly_summary", month, year)
+
+    def period_totals(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> PeriodTotals:
+        return self._call("period_totals", start, end, category)
+
+    def monthly_totals(self, month: int, year: int) -> PeriodTotals:
+        return self._call("monthly_totals", month, year)
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in FALLBACK_METHODS:
+            raise AttributeError(name)
+
+        if self._fallback is None:
+            self._fallback = self._fallback_factory()
+
+        return getattr(self._fallback, name)
@@ -1 +1,14 @@
-from .sql_alchemy_expense_repo import SQLAlchemyExpenseRepository
\ No newline at end of file
+# pylint: disable=import-outside-toplevel
+
+from .sql_alchemy_expense_repo import SQLAlchemyExpenseRepository
+from .caching_expense_repo import CachingExpenseRepository
+
+
+def __getattr__(name: str):
+    # The async repository pulls in sqlalchemy.ext.asyncio, which the sync
+    # commands never need; import it on first access only.
+    if name == "AsyncSQLAlchemyExpenseRepository":
+        from .async_sql_alchemy_expense_repo import AsyncSQLAlchemyExpenseRepository
+        return AsyncSQLAlchemyExpenseRepository
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,77 @@
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+
+from sqlalchemy import BigInteger, Select, func, select, type_coerce
+from sqlalchemy.orm import Session
+
+from ..analytics import ExpenseArrays
+from ..categories import CATEGORIES, UNCATEGORISED, category_id_query
+from ..models import Expense
+from ..periods import check_range
+from .queries import check_category
+
+
+ARRAYS_BATCH_SIZE = 65_536
+
+
+def expense_arrays_query(
+    start: datetime,
+    end: datetime,
+    category: Optional[str],
+) -> Select:
+    """(id, cents, date, category id) rows for `ExpenseArrays`."""
+    check_range(start, end)
+    check_category(category)
+
+    expenses = Expense.__table__.c
+    query = (
+        select(
+            expenses.id,
+            type_coerce(expenses.amount, BigInteger),
+            expenses.date,
+            func.coalesce(expenses.category_id, UNCATEGORISED),
+        )
+        .where(expenses.date >= start)
+        .where(expenses.date < end)
+    )
+
+    if category is not None:
+        query = query.where(expenses.category_id == category_id_query(category))
+
+    return query.order_by(expenses.date, expenses.id)
+
+
+def load_expense_arrays(
+    db: Session,
+    start: datetime,
+    end: datetime,
+    category: Optional[str] = None,
+) -> ExpenseArrays:
+    """Read the expenses in ``[start, end)`` into NumPy arrays, one batch
+    of rows at a time. Category ids are the codes into `names`."""
+    query = expense_arrays_query(start, end, category)
+    categories = dict(db.execute(select(CATEGORIES.c.id, CATEGORIES.c.name)).all())
+    names = tuple(categories.get(i) for i in range(max(categories, default=0) + 1))
+
+    ids, cents, dates, codes = [], [], [], []
+    result = db.execute(query.execution_options(yield_per=ARRAYS_BATCH_SIZE))
+
+    for partition in result.partitions():
+        batch_ids, batch_cents, batch_dates, batch_codes = zip(*partition)
+        ids.append(np.array(batch_ids, np.int64))
+        cents.append(np.array(batch_cents, np.int64))
+        dates.append(np.array(batch_dates, "datetime64[us]"))
+        codes.append(np.array(batch_codes, np.int32))
+
+    if not ids:
+        return ExpenseArrays.empty()._replace(names=names)
+
+    return ExpenseArrays(
+        np.concatenate(ids),
+        np.concatenate(cents),
+        np.concatenate(dates),
+        np.concatenate(codes),
+        names,
+    )
@@ -0,0 +1,275 @@
+# pylint: disable=import-outside-toplevel
+
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Mapping, Sequence, Optional, Callable
+from datetime import datetime
+from contextlib import AbstractAsyncContextManager
+
+from sqlalchemy import Select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from kink import inject
+
+from ..categories import with_category_ids
+from ..models import Expense
+from ..periods import month_range
+from ..protocols import AsyncExpenseRepository
+from ..records import ExpenseFilter, ExpenseRecord, PeriodTotals, RollupKey
+from ..rollups import apply_rollup_deltas, rebuild_rollups, rollup_deltas
+from .batch import delete_matching, delete_row, update_matching, update_row
+from .queries import (
+    batch_rollup_rows, batched, between_query, category_summary_query,
+    check_batch_size, check_expense, check_expense_id, check_update_values,
+    expense_records, fill_dates, filter_criteria, get_many_query, list_query, monthly_totals_query,
+    period_totals, period_totals_query, rollup_row, summary_totals
+)
+from .sql_alchemy_expense_repo import BULK_BATCH_SIZE, ITER_BATCH_SIZE
+
+if TYPE_CHECKING:
+    from ..analytics import ExpenseArrays
+
+
+@inject(alias=AsyncExpenseRepository)
+class AsyncSQLAlchemyExpenseRepository:
+    """`SQLAlchemyExpenseRepository` on `AsyncSession`. Rollup bookkeeping
+    reuses the sync helpers through `AsyncSession.run_sync`."""
+
+    def __init__(self, async_db_session_context: Callable[[
+    ], AbstractAsyncContextManager[AsyncSession]]) -> None:
+        self._db_context = async_db_session_context
+
+    async def get(self, expense_id: int) -> Expense | None:
+        check_expense_id(expense_id)
+
+        async with self._db_context() as db:
+            return await db.get(Expense, expense_id)
+
+    async def get_many(self, expense_ids: Iterable[int]) -> Sequence[ExpenseRecord]:
+        query = get_many_query(expense_ids)
+
+        async with self._db_context() as db:
+            return expense_records(await db.execute(query))
+
+    async def add(self, expense: Expense | ExpenseRecord) -> int | None:
+        if isinstance(expense, ExpenseRecord):
+            expense = Expense.from_record(expense)
+
+        check_expense(expense)
+
+        async with self._db_context() as db:
+            db.add(expense)
+            await db.flush()
+            await db.run_sync(
+                apply_rollup_deltas, rollup_deltas([rollup_row(expense)]))
+            await db.commit()
+            return expense.id
+
+    async def bulk_import(self, expenses: Iterable[Expense]) -> int:
+        added: list[Expense] = []
+
+        async with self._db_context() as db:
+            for expense in expenses:
+                check_expense(expense)
+                db.add(expense)
+                added.append(expense)
+
+            await db.flush()
+            await db.run_sync(
+                apply_rollup_deltas, rollup_deltas(rollup_row(e) for e in added))
+            await db.commit()
+
+        return len(added)
+
+    async def bulk_insert(
+        self,
+        rows: Iterable[dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE,
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        check_batch_size(batch_size)
+
+        inserted_count = 0
+        statement = insert(Expense.__table__)
+
+        async with self._db_context() as db:
+            for batch in batched(rows, batch_size):
+                batch = await db.run_sync(with_category_ids, fill_dates(batch))
+
+                await db.execute(statement, batch)
+                await db.run_sync(
+                    apply_rollup_deltas, rollup_deltas(batch_rollup_rows(batch)))
+                await db.commit()
+                inserted_count += len(batch)
+
+                if on_batch is not None:
+                    on_batch(len(batch))
+
+        return inserted_count
+
+    async def category_summary(
+        self,
+        category: Optional[str] = None
+    ) -> tuple[float, int]:
+        query = category_summary_query(category)
+
+        async with self._db_context() as db:
+            return summary_totals((await db.execute(query)).first())
+
+    async def delete(self, task: Expense) -> None:
+        check_expense(task)
+
+        if task.id is not None:
+            await self.delete_by_id(task.id)
+            return
+
+        async with self._db_context() as db:
+            await db.delete(task)
+            await db.commit()
+
+    async def delete_by_id(self, expense_id: int) -> ExpenseRecord | None:
+        check_expense_id(expense_id)
+
+        async with self._db_context() as db:
+            deleted = await db.run_sync(delete_row, expense_id)
+            await db.commit()
+
+        return deleted
+
+    async def update(self, expense: Expense) -> None:
+        check_expense(expense)
+
+        await self.update_by_id(expense.id, {
+            "category": expense.category,
+            "description": expense.description,
+            "amount": expense.amount,
+            "date": expense.date,
+            "notes": expense.notes,
+        })
+
+    async def update_by_id(
+        self,
+        expense_id: int,
+        values: Mapping[str, Any],
+    ) -> ExpenseRecord | None:
+        check_expense_id(expense_id)
+        values = check_update_values(values)
+
+        async with self._db_context() as db:
+            updated = await db.run_sync(update_row, expense_id, values)
+            await db.commit()
+
+        return updated
+
+    async def delete_many(self, expense_filter: ExpenseFilter) -> int:
+        criteria = filter_criteria(expense_filter)
+
+        async with self._db_context() as db:
+            deleted_count = await db.run_sync(delete_matching, criteria)
+            await db.commit()
+
+        return deleted_count
+
+    async def update_many(
+        self,
+        expense_filter: ExpenseFilter,
+        values: Mapping[str, Any],
+    ) -> int:
+        criteria = filter_criteria(expense_filter)
+        values = check_update_values(values)
+
+        async with self._db_context() as db:
+            updated_count = await db.run_sync(update_matching, criteria, values)
+            await db.commit()
+
+        return updated_count
+
+    async def list(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Sequence[ExpenseRecord]:
+        query = list_query(category, limit, after_id)
+
+        async with self._db_context() as db:
+            return expense_records(await db.execute(query))
+
+    def iter_expenses(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        batch_size: int = ITER_BATCH_SIZE,
+    ) -> AsyncIterator[ExpenseRecord]:
+        check_batch_size(batch_size)
+
+        query = list_query(category, limit, after_id).execution_options(
+            yield_per=batch_size)
+
+        return self._stream(query)
+
+    async def _stream(self, query: Select) -> AsyncIterator[ExpenseRecord]:
+        async with self._db_context() as db:
+            async for row in await db.stream(query):
+                yield ExpenseRecord._make(row)
+
+    async def between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> Sequence[ExpenseRecord]:
+        query = between_query(start, end, category)
+
+        async with self._db_context() as db:
+            return expense_records(await db.execute(query))
+
+    def iter_between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+        batch_size: int = ITER_BATCH_SIZE,
+    ) -> AsyncIterator[ExpenseRecord]:
+        check_batch_size(batch_size)
+
+        query = between_query(start, end, category).execution_options(
+            yield_per=batch_size)
+
+        return self._stream(query)
+
+    async def monthly_summary(self, month: int, year: int) -> Sequence[ExpenseRecord]:
+        return await self.between(*month_range(year, month))
+
+    async def period_totals(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> PeriodTotals:
+        query = period_totals_query(start, end, category)
+
+        async with self._db_context() as db:
+            return period_totals((await db.execute(query)).all())
+
+    async def monthly_totals(self, month: int, year: int) -> PeriodTotals:
+        query = monthly_totals_query(month, year)
+
+        async with self._db_context() as db:
+            return period_totals((await db.execute(query)).all())
+
+    async def expense_arrays(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> "ExpenseArrays":
+        from .arrays import load_expense_arrays
+
+        async with self._db_context() as db:
+            return await db.run_sync(load_expense_arrays, start, end, category)
+
+    async def rebuild_rollups(self, dry_run: bool = False) -> Sequence[RollupKey]:
+        async with self._db_context() as db:
+            drifted = await db.run_sync(rebuild_rollups, dry_run)
+            await db.commit()
+
+        return drifted
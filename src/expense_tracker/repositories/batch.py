@@ -0,0 +1,115 @@
+"""Single-statement updates and deletes that keep the rollups in step, run
+in the caller's session so the sync and async repositories share them."""
+
+from typing import Any, Mapping, Optional, Sequence
+
+from sqlalchemy import ColumnElement, delete, select, update
+from sqlalchemy.orm import Session
+
+from ..categories import with_category_id
+from ..models import Expense
+from ..records import ExpenseRecord
+from ..rollups import apply_rollup_deltas, matching_deltas, merge_deltas, rollup_deltas
+from .queries import EXPENSES, ROLLUP_FIELDS
+
+
+# Returned by the by-ID statements, in `ExpenseRecord` field order. The
+# category name is a correlated subquery on the returned row.
+RECORD_COLUMNS = (
+    EXPENSES.c.id, EXPENSES.c.description, Expense.category,
+    EXPENSES.c.amount, EXPENSES.c.date, EXPENSES.c.notes,
+)
+
+# What an expense contributes to the rollups.
+ROLLUP_COLUMNS = (EXPENSES.c.date, EXPENSES.c.category_id, EXPENSES.c.amount)
+
+
+def delete_matching(db: Session, criteria: Sequence[ColumnElement[bool]]) -> int:
+    removed = matching_deltas(db, criteria, sign=-1)
+    result = db.execute(delete(EXPENSES).where(*criteria))
+    apply_rollup_deltas(db, removed)
+
+    return result.rowcount
+
+
+def update_matching(
+    db: Session,
+    criteria: Sequence[ColumnElement[bool]],
+    values: Mapping[str, Any],
+) -> int:
+    statement = (
+        update(EXPENSES)
+        .where(*criteria)
+        .values(**with_category_id(db, values))
+    )
+
+    if ROLLUP_FIELDS.isdisjoint(values):
+        return db.execute(statement).rowcount
+
+    removed = matching_deltas(db, criteria, sign=-1)
+    rows = db.execute(statement.returning(*ROLLUP_COLUMNS)).all()
+    apply_rollup_deltas(db, merge_deltas(removed, rollup_deltas(rows)))
+
+    return len(rows)
+
+
+def delete_row(db: Session, expense_id: int) -> Optional[ExpenseRecord]:
+    """Delete one expense with ``DELETE ... RETURNING`` and return it, or
+    None if there was no such expense."""
+    row = db.execute(
+        delete(EXPENSES)
+        .where(EXPENSES.c.id == expense_id)
+        .returning(*RECORD_COLUMNS, EXPENSES.c.category_id)
+    ).first()
+
+    if row is None:
+        return None
+
+    *fields, category_id = row
+    record = ExpenseRecord(*fields)
+    apply_rollup_deltas(
+        db, rollup_deltas([(record.date, category_id, record.amount)], sign=-1))
+
+    return record
+
+
+def update_row(
+    db: Session,
+    expense_id: int,
+    values: Mapping[str, Any],
+) -> Optional[ExpenseRecord]:
+    """Update one expense with ``UPDATE ... RETURNING`` and return its new
+    state, or None if there was no such expense. When the rollups are
+    affected, the old category, amount and date are read first in the same
+    transaction."""
+    statement = (
+        update(EXPENSES)
+        .where(EXPENSES.c.id == expense_id)
+        .values(**with_category_id(db, values))
+        .returning(*RECORD_COLUMNS, EXPENSES.c.category_id)
+    )
+    removed = {}
+
+    if not ROLLUP_FIELDS.isdisjoint(values):
+        old = db.execute(
+            select(*ROLLUP_COLUMNS).where(EXPENSES.c.id == expense_id)
+        ).first()
+
+        if old is None:
+            return None
+
+        removed = rollup_deltas([tuple(old)], sign=-1)
+
+    row = db.execute(statement).first()
+
+    if row is None:
+        return None
+
+    *fields, category_id = row
+    record = ExpenseRecord(*fields)
+
+    if removed:
+        added = rollup_deltas([(record.date, category_id, record.amount)])
+        apply_rollup_deltas(db, merge_deltas(removed, added))
+
+    return record
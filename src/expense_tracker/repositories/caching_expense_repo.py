@@ -0,0 +1,246 @@
+from typing import (
+    Any, Callable, Iterable, Iterator, Mapping, NamedTuple, Optional, Sequence
+)
+from datetime import datetime
+from time import monotonic
+
+from ..cache import CacheStats, TTLCache
+from ..categories import normalize_category
+from ..models import Expense
+from ..periods import month_range
+from ..protocols import ExpenseRepository
+from ..records import ExpenseFilter, ExpenseRecord, PeriodTotals, RollupKey
+from .queries import ROLLUP_FIELDS, check_category
+from .sql_alchemy_expense_repo import BULK_BATCH_SIZE
+
+
+class CacheScope(NamedTuple):
+    """The expenses a cached result was computed from: those dated within
+    [start, end) (None is unbounded) in `category` (None is every category)."""
+    start: Optional[datetime]
+    end: Optional[datetime]
+    category: Optional[str]
+
+
+# Reads that are never cached and go straight to the wrapped repository.
+UNCACHED_READS = frozenset({
+    "get", "get_many", "list", "iter_expenses", "iter_between", "expense_arrays",
+})
+
+# A write to one expense: its date (None when the database picks it) and
+# its category, normalized the way the repository filters on it.
+Change = tuple[Optional[datetime], str]
+
+
+def _category_key(category: Optional[str]) -> str:
+    return normalize_category(category or "")
+
+
+def _change(expense: Any) -> Change:
+    return expense.date, _category_key(expense.category)
+
+
+def _frozen_totals(totals: PeriodTotals) -> PeriodTotals:
+    return totals._replace(categories=tuple(totals.categories))
+
+
+def _affects(scope: CacheScope, changes: Sequence[Change]) -> bool:
+    for date, category in changes:
+        if scope.category is not None and scope.category != category:
+            continue
+
+        if date is None:
+            return True
+
+        if (scope.start is None or scope.start <= date) and (
+                scope.end is None or date < scope.end):
+            return True
+
+    return False
+
+
+class CachingExpenseRepository:
+    """Wraps an `ExpenseRepository` and caches the summary reads in an LRU
+    store with a TTL.
+
+    Writes made through this wrapper invalidate only the entries whose
+    scope holds one of the written expenses. Writes made elsewhere show up
+    once the TTL has passed.
+    """
+
+    def __init__(
+        self,
+        repository: ExpenseRepository,
+        max_entries: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._repo = repository
+        self._cache = TTLCache(max_entries, ttl, clock)
+
+    def cache_stats(self) -> CacheStats:
+        return self._cache.stats()
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def _cached(self, key: tuple, scope: CacheScope, compute: Callable[[], Any]) -> Any:
+        """Return the cached result of ``compute``. Every caller shares the
+        stored value, so ``compute`` must return an immutable one."""
+        missing = object()
+
+        if (value := self._cache.get(key, missing)) is not missing:
+            return value
+
+        generation = self._cache.generation
+        value = compute()
+        self._cache.put(key, value, scope, generation)
+        return value
+
+    def _invalidate(self, changes: Sequence[Change]) -> None:
+        if changes:
+            self._cache.invalidate(lambda scope: _affects(scope, changes))
+
+    def category_summary(self, category: Optional[str] = None) -> tuple[float, int]:
+        check_category(category)
+        scope = CacheScope(None, None, _category_key(category) if category else None)
+        return self._cached(
+            ("category_summary", scope.category), scope,
+            lambda: self._repo.category_summary(category))
+
+    def monthly_summary(self, month: int, year: int) -> Sequence[ExpenseRecord]:
+        scope = CacheScope(*month_range(year, month), None)
+        return self._cached(
+            ("monthly_summary", month, year), scope,
+            lambda: tuple(self._repo.monthly_summary(month, year)))
+
+    def monthly_totals(self, month: int, year: int) -> PeriodTotals:
+        scope = CacheScope(*month_range(year, month), None)
+        return self._cached(
+            ("monthly_totals", month, year), scope,
+            lambda: _frozen_totals(self._repo.monthly_totals(month, year)))
+
+    def between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> Sequence[ExpenseRecord]:
+        check_category(category)
+        scope = CacheScope(start, end, None if category is None else _category_key(category))
+        return self._cached(
+            ("between", start, end, scope.category), scope,
+            lambda: tuple(self._repo.between(start, end, category)))
+
+    def period_totals(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> PeriodTotals:
+        check_category(category)
+        scope = CacheScope(start, end, None if category is None else _category_key(category))
+        return self._cached(
+            ("period_totals", start, end, scope.category), scope,
+            lambda: _frozen_totals(self._repo.period_totals(start, end, category)))
+
+    def add(self, expense: Expense | ExpenseRecord) -> int | None:
+        expense_id = self._repo.add(expense)
+        self._invalidate([_change(expense)])
+        return expense_id
+
+    def bulk_import(self, expenses: Iterable[Expense]) -> int:
+        expenses = list(expenses)
+        added_count = self._repo.bulk_import(expenses)
+        self._invalidate([_change(expense) for expense in expenses])
+        return added_count
+
+    def bulk_insert(
+        self,
+        rows: Iterable[dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE,
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        changes: dict[Change, None] = {}
+
+        def tracked() -> Iterator[dict[str, Any]]:
+            for row in rows:
+                changes[(row.get("date"), _category_key(row.get("category")))] = None
+                yield row
+
+        try:
+            return self._repo.bulk_insert(tracked(), batch_size, on_batch)
+        finally:
+            self._invalidate(list(changes))
+
+    def update(self, expense: Expense) -> None:
+        # The caller usually edits the object it read, so the stored row
+        # is the only record of where the expense used to be.
+        stored = self._repo.get(expense.id)
+        self._repo.update(expense)
+
+        if stored is None:
+            self._cache.clear()
+        else:
+            self._invalidate([_change(stored), _change(expense)])
+
+    def delete(self, expense: Expense) -> None:
+        if expense.id is not None:
+            self.delete_by_id(expense.id)
+            return
+
+        self._repo.delete(expense)
+        self._invalidate([_change(expense)])
+
+    def delete_by_id(self, expense_id: int) -> ExpenseRecord | None:
+        deleted = self._repo.delete_by_id(expense_id)
+
+        if deleted is not None:
+            self._invalidate([_change(deleted)])
+
+        return deleted
+
+    def update_by_id(
+        self,
+        expense_id: int,
+        values: Mapping[str, Any],
+    ) -> ExpenseRecord | None:
+        stored = self._repo.get(expense_id) if ROLLUP_FIELDS.intersection(values) else None
+        updated = self._repo.update_by_id(expense_id, values)
+
+        if updated is not None:
+            self._invalidate([_change(updated)] + ([_change(stored)] if stored else []))
+
+        return updated
+
+    # Batch writes can move any number of rows anywhere; drop everything.
+    def delete_many(self, expense_filter: ExpenseFilter) -> int:
+        try:
+            return self._repo.delete_many(expense_filter)
+        finally:
+            self._cache.clear()
+
+    def update_many(
+        self,
+        expense_filter: ExpenseFilter,
+        values: Mapping[str, Any],
+    ) -> int:
+        try:
+            return self._repo.update_many(expense_filter, values)
+        finally:
+            self._cache.clear()
+
+    def rebuild_rollups(self, dry_run: bool = False) -> Sequence[RollupKey]:
+        drifted = self._repo.rebuild_rollups(dry_run)
+
+        if drifted and not dry_run:
+            self._cache.clear()
+
+        return drifted
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything else could be a write the cache would not see.
+        if name not in UNCACHED_READS:
+            raise AttributeError(name)
+
+        return getattr(self._repo, name)
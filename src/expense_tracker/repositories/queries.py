@@ -0,0 +1,286 @@
+# pylint: disable=not-callable
+
+"""Argument checks and statements shared by the sync and async
+repositories, so both answer every query the same way."""
+
+from typing import Any, Iterable, Iterator, Mapping, Optional
+from itertools import islice
+from datetime import datetime
+
+from sqlalchemy import ColumnElement, Select, Subquery, func, select
+
+from ..categories import CATEGORIES, category_id_query
+from ..models import Expense, ExpenseRollup
+from ..money import from_cents, to_cents
+from ..periods import check_range, month_range
+from ..records import CategoryTotal, ExpenseFilter, ExpenseRecord, PeriodTotals
+
+
+EXPENSES = Expense.__table__
+
+
+UPDATABLE_FIELDS = frozenset({"description", "category", "amount", "date", "notes"})
+
+# Fields whose change moves an expense between rollup rows.
+ROLLUP_FIELDS = frozenset({"category", "amount", "date"})
+
+
+def check_expense_id(expense_id: int) -> None:
+    if not isinstance(expense_id, int):
+        raise ValueError("Task ID must be an integer.")
+
+    if expense_id < 1:
+        raise ValueError("Task ID must be greater than 0.")
+
+
+def check_expense(expense: Expense) -> None:
+    if not isinstance(expense, Expense):
+        raise TypeError("`expense` must be of type Expense.")
+
+
+def check_category(category: Optional[str]) -> None:
+    if category is not None and not isinstance(category, str):
+        raise TypeError('`category` must be a `str` or None')
+
+
+def check_batch_size(batch_size: int) -> None:
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError("`batch_size` must be an integer greater than 0.")
+
+
+def rollup_row(expense: Expense) -> tuple[datetime, Optional[int], float]:
+    return expense.date, expense.category_id, expense.amount
+
+
+def fill_dates(batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    now = datetime.now()
+    return [row if row.get("date") else {**row, "date": now} for row in batch]
+
+
+def batched(
+    rows: Iterable[dict[str, Any]],
+    batch_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(rows)
+
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def batch_rollup_rows(
+    batch: Iterable[dict[str, Any]]
+) -> Iterable[tuple[datetime, Optional[int], float]]:
+    """Rollup rows of a batch whose categories were already resolved with
+    `with_category_ids`."""
+    return ((row["date"], row.get("category_id"), row["amount"]) for row in batch)
+
+
+def filter_criteria(expense_filter: ExpenseFilter) -> list[ColumnElement[bool]]:
+    if not isinstance(expense_filter, ExpenseFilter):
+        raise TypeError("`expense_filter` must be of type ExpenseFilter.")
+
+    if all(value is None for value in expense_filter):
+        raise ValueError("`expense_filter` must set at least one criterion.")
+
+    ids, category, start, end, description = expense_filter
+    criteria = []
+
+    if ids is not None:
+        for expense_id in ids:
+            check_expense_id(expense_id)
+
+        criteria.append(Expense.id.in_(list(ids)))
+
+    check_category(category)
+
+    if category is not None:
+        criteria.append(Expense.category_id == category_id_query(category))
+
+    for bound in (start, end):
+        if bound is not None and not isinstance(bound, datetime):
+            raise TypeError("`start` and `end` must be of type datetime.")
+
+    if start is not None and end is not None:
+        check_range(start, end)
+
+    if start is not None:
+        criteria.append(Expense.date >= start)
+
+    if end is not None:
+        criteria.append(Expense.date < end)
+
+    if description is not None:
+        if not isinstance(description, str):
+            raise TypeError("`description` must be a `str` or None")
+
+        criteria.append(Expense.description.like(description))
+
+    return criteria
+
+
+def check_update_values(values: Mapping[str, Any]) -> dict[str, Any]:
+    if not values:
+        raise ValueError("`values` must set at least one field.")
+
+    if unknown := set(values) - UPDATABLE_FIELDS:
+        raise ValueError(f"Cannot update {', '.join(sorted(unknown))}.")
+
+    return dict(values)
+
+
+def record_query() -> Select:
+    """Core select of the `ExpenseRecord` columns, in field order, with the
+    category name joined on. Reads built on it return plain rows instead of
+    identity-mapped `Expense` instances."""
+    expenses = EXPENSES.c
+
+    return select(
+        expenses.id, expenses.description, CATEGORIES.c.name, expenses.amount,
+        expenses.date, expenses.notes,
+    ).outerjoin_from(EXPENSES, CATEGORIES, CATEGORIES.c.id == expenses.category_id)
+
+
+def expense_records(rows: Iterable[Any]) -> list[ExpenseRecord]:
+    return [ExpenseRecord._make(row) for row in rows]
+
+
+def get_many_query(ids: Iterable[int]) -> Select:
+    ids = list(ids)
+
+    for expense_id in ids:
+        check_expense_id(expense_id)
+
+    return record_query().where(EXPENSES.c.id.in_(ids)).order_by(EXPENSES.c.id)
+
+
+def list_query(
+    category: Optional[str],
+    limit: Optional[int],
+    after_id: Optional[int],
+) -> Select:
+    check_category(category)
+
+    if limit is not None and (not isinstance(limit, int) or limit < 1):
+        raise ValueError("`limit` must be an integer greater than 0.")
+
+    if after_id is not None and not isinstance(after_id, int):
+        raise ValueError("`after_id` must be an integer.")
+
+    expenses = EXPENSES.c
+    query = record_query()
+
+    if category is not None:
+        query = query.where(expenses.category_id == category_id_query(category))
+
+    if after_id is not None:
+        query = query.where(expenses.id > after_id)
+
+    query = query.order_by(expenses.id)
+
+    if limit is not None:
+        query = query.limit(limit)
+
+    return query
+
+
+def between_query(
+    start: datetime,
+    end: datetime,
+    category: Optional[str],
+) -> Select:
+    check_range(start, end)
+    check_category(category)
+
+    expenses = EXPENSES.c
+    query = (
+        record_query()
+        .where(expenses.date >= start)
+        .where(expenses.date < end)
+    )
+
+    if category is not None:
+        query = query.where(expenses.category_id == category_id_query(category))
+
+    return query.order_by(expenses.date, expenses.id)
+
+
+def category_summary_query(category: Optional[str]) -> Select:
+    check_category(category)
+
+    query = select(func.sum(ExpenseRollup.total), func.sum(ExpenseRollup.count))
+
+    if category:
+        query = query.where(ExpenseRollup.category_id == category_id_query(category))
+
+    return query
+
+
+def period_totals_query(
+    start: datetime,
+    end: datetime,
+    category: Optional[str],
+) -> Select:
+    check_range(start, end)
+    check_category(category)
+
+    totals = (
+        select(
+            Expense.category_id,
+            func.sum(Expense.amount).label("total"),
+            func.count(Expense.id).label("count"),
+        )
+        .where(Expense.date >= start)
+        .where(Expense.date < end)
+    )
+
+    if category is not None:
+        totals = totals.where(Expense.category_id == category_id_query(category))
+
+    return _with_category_names(totals.group_by(Expense.category_id).subquery())
+
+
+def monthly_totals_query(month: int, year: int) -> Select:
+    month_range(year, month)  # validates `month` and `year`
+
+    return _with_category_names(
+        select(ExpenseRollup.category_id, ExpenseRollup.total, ExpenseRollup.count)
+        .where(ExpenseRollup.year == year)
+        .where(ExpenseRollup.month == month)
+        .subquery()
+    )
+
+
+def _with_category_names(totals: Subquery) -> Select:
+    """(name, total, count) rows for (category_id, total, count) totals;
+    grouping is done on ids and names are joined onto the few result rows."""
+    return (
+        select(CATEGORIES.c.name, totals.c.total, totals.c.count)
+        .select_from(totals)
+        .outerjoin(CATEGORIES, CATEGORIES.c.id == totals.c.category_id)
+        .order_by(CATEGORIES.c.name.nulls_first())
+    )
+
+
+def summary_totals(values: Optional[tuple[Any, Any]]) -> tuple[float, int]:
+    if values is None:
+        return 0.0, 0
+
+    total, count = values
+    return total or 0.0, count or 0
+
+
+def period_totals(rows: Iterable[tuple[Optional[str], Any, int]]) -> PeriodTotals:
+    """Build `PeriodTotals` from (category, total, count) rows. Rollup rows
+    keep uncategorised expenses under `UNCATEGORISED`, which has no
+    `categories` row, so their name arrives here as NULL and is reported
+    as None."""
+    categories = [
+        CategoryTotal(category or None, total or 0.0, count)
+        for category, total, count in rows
+    ]
+
+    return PeriodTotals(
+        total=from_cents(sum(to_cents(c.total) for c in categories)),
+        count=sum(c.count for c in categories),
+        categories=categories,
+    )
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from sqlalchemy import BigInteger, Select, select, type_coerce
+from sqlalchemy.orm import Session
+
+from ..categories import CATEGORIES
+from ..models import Expense
+from ..snapshot import write_snapshot
+
+
+SNAPSHOT_BATCH_SIZE = 65_536
+
+
+def snapshot_query() -> Select:
+    """Expense rows in snapshot order, with amounts as stored cents."""
+    expenses = Expense.__table__.c
+
+    return (
+        select(
+            expenses.id,
+            expenses.description,
+            expenses.category_id,
+            type_coerce(expenses.amount, BigInteger),
+            expenses.date,
+            expenses.notes,
+        )
+        .order_by(expenses.date, expenses.id)
+    )
+
+
+def export_snapshot(
+    db: Session,
+    path: Path,
+    batch_size: int = SNAPSHOT_BATCH_SIZE,
+) -> int:
+    """Write every expense to a snapshot at ``path``. Rows are streamed from
+    one read transaction, so the snapshot is consistent."""
+    categories = dict(db.execute(select(CATEGORIES.c.id, CATEGORIES.c.name)).all())
+    rows = db.execute(snapshot_query().execution_options(yield_per=batch_size))
+
+    return write_snapshot(path, categories, rows.partitions())
@@ -1,14 +1,33 @@
-# pylint: disable=not-callable
+# pylint: disable=import-outside-toplevel
 
-from typing import Sequence, Optional, Callable
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Sequence, Optional, Callable
+from datetime import datetime
 from contextlib import AbstractContextManager
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import Select, insert
 from kink import inject
 
+from ..categories import with_category_ids
 from ..models import Expense
+from ..periods import month_range
 from ..protocols import ExpenseRepository
+from ..records import ExpenseFilter, ExpenseRecord, PeriodTotals, RollupKey
+from ..rollups import apply_rollup_deltas, rebuild_rollups, rollup_deltas
+from .batch import delete_matching, delete_row, update_matching, update_row
+from .queries import (
+    batch_rollup_rows, batched, between_query, category_summary_query,
+    check_batch_size, check_expense, check_expense_id, check_update_values,
+    expense_records, fill_dates, filter_criteria, get_many_query, list_query, monthly_totals_query,
+    period_totals, period_totals_query, rollup_row, summary_totals
+)
+
+if TYPE_CHECKING:
+    from ..analytics import ExpenseArrays
+
+
+BULK_BATCH_SIZE = 5_000
+ITER_BATCH_SIZE = 1_000
 
 
 @inject(alias=ExpenseRepository)
@@ -17,117 +36,238 @@ class SQLAlchemyExpenseRepository:
     ], AbstractContextManager[Session]]) -> None:
         self._db_context = db_session_context
 
-    def _expense_id_check(self, expense_id: int) -> None:
-        if not isinstance(expense_id, int):
-            raise ValueError("Task ID must be an integer.")
-
-        if expense_id < 1:
-            raise ValueError("Task ID must be greater than 0.")
-
-    def _expense_type_check(self, expense: Expense) -> None:
-        if not isinstance(expense, Expense):
-            raise TypeError("`expense` must be of type Expense.")
-
     def get(self, expense_id: int) -> Expense | None:
-        self._expense_id_check(expense_id)
+        check_expense_id(expense_id)
 
         with self._db_context() as db:
             return db.get(Expense, expense_id)
 
-    def add(self, expense: Expense) -> int | None:
-        self._expense_type_check(expense)
+    def get_many(self, expense_ids: Iterable[int]) -> Sequence[ExpenseRecord]:
+        query = get_many_query(expense_ids)
+
+        with self._db_context() as db:
+            return expense_records(db.execute(query))
+
+    def add(self, expense: Expense | ExpenseRecord) -> int | None:
+        if isinstance(expense, ExpenseRecord):
+            expense = Expense.from_record(expense)
+
+        check_expense(expense)
 
         with self._db_context() as db:
             db.add(expense)
+            db.flush()
+            apply_rollup_deltas(db, rollup_deltas([rollup_row(expense)]))
             db.commit()
             return expense.id
 
-    def bulk_import(self, expenses: Sequence[Expense]) -> int:
-        added_count = 0
+    def bulk_import(self, expenses: Iterable[Expense]) -> int:
+        added: list[Expense] = []
 
         with self._db_context() as db:
             for expense in expenses:
-                self._expense_type_check(expense)
+                check_expense(expense)
                 db.add(expense)
-                added_count += 1
+                added.append(expense)
 
+            db.flush()
+            apply_rollup_deltas(db, rollup_deltas(rollup_row(e) for e in added))
             db.commit()
 
+        added_count = len(added)
+
         return added_count
 
-    def category_summary(
+    def bulk_insert(
         self,
-        category: Optional[str] = None
-    ) -> tuple[float, int]:
-        if category is not None and not isinstance(category, str):
-            raise TypeError('`category` must be a `str` or None')
+        rows: Iterable[dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE,
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        check_batch_size(batch_size)
+
+        inserted_count = 0
+        statement = insert(Expense.__table__)
 
         with self._db_context() as db:
-            query = db.query(func.sum(Expense.amount), func.count())
+            for batch in batched(rows, batch_size):
+                batch = with_category_ids(db, fill_dates(batch))
+
+                db.execute(statement, batch)
+                apply_rollup_deltas(db, rollup_deltas(batch_rollup_rows(batch)))
+                db.commit()
+                inserted_count += len(batch)
 
-            if category:
-                category = category.lower().capitalize()
-                query = query.filter(Expense.category == category)
+                if on_batch is not None:
+                    on_batch(len(batch))
 
-            total, count = 0.0, 0
+        return inserted_count
 
-            if (values := query.first()) is not None:
-                total, count = values
-                total = total or 0.0
+    def category_summary(
+        self,
+        category: Optional[str] = None
+    ) -> tuple[float, int]:
+        query = category_summary_query(category)
 
-            return total, count
+        with self._db_context() as db:
+            return summary_totals(db.execute(query).first())
 
     def delete(self, task: Expense) -> None:
-        self._expense_type_check(task)
+        check_expense(task)
+
+        if task.id is not None:
+            self.delete_by_id(task.id)
+            return
 
         with self._db_context() as db:
             db.delete(task)
             db.commit()
 
+    def delete_by_id(self, expense_id: int) -> ExpenseRecord | None:
+        check_expense_id(expense_id)
+
+        with self._db_context() as db:
+            deleted = delete_row(db, expense_id)
+            db.commit()
+
+        return deleted
+
     def update(self, expense: Expense) -> None:
-        self._expense_type_check(expense)
+        check_expense(expense)
+
+        self.update_by_id(expense.id, {
+            "category": expense.category,
+            "description": expense.description,
+            "amount": expense.amount,
+            "date": expense.date,
+            "notes": expense.notes,
+        })
+
+    def update_by_id(
+        self,
+        expense_id: int,
+        values: Mapping[str, Any],
+    ) -> ExpenseRecord | None:
+        check_expense_id(expense_id)
+        values = check_update_values(values)
 
         with self._db_context() as db:
-            old_expense = db.get(Expense, expense.id)
+            updated = update_row(db, expense_id, values)
+            db.commit()
+
+        return updated
 
-            if old_expense is not None:
-                old_expense.category = expense.category
-                old_expense.description = expense.description
-                old_expense.amount = expense.amount
-                old_expense.date = expense.date
-                old_expense.notes = expense.notes
+    def delete_many(self, expense_filter: ExpenseFilter) -> int:
+        criteria = filter_criteria(expense_filter)
 
+        with self._db_context() as db:
+            deleted_count = delete_matching(db, criteria)
+            db.commit()
+
+        return deleted_count
+
+    def update_many(
+        self,
+        expense_filter: ExpenseFilter,
+        values: Mapping[str, Any],
+    ) -> int:
+        criteria = filter_criteria(expense_filter)
+        values = check_update_values(values)
+
+        with self._db_context() as db:
+            updated_count = update_matching(db, criteria, values)
             db.commit()
 
-    def list(self, category: Optional[str] = None) -> Sequence[Expense]:
-        if category is not None and not isinstance(category, str):
-            raise TypeError('`category` must be a `str` or None')
+        return updated_count
+
+    def list(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Sequence[ExpenseRecord]:
+        query = list_query(category, limit, after_id)
 
         with self._db_context() as db:
-            query = db.query(Expense)
+            return expense_records(db.execute(query))
 
-            if category is not None:
-                category = category.lower().capitalize()
-                query = query.filter(Expense.category == category)
+    def iter_expenses(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        batch_size: int = ITER_BATCH_SIZE,
+    ) -> Iterator[ExpenseRecord]:
+        check_batch_size(batch_size)
 
-            return query.all()
+        query = list_query(category, limit, after_id).execution_options(
+            yield_per=batch_size)
 
-    def monthly_summary(self, month: int, year: int) -> Sequence[Expense]:
-        if not isinstance(month, int):
-            raise ValueError("`month` must be type `int`.")
+        return self._stream(query)
 
-        if not isinstance(year, int):
-            raise ValueError("`year` must be type `int`.")
+    def _stream(self, query: Select) -> Iterator[ExpenseRecord]:
+        with self._db_context() as db:
+            yield from map(ExpenseRecord._make, db.execute(query))
 
-        if not 1 <= month <= 12:
-            raise ValueError("`month` must be between 1 and 12")
+    def between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> Sequence[ExpenseRecord]:
+        query = between_query(start, end, category)
 
         with self._db_context() as db:
-            expenses = (
-                db.query(Expense)
-                .filter(extract("year", Expense.date) == year)
-                .filter(extract("month", Expense.date) == month)
-                .all()
-            )
+            return expense_records(db.execute(query))
+
+    def iter_between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+        batch_size: int = ITER_BATCH_SIZE,
+    ) -> Iterator[ExpenseRecord]:
+        check_batch_size(batch_size)
+
+        query = between_query(start, end, category).execution_options(
+            yield_per=batch_size)
+
+        return self._stream(query)
+
+    def monthly_summary(self, month: int, year: int) -> Sequence[ExpenseRecord]:
+        return self.between(*month_range(year, month))
+
+    def period_totals(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> PeriodTotals:
+        query = period_totals_query(start, end, category)
+
+        with self._db_context() as db:
+            return period_totals(db.execute(query).all())
+
+    def monthly_totals(self, month: int, year: int) -> PeriodTotals:
+        query = monthly_totals_query(month, year)
+
+        with self._db_context() as db:
+            return period_totals(db.execute(query).all())
+
+    def expense_arrays(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> "ExpenseArrays":
+        from .arrays import load_expense_arrays
+
+        with self._db_context() as db:
+            return load_expense_arrays(db, start, end, category)
+
+    def rebuild_rollups(self, dry_run: bool = False) -> Sequence[RollupKey]:
+        with self._db_context() as db:
+            drifted = rebuild_rollups(db, dry_run)
+            db.commit()
 
-            return expenses
+        return drifted
@@ -0,0 +1,204 @@
+# pylint: disable=not-callable
+
+from datetime import datetime
+from collections import defaultdict
+from typing import Any, Iterable, Mapping, Optional
+
+from sqlalchemy import (
+    ColumnElement, Insert, Select, delete, extract, func, insert, select,
+    tuple_, update
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from .categories import CATEGORIES, UNCATEGORISED
+from .models import Expense, ExpenseRollup
+from .money import from_cents, to_cents
+from .records import RollupKey
+
+
+# (year, month, category id), as stored in the rollup table.
+RollupId = tuple[int, int, int]
+
+RollupDeltas = Mapping[RollupId, tuple[float, int]]
+
+ROLLUPS = ExpenseRollup.__table__
+
+
+def rollup_key(date: datetime, category_id: Optional[int]) -> RollupId:
+    return date.year, date.month, category_id or UNCATEGORISED
+
+
+def rollup_deltas(
+    rows: Iterable[tuple[datetime, Optional[int], float]],
+    sign: int = 1,
+) -> dict[RollupId, tuple[float, int]]:
+    """Fold ``(date, category_id, amount)`` rows into per-key deltas; use
+    ``sign=-1`` for rows being removed."""
+    deltas: dict[RollupId, tuple[int, int]] = defaultdict(lambda: (0, 0))
+
+    for date, category_id, amount in rows:
+        key = rollup_key(date, category_id)
+        cents, count = deltas[key]
+        deltas[key] = (cents + sign * to_cents(amount), count + sign)
+
+    return _from_cents(deltas)
+
+
+def merge_deltas(*deltas: RollupDeltas) -> dict[RollupId, tuple[float, int]]:
+    merged: dict[RollupId, tuple[int, int]] = defaultdict(lambda: (0, 0))
+
+    for delta in deltas:
+        for key, (total, count) in delta.items():
+            merged_cents, merged_count = merged[key]
+            merged[key] = (merged_cents + to_cents(total), merged_count + count)
+
+    return _from_cents(merged)
+
+
+def _from_cents(
+    deltas: Mapping[RollupId, tuple[int, int]]
+) -> dict[RollupId, tuple[float, int]]:
+    """Deltas are summed in cents so that totals stay exact."""
+    return {
+        key: (from_cents(cents), count) for key, (cents, count) in deltas.items()
+    }
+
+
+def apply_rollup_deltas(db: Session, deltas: RollupDeltas) -> None:
+    """Add ``deltas`` to the rollup rows in the caller's transaction, then
+    drop the rows among them that no longer count any expense."""
+    rows = [
+        {"year": year, "month": month, "category_id": category_id,
+         "total": total, "count": count}
+        for (year, month, category_id), (total, count) in deltas.items()
+        if count or total
+    ]
+
+    if not rows:
+        return
+
+    if (upsert := _upsert_rollups(db.get_bind().dialect.name)) is not None:
+        db.execute(upsert, rows)
+    else:
+        for row in rows:
+            _update_or_insert_rollup(db, row)
+
+    if shrunk := [key for key, (_, count) in deltas.items() if count < 0]:
+        db.execute(
+            delete(ROLLUPS)
+            .where(tuple_(ROLLUPS.c.year, ROLLUPS.c.month, ROLLUPS.c.category_id).in_(shrunk))
+            .where(ROLLUPS.c.count <= 0)
+        )
+
+
+def _upsert_rollups(dialect: str) -> Optional[Insert]:
+    """``INSERT ... ON CONFLICT DO UPDATE`` adding to an existing row, so
+    concurrent writers to a new key cannot collide on its primary key."""
+    dialect_insert = {"sqlite": sqlite.insert, "postgresql": postgresql.insert}.get(dialect)
+
+    if dialect_insert is None:
+        return None
+
+    statement = dialect_insert(ROLLUPS)
+
+    return statement.on_conflict_do_update(
+        index_elements=[ROLLUPS.c.year, ROLLUPS.c.month, ROLLUPS.c.category_id],
+        set_={
+            ROLLUPS.c.total: ROLLUPS.c.total + statement.excluded.total,
+            ROLLUPS.c.count: ROLLUPS.c.count + statement.excluded.count,
+        },
+    )
+
+
+def _update_or_insert_rollup(db: Session, row: dict[str, Any]) -> None:
+    """Fallback for dialects without an upsert we use."""
+    result = db.execute(
+        update(ROLLUPS)
+        .where(ROLLUPS.c.year == row["year"])
+        .where(ROLLUPS.c.month == row["month"])
+        .where(ROLLUPS.c.category_id == row["category_id"])
+        .values(
+            total=ROLLUPS.c.total + row["total"],
+            count=ROLLUPS.c.count + row["count"],
+        )
+    )
+
+    if not result.rowcount:
+        db.execute(insert(ROLLUPS).values(**row))
+
+
+def aggregate_rollups(*criteria: ColumnElement[bool]) -> Select:
+    """Recompute the rollup rows from the raw expenses table, optionally
+    for only the expenses matching ``criteria``."""
+    year = extract("year", Expense.date)
+    month = extract("month", Expense.date)
+    category_id = func.coalesce(Expense.category_id, UNCATEGORISED)
+
+    return (
+        select(year, month, category_id, func.sum(Expense.amount), func.count())
+        .where(*criteria)
+        .group_by(year, month, category_id)
+    )
+
+
+def matching_deltas(
+    db: Session,
+    criteria: Iterable[ColumnElement[bool]],
+    sign: int = 1,
+) -> dict[RollupId, tuple[float, int]]:
+    """Like `rollup_deltas`, but aggregated in SQL over the expenses that
+    match ``criteria`` so no rows are loaded."""
+    return {
+        (int(year), int(month), category_id): (sign * (total or 0.0), sign * count)
+        for year, month, category_id, total, count in db.execute(
+            aggregate_rollups(*criteria))
+    }
+
+
+def rebuild_rollups(db: Session, dry_run: bool = False) -> list[RollupKey]:
+    """Replace the rollup table with fresh aggregates and return the keys
+    whose stored values were missing, stale or orphaned, by category name."""
+    fresh = {
+        (int(year), int(month), category_id): (total or 0.0, count)
+        for year, month, category_id, total, count in db.execute(aggregate_rollups())
+    }
+    stored = {
+        (year, month, category_id): (total, count)
+        for year, month, category_id, total, count in db.execute(
+            select(ROLLUPS.c.year, ROLLUPS.c.month, ROLLUPS.c.category_id,
+                   ROLLUPS.c.total, ROLLUPS.c.count)
+        )
+    }
+
+    drifted = [
+        key for key in fresh.keys() | stored.keys()
+        if fresh.get(key) != stored.get(key)
+    ]
+
+    if not dry_run and drifted:
+        db.execute(delete(ROLLUPS))
+
+        if fresh:
+            db.execute(insert(ROLLUPS), [
+                {"year": year, "month": month, "category_id": category_id,
+                 "total": total, "count": count}
+                for (year, month, category_id), (total, count) in fresh.items()
+            ])
+
+    return _named_keys(db, drifted)
+
+
+def _named_keys(db: Session, keys: Iterable[RollupId]) -> list[RollupKey]:
+    keys = list(keys)
+    names = dict(db.execute(
+        select(CATEGORIES.c.id, CATEGORIES.c.name)
+        .where(CATEGORIES.c.id.in_({category_id for _, _, category_id in keys}))
+    ).all())
+
+    # Uncategorised keys have no name; they sort first within their month.
+    return sorted(
+        ((year, month, names.get(category_id)) for year, month, category_id in keys),
+        key=lambda key: (key[0], key[1], key[2] or ""),
+    )
+
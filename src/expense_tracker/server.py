@@ -0,0 +1,111 @@
+"""Server mode: keep a repository and its connection pool warm in one
+process and answer `RemoteExpenseRepository` calls over a Unix socket."""
+
+from os import umask, unlink
+from pathlib import Path
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from typing import Any, Callable
+
+from .protocols import ExpenseRepository
+from .models import Expense
+from .records import ExpenseFilter, ExpenseRecord
+from .remote import (
+    RESULT_DECODERS, STREAMED_METHODS, STREAM_BATCH_SIZE,
+    read_message, server_is_running, write_message
+)
+
+
+def _to_wire(value: Any) -> Any:
+    if hasattr(value, "to_record"):
+        return value.to_record()
+
+    if isinstance(value, list):
+        return [_to_wire(item) for item in value]
+
+    return value
+
+
+# How the arguments of served methods that take records or filters are
+# rebuilt from their JSON lists.
+ARGUMENT_DECODERS: dict[str, Callable[[list[Any]], list[Any]]] = {
+    "add": lambda args: [ExpenseRecord(*args[0])],
+    "bulk_import": lambda args: [
+        [Expense.from_record(ExpenseRecord(*row)) for row in args[0]]],
+    "delete_many": lambda args: [ExpenseFilter(*args[0])],
+    "update_many": lambda args: [ExpenseFilter(*args[0]), *args[1:]],
+}
+
+
+class ExpenseRequestHandler(StreamRequestHandler):
+    """Answers one JSON request per line until the client disconnects."""
+
+    server: "ExpenseServer"
+
+    def handle(self) -> None:
+        while (request := read_message(self.rfile)) is not None:
+            try:
+                self._dispatch(request)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                write_message(self.wfile, {"error": {
+                    "type": type(exc).__name__, "message": str(exc)}})
+
+    def _dispatch(self, request: dict[str, Any]) -> None:
+        method = request.get("method")
+        args = request.get("args", [])
+        kwargs = request.get("kwargs", {})
+
+        if method not in RESULT_DECODERS and method not in STREAMED_METHODS:
+            raise AttributeError(f"Unknown method {method!r}.")
+
+        if method in ARGUMENT_DECODERS:
+            args = ARGUMENT_DECODERS[method](args)
+
+        result = getattr(self.server.repository, method)(*args, **kwargs)
+
+        if method not in STREAMED_METHODS:
+            write_message(self.wfile, {"result": _to_wire(result)})
+            return
+
+        batch, count = [], 0
+
+        for expense in result:
+            batch.append(_to_wire(expense))
+
+            if len(batch) == STREAM_BATCH_SIZE:
+                write_message(self.wfile, {"items": batch})
+                count += len(batch)
+                batch = []
+
+        if batch:
+            write_message(self.wfile, {"items": batch})
+            count += len(batch)
+
+        write_message(self.wfile, {"result": count})
+
+
+class ExpenseServer(ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, repository: ExpenseRepository) -> None:
+        if Path(path).exists():
+            if server_is_running(path):
+                raise OSError(f"A server is already listening on {path}.")
+
+            unlink(path)
+
+        self.repository = repository
+        super().__init__(path, ExpenseRequestHandler)
+
+    def server_bind(self) -> None:
+        # The socket lives in the shared temp directory; create it owner-only
+        # rather than chmod it after bind, when others could already connect.
+        previous = umask(0o177)
+
+        try:
+            super().server_bind()
+        finally:
+            umask(previous)
+
+    def server_close(self) -> None:
+        super().server_close()
+        Path(self.server_address).unlink(missing_ok=True)
@@ -0,0 +1,247 @@
+from pathlib import Path
+from datetime import datetime
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional, Sequence
+from kink import inject
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from ..models import Expense
+from ..records import ExpenseRecord
+
+
+IMPORT_CHUNK_SIZE = 50_000
+EXPORT_BATCH_SIZE = 65_536
+IMPORT_COLUMNS = ("description", "amount", "category", "notes", "date")
+
+# Parquet for archives (compressed, dictionary-encoded categories), Arrow
+# IPC for files that are read back memory-mapped.
+FILE_FORMATS = ("parquet", "arrow")
+
+EXPENSE_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("description", pa.string()),
+    ("category", pa.dictionary(pa.int32(), pa.string())),
+    ("amount", pa.float64()),
+    ("date", pa.timestamp("us")),
+    ("notes", pa.string()),
+])
+
+# IPC files allow a single dictionary per column for the whole file, and
+# batches are written as they are built, so categories stay plain strings.
+IPC_EXPENSE_SCHEMA = EXPENSE_SCHEMA.set(
+    EXPENSE_SCHEMA.get_field_index("category"), pa.field("category", pa.string()))
+
+SUMMARY_SCHEMA = pa.schema([
+    ("category", pa.string()),
+    ("total", pa.float64()),
+    ("entries", pa.int64()),
+    ("exported_on", pa.timestamp("us")),
+])
+
+
+@inject
+class ArrowFileService:
+    """Reads and writes expenses as typed Parquet or Arrow IPC files, in
+    record batches so exports and imports of large ledgers stream."""
+
+    def __init__(self, file_format: str = "parquet") -> None:
+        if file_format not in FILE_FORMATS:
+            raise ValueError(
+                f"`file_format` must be one of: {', '.join(FILE_FORMATS)}.")
+
+        self._format = file_format
+        self._expense_schema = (
+            EXPENSE_SCHEMA if file_format == "parquet" else IPC_EXPENSE_SCHEMA)
+
+    def export_expenses(
+        self,
+        expenses: Iterable[Expense | ExpenseRecord],
+        directory: Path,
+        filename: Optional[str] = None,
+    ) -> None:
+        export_path = self._export_path(
+            directory, filename or f"expenses_{_timestamp()}")
+        self._write(
+            export_path,
+            self._expense_schema,
+            _expense_batches(expenses, self._expense_schema),
+        )
+
+    def export_summary(
+        self,
+        category: Optional[str],
+        total: float,
+        count: int,
+        directory: Path,
+        filename: Optional[str] = None,
+        exported_on: Optional[datetime] = None,
+    ) -> None:
+        export_path = self._export_path(
+            directory, filename or f"summary_{_timestamp()}")
+        batch = pa.record_batch([
+            [category or "All"],
+            [total],
+            [count],
+            [exported_on or datetime.now()],
+        ], schema=SUMMARY_SCHEMA)
+
+        self._write(export_path, SUMMARY_SCHEMA, [batch])
+
+    def export_monthly_summary(
+        self,
+        expenses: Iterable[Expense | ExpenseRecord],
+        total: float,
+        year: int,
+        month: int,
+        directory: Path,
+        filename: Optional[str] = None,
+    ) -> None:
+        export_path = self._export_path(
+            directory, filename or f"monthly_{year}_{month:02d}_{_timestamp()}")
+
+        # The CSV report appends a total row; typed files keep it as metadata.
+        schema = self._expense_schema.with_metadata({
+            "year": str(year), "month": str(month), "total": repr(total),
+        })
+        self._write(export_path, schema, _expense_batches(expenses, schema))
+
+    def import_expenses(self, file: Path) -> Sequence[Expense]:
+        return [
+            Expense(**row)
+            for batch in self.iter_import_batches(file)
+            for row in batch
+        ]
+
+    def iter_import_batches(
+        self,
+        file: Path,
+        chunksize: int = IMPORT_CHUNK_SIZE,
+    ) -> Iterator[list[dict[str, Any]]]:
+        if not file.exists():
+            raise FileNotFoundError(f"Could not locate file at {file}.")
+
+        if chunksize < 1:
+            raise ValueError("`chunksize` must be greater than 0.")
+
+        schema = self._read_schema(file)
+
+        required_columns = {"description", "amount"}
+        lower_columns = {name.lower(): name for name in schema.names}
+
+        if not required_columns.issubset(lower_columns.keys()):
+            raise ValueError(
+                f"File must contain required columns: {','.join(required_columns)}")
+
+        columns = {
+            name: lower_columns[name]
+            for name in IMPORT_COLUMNS
+            if name in lower_columns
+        }
+
+        return self._read_batches(file, columns, chunksize)
+
+    def _export_path(self, directory: Path, filename: str) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f"{filename}.{self._format}"
+
+    def _write(
+        self,
+        path: Path,
+        schema: pa.Schema,
+        batches: Iterable[pa.RecordBatch],
+    ) -> None:
+        if self._format == "parquet":
+            with pq.ParquetWriter(path, schema) as writer:
+                for batch in batches:
+                    writer.write_batch(batch)
+        else:
+            with pa.OSFile(str(path), "wb") as sink:
+                with pa.ipc.new_file(sink, schema) as writer:
+                    for batch in batches:
+                        writer.write_batch(batch)
+
+    def _read_schema(self, file: Path) -> pa.Schema:
+        if self._format == "parquet":
+            return pq.read_schema(file)
+
+        with pa.memory_map(str(file)) as source:
+            return pa.ipc.open_file(source).schema
+
+    def _read_batches(
+        self,
+        file: Path,
+        columns: dict[str, str],
+        chunksize: int,
+    ) -> Iterator[list[dict[str, Any]]]:
+        imported_on = datetime.now()
+
+        if self._format == "parquet":
+            batches = pq.ParquetFile(file).iter_batches(
+                batch_size=chunksize, columns=list(columns.values()))
+
+            for batch in batches:
+                yield _normalize_batch(batch, columns, imported_on)
+
+            return
+
+        with pa.memory_map(str(file)) as source:
+            reader = pa.ipc.open_file(source)
+
+            for index in range(reader.num_record_batches):
+                batch = reader.get_batch(index).select(list(columns.values()))
+
+                for offset in range(0, batch.num_rows, chunksize):
+                    yield _normalize_batch(
+                        batch.slice(offset, chunksize), columns, imported_on)
+
+
+def _timestamp() -> str:
+    return datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
+
+
+def _expense_batches(
+    expenses: Iterable[Expense | ExpenseRecord],
+    schema: pa.Schema,
+) -> Iterator[pa.RecordBatch]:
+    iterator = iter(expenses)
+
+    while chunk := list(islice(iterator, EXPORT_BATCH_SIZE)):
+        yield pa.record_batch([
+            [e.id for e in chunk],
+            [e.description for e in chunk],
+            [e.category for e in chunk],
+            [e.amount for e in chunk],
+            [e.date for e in chunk],
+            [e.notes for e in chunk],
+        ], schema=schema)
+
+
+def _normalize_batch(
+    batch: pa.RecordBatch,
+    columns: dict[str, str],
+    imported_on: datetime,
+) -> list[dict[str, Any]]:
+    """Turn a batch into rows for `bulk_insert`. Unlike CSV, typed files
+    keep their `date` column; rows without one get the import time."""
+    arrays = {}
+
+    for name in ("description", "category", "notes"):
+        if name in columns:
+            arrays[name] = batch.column(columns[name]).cast(pa.string())
+        else:
+            arrays[name] = pa.nulls(batch.num_rows, pa.string())
+
+    arrays["amount"] = pc.fill_null(
+        batch.column(columns["amount"]).cast(pa.float64()), 0.0)
+
+    if "date" in columns:
+        dates = batch.column(columns["date"]).cast(pa.timestamp("us"))
+        arrays["date"] = pc.fill_null(dates, pa.scalar(imported_on, pa.timestamp("us")))
+    else:
+        arrays["date"] = pa.array(
+            [imported_on] * batch.num_rows, pa.timestamp("us"))
+
+    return pa.record_batch(list(arrays.values()), names=list(arrays)).to_pylist()
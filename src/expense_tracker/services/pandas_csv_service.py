@@ -1,18 +1,24 @@
+import csv
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Sequence
+from typing import Any, Iterable, Iterator, Optional, Sequence
 from kink import inject
 
 import pandas as pd
 from ..models import Expense
 from ..protocols import ExpenseCSVService
+from ..records import ExpenseRecord
+
+
+IMPORT_CHUNK_SIZE = 50_000
+IMPORT_COLUMNS = ("description", "amount", "category", "notes")
 
 
 @inject(alias=ExpenseCSVService)
 class PandasCSVService:
     def export_expenses(
         self,
-        expenses: list[Expense],
+        expenses: Iterable[Expense | ExpenseRecord],
         directory: Path,
         filename: Optional[str] = None,
     ) -> None:
@@ -25,19 +31,21 @@ class PandasCSVService:
         filename = f"{filename}.csv"
         export_path = directory / filename
 
-        data = [
-            {
-                "ID": e.id,
-                "Description": e.description,
-                "Category": e.category or "",
-                "Amount": e.amount,
-                "Date": e.date.strftime("%Y-%m-%d"),
-                "Notes": e.notes or "",
-            }
-            for e in expenses
-        ]
-
-        pd.DataFrame(data).to_csv(export_path, index=False)
+        with export_path.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(
+                ["ID", "Description", "Category", "Amount", "Date", "Notes"])
+            writer.writerows(
+                (
+                    e.id,
+                    e.description,
+                    e.category or "",
+                    e.amount,
+                    e.date.strftime("%Y-%m-%d"),
+                    e.notes or "",
+                )
+                for e in expenses
+            )
 
     def export_summary(
         self,
@@ -57,22 +65,19 @@ class PandasCSVService:
         filename = f"{filename}.csv"
         export_path = directory / filename
 
-        data = [
-            {
-                "Category": category or "All",
-                "Total": total,
-                "Entries": count,
-                "Exported On": (exported_on or datetime.now()).strftime(
-                    "%Y-%m-%d %H:%M:%S"
-                ),
-            }
-        ]
-
-        pd.DataFrame(data).to_csv(export_path, index=False)
+        with export_path.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["Category", "Total", "Entries", "Exported On"])
+            writer.writerow([
+                category or "All",
+                total,
+                count,
+                (exported_on or datetime.now()).strftime("%Y-%m-%d %H:%M:%S"),
+            ])
 
     def export_monthly_summary(
         self,
-        expenses: list[Expense],
+        expenses: Iterable[Expense | ExpenseRecord],
         total: float,
         year: int,
         month: int,
@@ -88,49 +93,88 @@ class PandasCSVService:
         filename = f"{filename}.csv"
         export_path = directory / filename
 
-        df = pd.DataFrame(
-            [
-                {
-                    "ID": e.id,
-                    "Description": e.description,
-                    "Category": e.category or "",
-                    "Amount": e.amount,
-                    "Date": e.date.strftime("%Y-%m-%d"),
-                }
+        with export_path.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["ID", "Description", "Category", "Amount", "Date"])
+            writer.writerows(
+                (
+                    e.id,
+                    e.description,
+                    e.category or "",
+                    e.amount,
+                    e.date.strftime("%Y-%m-%d"),
+                )
                 for e in expenses
-            ]
-        )
-
-        df.loc[len(df)] = {"ID": "", "Description": "Total", "Amount": total}
-        df.to_csv(export_path, index=False)
+            )
+            writer.writerow(["", "Total", "", total, ""])
 
     def import_expenses(self, file: Path) -> Sequence[Expense]:
-        expenses = []
+        return [
+            Expense(**row)
+            for batch in self.iter_import_batches(file)
+            for row in batch
+        ]
 
+    def iter_import_batches(
+        self,
+        file: Path,
+        chunksize: int = IMPORT_CHUNK_SIZE,
+    ) -> Iterator[list[dict[str, Any]]]:
         if not file.exists():
             raise FileNotFoundError(f"Could not locate file at {file}.")
 
-        df = pd.read_csv(file)
+        if chunksize < 1:
+            raise ValueError("`chunksize` must be greater than 0.")
+
+        header = pd.read_csv(file, nrows=0)
 
         required_columns = {"description", "amount"}
-        lower_columns = {col.lower(): col for col in df.columns}
+        lower_columns = {col.lower(): col for col in header.columns}
 
         if not required_columns.issubset(lower_columns.keys()):
             raise ValueError(
                 f"File must contain required columns: {','.join(required_columns)}")
 
-        for _, row in df.iterrows():
-            expense = Expense(
-                description=row.get(lower_columns.get("description")),
-                amount=float(row.get(lower_columns.get("amount")) or 0.0),
-                category=row.get(lower_columns.get("category"))
-                if "category" in lower_columns
-                else None,
-                notes=row.get(lower_columns.get("notes"))
-                if "notes" in lower_columns
-                else None,
-                date=datetime.now(),
-            )
-            expenses.append(expense)
+        columns = {
+            name: lower_columns[name]
+            for name in IMPORT_COLUMNS
+            if name in lower_columns
+        }
+
+        return self._read_batches(file, columns, chunksize)
+
+    def _read_batches(
+        self,
+        file: Path,
+        columns: dict[str, str],
+        chunksize: int,
+    ) -> Iterator[list[dict[str, Any]]]:
+        imported_on = datetime.now()
+
+        with pd.read_csv(
+            file, usecols=list(columns.values()), chunksize=chunksize
+        ) as reader:
+            for chunk in reader:
+                yield self._normalize_chunk(chunk, columns, imported_on)
+
+    def _normalize_chunk(
+        self,
+        chunk: pd.DataFrame,
+        columns: dict[str, str],
+        imported_on: datetime,
+    ) -> list[dict[str, Any]]:
+        frame = pd.DataFrame(index=chunk.index)
+
+        for name in ("description", "category", "notes"):
+            if name in columns:
+                values = chunk[columns[name]].astype(object)
+                frame[name] = values.where(values.notna(), None)
+            else:
+                frame[name] = None
+
+        frame["amount"] = (
+            pd.to_numeric(chunk[columns["amount"]]).fillna(0.0).astype(float)
+        )
+        frame["date"] = pd.Series(imported_on, index=chunk.index, dtype=object)
 
-        return expenses
+        return frame.to_dict("records")
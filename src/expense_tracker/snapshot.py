@@ -0,0 +1,385 @@
+"""Read-only snapshots of the expenses table as memory-mapped Arrow IPC
+files, for reporting on closed periods without touching the database.
+
+A snapshot is sorted by (date, id), so a date range is a zero-copy slice
+found by binary search, and categories are dictionary-encoded against the
+whole `categories` table, so a category filter compares integer codes.
+Amounts are stored in cents and summed exactly.
+
+Needs the arrow extras: ``pip install expense-tracker[arrow]``.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .analytics import ExpenseArrays
+from .categories import normalize_category
+from .errors import ReadOnlySnapshotError, SnapshotNotFoundError
+from .money import CENTS
+from .periods import check_range, month_range
+from .records import CategoryTotal, ExpenseFilter, ExpenseRecord, PeriodTotals
+
+
+ITER_BATCH_SIZE = 1_000
+
+SNAPSHOT_SCHEMA = pa.schema([
+    ("id", pa.int64()),
+    ("description", pa.string()),
+    ("category", pa.dictionary(pa.int32(), pa.string())),
+    ("amount_cents", pa.int64()),
+    ("date", pa.timestamp("us")),
+    ("notes", pa.string()),
+])
+
+
+def write_snapshot(
+    path: Path,
+    categories: Mapping[int, str],
+    batches: Iterable[Sequence[Sequence[Any]]],
+) -> int:
+    """Write (id, description, category_id, amount_cents, date, notes) rows,
+    already in (date, id) order, to ``path`` and return the row count.
+
+    The file is written next to ``path`` and moved into place, so readers
+    holding a mapping of the previous snapshot keep a consistent view.
+    """
+    category_ids = sorted(categories)
+    dictionary = pa.array([categories[i] for i in category_ids], pa.string())
+
+    # Category id -> dictionary code; -1 marks ids missing from the table.
+    codes = np.full(max(category_ids, default=0) + 1, -1, dtype=np.int32)
+    codes[category_ids] = np.arange(len(category_ids), dtype=np.int32)
+
+    partial = path.with_name(f".{path.name}.partial")
+    row_count = 0
+
+    try:
+        with pa.OSFile(str(partial), "wb") as sink:
+            with pa.ipc.new_file(sink, SNAPSHOT_SCHEMA) as writer:
+                for batch in batches:
+                    ids, descriptions, category_column, cents, dates, notes = zip(*batch)
+                    writer.write_batch(pa.record_batch([
+                        pa.array(ids, pa.int64()),
+                        pa.array(descriptions, pa.string()),
+                        _category_codes(category_column, codes, dictionary),
+                        pa.array(cents, pa.int64()),
+                        pa.array(dates, pa.timestamp("us")),
+                        pa.array(notes, pa.string()),
+                    ], schema=SNAPSHOT_SCHEMA))
+                    row_count += len(ids)
+
+        partial.replace(path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+    return row_count
+
+
+def _category_codes(
+    category_ids: Sequence[Optional[int]],
+    codes: np.ndarray,
+    dictionary: pa.Array,
+) -> pa.DictionaryArray:
+    ids = np.array([-1 if i is None else i for i in category_ids], dtype=np.int64)
+    known = (ids >= 0) & (ids < len(codes))
+    indices = np.where(known, codes[np.where(known, ids, 0)], -1)
+
+    return pa.DictionaryArray.from_arrays(
+        pa.array(indices, pa.int32(), mask=indices < 0), dictionary)
+
+
+class SnapshotExpenseRepository:
+    """`ExpenseRepository` answering reads from a snapshot file.
+
+    The file is memory-mapped on first use and never copied as a whole:
+    filters run vectorized over the mapped columns and only the selected
+    rows are turned into `ExpenseRecord` objects. Every write raises
+    `ReadOnlySnapshotError`.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._table: Optional[pa.Table] = None
+
+    @property
+    def table(self) -> pa.Table:
+        if self._table is None:
+            if not self._path.exists():
+                raise SnapshotNotFoundError(
+                    f"Could not locate snapshot at {self._path}. "
+                    "Create it with `expense-tracker snapshot` or unset "
+                    "EXPENSE_TRACKER_SNAPSHOT.")
+
+            # The table's buffers point into the mapping, which stays open
+            # for as long as they are referenced.
+            with pa.memory_map(str(self._path)) as source:
+                self._table = pa.ipc.open_file(source).read_all()
+
+        return self._table
+
+    def get(self, expense_id: int) -> Optional[ExpenseRecord]:
+        rows = self.table.filter(pc.equal(self.table.column("id"), expense_id))
+        return next(iter(_records(rows)), None)
+
+    def get_many(self, expense_ids: Iterable[int]) -> Sequence[ExpenseRecord]:
+        ids = pa.array(list(expense_ids), pa.int64())
+        rows = self.table.filter(pc.is_in(self.table.column("id"), ids))
+        return _records(rows.sort_by("id"))
+
+    def list(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> Sequence[ExpenseRecord]:
+        return _records(self._by_id(category, limit, after_id))
+
+    def iter_expenses(
+        self,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        batch_size: int = ITER_BATCH_SIZE,
+    ) -> Iterator[ExpenseRecord]:
+        _check_batch_size(batch_size)
+        return _iter_records(self._by_id(category, limit, after_id), batch_size)
+
+    def category_summary(
+        self,
+        category: Optional[str] = None,
+    ) -> tuple[float, int]:
+        amounts = self.table.column("amount_cents")
+
+        if (mask := self._category_mask(self.table, category)) is not None:
+            amounts = amounts.filter(mask)
+
+        return (pc.sum(amounts).as_py() or 0) / CENTS, len(amounts)
+
+    def between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> Sequence[ExpenseRecord]:
+        return _records(self._between(start, end, category))
+
+    def iter_between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+        batch_size: int = ITER_BATCH_SIZE,
+    ) -> Iterator[ExpenseRecord]:
+        _check_batch_size(batch_size)
+        return _iter_records(self._between(start, end, category), batch_size)
+
+    def monthly_summary(self, month: int, year: int) -> Sequence[ExpenseRecord]:
+        return self.between(*month_range(year, month))
+
+    def period_totals(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> PeriodTotals:
+        rows = self._between(start, end, category)
+        totals = rows.group_by("category").aggregate([
+            ("amount_cents", "sum"),
+            ("id", "count"),
+        ])
+
+        categories = sorted(
+            (
+                CategoryTotal(name, cents / CENTS, count)
+                for name, cents, count in zip(
+                    totals.column("category").to_pylist(),
+                    totals.column("amount_cents_sum").to_pylist(),
+                    totals.column("id_count").to_pylist(),
+                )
+            ),
+            key=lambda c: (c.category is not None, c.category or ""),
+        )
+
+        return PeriodTotals(
+            total=(pc.sum(rows.column("amount_cents")).as_py() or 0) / CENTS,
+            count=rows.num_rows,
+            categories=categories,
+        )
+
+    def monthly_totals(self, month: int, year: int) -> PeriodTotals:
+        return self.period_totals(*month_range(year, month))
+
+    def expense_arrays(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str] = None,
+    ) -> ExpenseArrays:
+        rows = self._between(start, end, category)
+        chunks = rows.column("category").chunks
+        dictionary = chunks[0].dictionary.to_pylist() if chunks else []
+
+        # Dictionary codes shift up by one so code 0 is uncategorised.
+        codes = pa.chunked_array([chunk.indices for chunk in chunks], pa.int32())
+        codes = pc.add(pc.fill_null(codes, -1), 1)
+
+        return ExpenseArrays(
+            rows.column("id").to_numpy(),
+            rows.column("amount_cents").to_numpy(),
+            rows.column("date").to_numpy(),
+            codes.to_numpy().astype(np.int32, copy=False),
+            (None, *dictionary),
+        )
+
+    def add(self, expense: Any) -> int:
+        raise self._read_only()
+
+    def bulk_import(self, expenses: Iterable[Any]) -> int:
+        raise self._read_only()
+
+    def bulk_insert(
+        self,
+        rows: Iterable[dict[str, Any]],
+        batch_size: int = 0,
+        on_batch: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        raise self._read_only()
+
+    def delete(self, expense: Any) -> None:
+        raise self._read_only()
+
+    def update(self, expense: Any) -> None:
+        raise self._read_only()
+
+    def delete_by_id(self, expense_id: int) -> Optional[ExpenseRecord]:
+        raise self._read_only()
+
+    def update_by_id(
+        self,
+        expense_id: int,
+        values: Mapping[str, Any],
+    ) -> Optional[ExpenseRecord]:
+        raise self._read_only()
+
+    def delete_many(self, expense_filter: ExpenseFilter) -> int:
+        raise self._read_only()
+
+    def update_many(
+        self,
+        expense_filter: ExpenseFilter,
+        values: Mapping[str, Any],
+    ) -> int:
+        raise self._read_only()
+
+    def rebuild_rollups(self, dry_run: bool = False) -> Sequence[Any]:
+        raise self._read_only()
+
+    def _read_only(self) -> ReadOnlySnapshotError:
+        return ReadOnlySnapshotError(
+            f"The snapshot at {self._path} is read-only. "
+            "Unset EXPENSE_TRACKER_SNAPSHOT to change expenses.")
+
+    def _by_id(
+        self,
+        category: Optional[str],
+        limit: Optional[int],
+        after_id: Optional[int],
+    ) -> pa.Table:
+        if limit is not None and (not isinstance(limit, int) or limit < 1):
+            raise ValueError("`limit` must be an integer greater than 0.")
+
+        if after_id is not None and not isinstance(after_id, int):
+            raise ValueError("`after_id` must be an integer.")
+
+        rows = self._with_category(self.table, category)
+
+        if after_id is not None:
+            rows = rows.filter(pc.greater(rows.column("id"), after_id))
+
+        if limit is None:
+            return rows.sort_by("id")
+
+        return rows.take(pc.select_k_unstable(rows, limit, [("id", "ascending")]))
+
+    def _between(
+        self,
+        start: datetime,
+        end: datetime,
+        category: Optional[str],
+    ) -> pa.Table:
+        check_range(start, end)
+
+        dates = self.table.column("date")
+        first, last = _search(dates, start), _search(dates, end)
+
+        return self._with_category(self.table.slice(first, last - first), category)
+
+    def _with_category(self, rows: pa.Table, category: Optional[str]) -> pa.Table:
+        mask = self._category_mask(rows, category)
+        return rows if mask is None else rows.filter(mask)
+
+    def _category_mask(
+        self,
+        rows: pa.Table,
+        category: Optional[str],
+    ) -> Optional[pa.ChunkedArray]:
+        """Rows of ``category``, found by comparing dictionary codes, or
+        None when no category is given."""
+        if category is None:
+            return None
+
+        if not isinstance(category, str):
+            raise TypeError('`category` must be a `str` or None')
+
+        chunks = rows.column("category").chunks
+        codes = pa.chunked_array([chunk.indices for chunk in chunks], pa.int32())
+        code = -1
+
+        if chunks:
+            code = chunks[0].dictionary.index(normalize_category(category)).as_py()
+
+        # A missing category's -1 never equals a code, so nothing matches.
+        return pc.fill_null(pc.equal(codes, code), False)
+
+
+def _search(column: pa.ChunkedArray, value: datetime) -> int:
+    """Position of the first row at or after ``value`` in a sorted column.
+    Each chunk is searched as a NumPy view of the mapped buffer."""
+    target = np.datetime64(value, "us")
+
+    return sum(
+        int(np.searchsorted(chunk.to_numpy(zero_copy_only=True), target))
+        for chunk in column.chunks
+    )
+
+
+def _check_batch_size(batch_size: int) -> None:
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError("`batch_size` must be an integer greater than 0.")
+
+
+def _records(rows: pa.Table) -> list[ExpenseRecord]:
+    amounts = (rows.column("amount_cents").to_numpy() / CENTS).tolist()
+
+    return [
+        ExpenseRecord(*row)
+        for row in zip(
+            rows.column("id").to_pylist(),
+            rows.column("description").to_pylist(),
+            rows.column("category").to_pylist(),
+            amounts,
+            rows.column("date").to_pylist(),
+            rows.column("notes").to_pylist(),
+        )
+    ]
+
+
+def _iter_records(rows: pa.Table, batch_size: int) -> Iterator[ExpenseRecord]:
+    for offset in range(0, rows.num_rows, batch_size):
+        yield from _records(rows.slice(offset, batch_size))
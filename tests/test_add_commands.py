@@ -2,13 +2,18 @@
 # pylint: disable=unused-argument
 # pylint: disable=wrong-import-order
 
+from multiprocessing import active_children
 from pathlib import Path
+from kink import di
 from typer.testing import CliRunner
 import pandas as pd
 
-from .utils import TestingSessionLocal, test_expense
+from .utils import TestingSessionLocal, clear_expenses, override_get_db, test_expense
+from src.expense_tracker.bootstrap import initialize
 from src.expense_tracker.models import Expense
 from src.expense_tracker.cli import app
+from src.expense_tracker.protocols import ExpenseRepository
+from src.expense_tracker.repositories import SQLAlchemyExpenseRepository
 
 
 runner = CliRunner()
@@ -56,6 +61,56 @@ def test_bulk_import_success(tmp_path: Path):
         assert "Lunch" in descriptions
 
 
+def test_bulk_import_columnar_engine(tmp_path: Path):
+    clear_expenses()
+
+    csv_path = tmp_path / "expenses.csv"
+    pd.DataFrame(
+        [
+            {"Description": "Coffee", "Amount": 3.50, "Category": "Food"},
+            {"Description": "Lunch", "Amount": 12.00, "Category": "Food"},
+            {"Description": "Bus", "Amount": 2.75, "Category": "Transport"},
+        ]
+    ).to_csv(csv_path, index=False)
+
+    result = runner.invoke(
+        app, ["bulk", str(csv_path), "--engine", "columnar", "--chunk-size", "2"])
+
+    assert result.exit_code == 0
+    assert "3 expenses added" in result.stdout
+
+    with TestingSessionLocal() as db:
+        expenses = db.query(Expense).all()
+        assert len(expenses) == 3
+        assert {e.description for e in expenses} == {"Coffee", "Lunch", "Bus"}
+
+
+def test_bulk_import_multiple_files(tmp_path: Path):
+    clear_expenses()
+
+    exports = tmp_path / "exports"
+    exports.mkdir()
+
+    for month in range(1, 4):
+        pd.DataFrame(
+            [{"Description": f"Rent {month}", "Amount": 900.0, "Category": "Rent"}]
+        ).to_csv(exports / f"bank_{month}.csv", index=False)
+
+    result = runner.invoke(app, ["bulk", str(exports), "--workers", "2"])
+
+    assert result.exit_code == 0
+    assert "1 expenses added from bank_1.csv" in result.stdout
+    assert "3 expenses added from 3 of 3 files" in result.stdout
+
+    result = runner.invoke(app, ["bulk", str(exports / "bank_[12].csv")])
+
+    assert result.exit_code == 0
+    assert "2 expenses added from 2 of 2 files" in result.stdout
+
+    with TestingSessionLocal() as db:
+        assert db.query(Expense).count() == 5
+
+
 def test_bulk_import_missing_file(tmp_path: Path):
     missing_file = tmp_path / "does_not_exist.csv"
     result = runner.invoke(app, ["bulk", str(missing_file)])
@@ -84,3 +139,46 @@ def test_bulk_import_empty_csv(tmp_path: Path):
 
     assert result.exit_code == 0
     assert "0 expenses" in result.output
+
+
+def test_bulk_import_reports_rows_added_before_a_failure(tmp_path: Path):
+    clear_expenses()
+
+    csv_path = tmp_path / "expenses.csv"
+    csv_path.write_text(
+        "Description,Amount\nCoffee,3.50\nLunch,12.00\nBus,not a number\n")
+
+    result = runner.invoke(app, ["bulk", str(csv_path), "--chunk-size", "2"])
+
+    assert result.exit_code == 2
+    assert "2 expenses from batches before the failure were added" in result.output
+
+    with TestingSessionLocal() as db:
+        assert db.query(Expense).count() == 2
+
+    clear_expenses()
+
+
+class FailingRepository(SQLAlchemyExpenseRepository):
+    def bulk_insert(self, rows, batch_size=5_000, on_batch=None):
+        raise RuntimeError("disk full")
+
+
+def test_bulk_import_shuts_workers_down_before_reporting_a_failure(tmp_path: Path):
+    clear_expenses()
+
+    for month in range(1, 3):
+        pd.DataFrame(
+            [{"Description": f"Rent {month}", "Amount": 900.0, "Category": "Rent"}]
+        ).to_csv(tmp_path / f"bank_{month}.csv", index=False)
+
+    di[ExpenseRepository] = FailingRepository(override_get_db)
+
+    try:
+        result = runner.invoke(app, ["bulk", str(tmp_path), "--workers", "2"])
+    finally:
+        initialize()
+
+    assert result.exit_code == 2
+    assert "disk full" in result.output
+    assert not active_children()
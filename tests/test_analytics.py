@@ -0,0 +1,146 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=wrong-import-order
+
+from datetime import datetime
+
+import numpy as np
+from pytest import approx, fixture, mark
+
+from .utils import clear_expenses, override_get_db
+from src.expense_tracker import analytics
+from src.expense_tracker.analytics import ExpenseArrays
+from src.expense_tracker.records import ExpenseRecord
+from src.expense_tracker.repositories import SQLAlchemyExpenseRepository
+
+
+# (id, cents, date, category code); 2024-01-01 was a Monday.
+ROWS = [
+    (1, 120000, datetime(2024, 1, 1), 1),
+    (2, 5230, datetime(2024, 1, 5), 2),
+    (3, 1210, datetime(2024, 1, 20), 0),
+    (4, 4795, datetime(2024, 3, 3), 2),
+    (5, 1800, datetime(2024, 3, 14), 3),
+    (6, 120000, datetime(2024, 3, 1), 1),
+]
+
+
+@fixture
+def arrays() -> ExpenseArrays:
+    ids, cents, dates, codes = zip(*ROWS)
+
+    return ExpenseArrays(
+        np.array(ids, np.int64),
+        np.array(cents, np.int64),
+        np.array(dates, "datetime64[us]"),
+        np.array(codes, np.int32),
+        (None, "Housing", "Food", "Fun"),
+    )
+
+
+def test_by_category_is_ordered_by_total(arrays: ExpenseArrays):
+    groups = analytics.by_category(arrays)
+
+    assert [(g.label, g.total, g.count) for g in groups] == [
+        ("Housing", 2400.00, 2),
+        ("Food", 100.25, 2),
+        ("Fun", 18.00, 1),
+        ("-", 12.10, 1),
+    ]
+    assert groups[1].mean == approx(50.125)
+    assert sum(g.share for g in groups) == approx(100)
+
+
+def test_by_month_fills_gaps_and_runs_totals(arrays: ExpenseArrays):
+    months = analytics.by_month(arrays)
+
+    assert [(m.year, m.month, m.total, m.count, m.running_total) for m in months] == [
+        (2024, 1, 1264.40, 3, 1264.40),
+        (2024, 2, 0.0, 0, 1264.40),
+        (2024, 3, 1265.95, 3, 2530.35),
+    ]
+
+
+def test_by_weekday(arrays: ExpenseArrays):
+    weekdays = {g.label: (g.total, g.count) for g in analytics.by_weekday(arrays)}
+
+    assert list(weekdays) == list(analytics.WEEKDAYS)
+    assert weekdays["Monday"] == (1200.00, 1)
+    assert weekdays["Friday"] == (1252.30, 2)
+    assert weekdays["Saturday"] == (12.10, 1)
+    assert weekdays["Sunday"] == (47.95, 1)
+    assert weekdays["Tuesday"] == (0.0, 0)
+
+
+def test_percentiles_match_numpy(arrays: ExpenseArrays):
+    quantiles = [0, 50, 90, 100]
+
+    assert analytics.percentiles(arrays, quantiles) == approx(
+        np.percentile(arrays.cents, quantiles) / 100)
+
+    for row in analytics.percentiles_by_category(arrays, quantiles):
+        code = arrays.names.index(row.category)
+        cents = arrays.cents[arrays.categories == code]
+
+        assert row.count == len(cents)
+        assert row.values == approx(np.percentile(cents, quantiles) / 100)
+
+
+@mark.parametrize("cents", [
+    [-500, 5230, 1210, -4795, 1800, 120000],   # refunds
+    [0, 5230, 2**61, 4795, 1800, 120000],      # too wide to pack into one key
+])
+def test_percentiles_by_category_any_amounts(arrays: ExpenseArrays, cents: list[int]):
+    arrays = arrays._replace(cents=np.array(cents, np.int64))
+
+    for row in analytics.percentiles_by_category(arrays, [10, 50]):
+        code = arrays.names.index(row.category)
+        expected = np.percentile(arrays.cents[arrays.categories == code], [10, 50])
+
+        assert row.values == approx(expected / 100)
+
+
+def test_top_expenses_breaks_ties_by_id(arrays: ExpenseArrays):
+    top = analytics.top_expenses(arrays, 3)
+
+    assert [(e.id, e.amount, e.category) for e in top] == [
+        (1, 1200.00, "Housing"),
+        (6, 1200.00, "Housing"),
+        (2, 52.30, "Food"),
+    ]
+    assert top[0].date == datetime(2024, 1, 1)
+    assert len(analytics.top_expenses(arrays, 50)) == len(ROWS)
+
+
+def test_empty_arrays():
+    empty = ExpenseArrays.empty()
+
+    assert analytics.by_category(empty) == []
+    assert analytics.by_month(empty) == []
+    assert analytics.top_expenses(empty, 5) == []
+    assert analytics.percentiles(empty, [50]) == (0.0,)
+
+
+def test_repository_loads_period_arrays():
+    clear_expenses()
+    repository = SQLAlchemyExpenseRepository(override_get_db)
+
+    for description, category, amount, date in [
+        ("Rent", "housing", 1200.00, datetime(2024, 1, 1)),
+        ("Train", None, 12.10, datetime(2024, 1, 20)),
+        ("Cinema", "Fun", 18.00, datetime(2024, 2, 14)),
+        ("Coffee", "Fun", 3.40, datetime(2023, 12, 31)),
+    ]:
+        repository.add(ExpenseRecord(None, description, category, amount, date, None))
+
+    arrays = repository.expense_arrays(datetime(2024, 1, 1), datetime(2025, 1, 1))
+
+    assert arrays.cents.tolist() == [120000, 1210, 1800]
+    assert [arrays.names[code] for code in arrays.categories] == ["Housing", None, "Fun"]
+    assert arrays.dates[1] == np.datetime64("2024-01-20")
+
+    only_fun = repository.expense_arrays(
+        datetime(2023, 1, 1), datetime(2025, 1, 1), "fun")
+    assert only_fun.cents.tolist() == [340, 1800]
+
+    clear_expenses()
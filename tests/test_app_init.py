@@ -3,6 +3,9 @@
 # pylint: disable=wrong-import-order
 # pylint: disable=unused-import
 
+import subprocess
+import sys
+from pathlib import Path
 from typer.testing import CliRunner
 
 from .utils import test_expense
@@ -11,6 +14,8 @@ from src.expense_tracker.__main__ import app
 
 runner = CliRunner()
 
+ROOT_DIR = Path(__file__).parent.parent
+
 
 def test_app_help_command():
     result = runner.invoke(
@@ -18,3 +23,59 @@ def test_app_help_command():
     )
 
     assert result.exit_code == 0
+
+
+def test_help_does_not_import_heavy_modules():
+    code = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from src.expense_tracker.cli import app\n"
+        "assert CliRunner().invoke(app, ['--help']).exit_code == 0\n"
+        "print(','.join(m for m in ('pandas', 'sqlalchemy') if m in sys.modules))\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_importing_cli_does_not_build_the_app():
+    code = (
+        "import sys\n"
+        "import src.expense_tracker.cli\n"
+        "print('src.expense_tracker.commands' in sys.modules)\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_sync_repositories_do_not_import_asyncio_support():
+    code = (
+        "import sys\n"
+        "from src.expense_tracker.repositories import SQLAlchemyExpenseRepository\n"
+        "print('sqlalchemy.ext.asyncio' in sys.modules)\n"
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
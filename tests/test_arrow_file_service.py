@@ -0,0 +1,182 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=wrong-import-order
+# pylint: disable=unused-import
+
+from pathlib import Path
+from datetime import datetime
+from pytest import fixture, importorskip, mark, raises
+from typer.testing import CliRunner
+
+pa = importorskip("pyarrow")
+
+import pyarrow.parquet as pq
+
+from .utils import TestingSessionLocal, clear_expenses
+from src.expense_tracker.cli import app
+from src.expense_tracker.models import Expense
+from src.expense_tracker.services import arrow_file_service
+from src.expense_tracker.services.arrow_file_service import (
+    ArrowFileService, EXPENSE_SCHEMA, IPC_EXPENSE_SCHEMA
+)
+
+
+runner = CliRunner()
+
+
+@fixture
+def sample_expenses() -> list[Expense]:
+    return [
+        Expense(
+            id=1,
+            description="Groceries",
+            amount=50.25,
+            category="Food",
+            notes="Weekly grocery trip",
+            date=datetime(2025, 1, 1),
+        ),
+        Expense(
+            id=2,
+            description="Gas",
+            amount=35.00,
+            category=None,
+            notes=None,
+            date=datetime(2025, 1, 2),
+        ),
+    ]
+
+
+def read_table(path: Path) -> "pa.Table":
+    if path.suffix == ".parquet":
+        return pq.read_table(path)
+
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+@mark.parametrize("file_format, schema", [
+    ("parquet", EXPENSE_SCHEMA),
+    ("arrow", IPC_EXPENSE_SCHEMA),
+])
+def test_export_expenses_writes_typed_columns(
+    tmp_path: Path,
+    sample_expenses: list[Expense],
+    file_format: str,
+    schema: "pa.Schema",
+):
+    ArrowFileService(file_format).export_expenses(
+        sample_expenses, tmp_path, "expenses")
+
+    table = read_table(tmp_path / f"expenses.{file_format}")
+
+    assert table.schema.equals(schema)
+    assert table.column("amount").to_pylist() == [50.25, 35.00]
+    assert table.column("date").to_pylist() == [
+        datetime(2025, 1, 1), datetime(2025, 1, 2)]
+
+
+@mark.parametrize("file_format", ["parquet", "arrow"])
+def test_import_round_trip_keeps_dates(
+    tmp_path: Path,
+    sample_expenses: list[Expense],
+    file_format: str,
+):
+    service = ArrowFileService(file_format)
+    service.export_expenses(sample_expenses, tmp_path, "expenses")
+
+    imported = service.import_expenses(tmp_path / f"expenses.{file_format}")
+
+    assert [
+        (e.description, e.amount, e.category, e.notes, e.date) for e in imported
+    ] == [
+        (e.description, e.amount, e.category, e.notes, e.date)
+        for e in sample_expenses
+    ]
+
+
+@mark.parametrize("file_format", ["parquet", "arrow"])
+def test_iter_import_batches_respects_chunksize(
+    tmp_path: Path,
+    sample_expenses: list[Expense],
+    file_format: str,
+):
+    service = ArrowFileService(file_format)
+    service.export_expenses(sample_expenses * 3, tmp_path, "expenses")
+
+    batches = list(service.iter_import_batches(
+        tmp_path / f"expenses.{file_format}", chunksize=4))
+
+    assert [len(batch) for batch in batches] == [4, 2]
+
+
+@mark.parametrize("file_format", ["parquet", "arrow"])
+def test_export_spanning_several_batches(
+    tmp_path: Path,
+    sample_expenses: list[Expense],
+    file_format: str,
+    monkeypatch,
+):
+    monkeypatch.setattr(arrow_file_service, "EXPORT_BATCH_SIZE", 2)
+    service = ArrowFileService(file_format)
+    service.export_expenses(sample_expenses * 3, tmp_path, "expenses")
+
+    table = read_table(tmp_path / f"expenses.{file_format}")
+
+    assert table.column("category").to_pylist() == ["Food", None] * 3
+
+
+def test_import_requires_description_and_amount(tmp_path: Path):
+    path = tmp_path / "bad.parquet"
+    pq.write_table(pa.table({"description": ["Lunch"], "price": [9.5]}), path)
+
+    with raises(ValueError, match="required columns"):
+        ArrowFileService("parquet").iter_import_batches(path)
+
+
+def test_monthly_summary_stores_total_as_metadata(
+    tmp_path: Path,
+    sample_expenses: list[Expense],
+):
+    ArrowFileService("parquet").export_monthly_summary(
+        sample_expenses, 85.25, 2025, 1, tmp_path, "january")
+
+    metadata = pq.read_schema(tmp_path / "january.parquet").metadata
+
+    assert metadata[b"total"] == b"85.25"
+    assert metadata[b"month"] == b"1"
+
+
+def test_unknown_format_is_rejected():
+    with raises(ValueError):
+        ArrowFileService("feather")
+
+
+def test_list_export_and_bulk_import_parquet(tmp_path: Path):
+    clear_expenses()
+    runner.invoke(app, ["add", "Groceries", "25.50", "--category", "food"])
+
+    result = runner.invoke(app, [
+        "list", "--export", "--format", "parquet",
+        "--directory", str(tmp_path), "--filename", "expenses",
+    ])
+
+    assert result.exit_code == 0
+    assert (tmp_path / "expenses.parquet").exists()
+
+    with TestingSessionLocal() as db:
+        exported = db.query(Expense).one()
+
+    clear_expenses()
+
+    result = runner.invoke(
+        app, ["bulk", str(tmp_path), "--format", "parquet", "--workers", "1"])
+
+    assert result.exit_code == 0
+    assert "1 expenses added from expenses.parquet" in result.output
+
+    with TestingSessionLocal() as db:
+        imported = db.query(Expense).one()
+        assert imported.description == exported.description
+        assert imported.amount == exported.amount
+        assert imported.category == "Food"
+        assert imported.date == exported.date
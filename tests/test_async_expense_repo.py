@@ -0,0 +1,114 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-import
+# pylint: disable=wrong-import-order
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+
+from pytest import fixture, raises
+from sqlalchemy import create_engine
+
+from .utils import override_get_db
+from src.expense_tracker.database import AsyncDatabase, async_url
+from src.expense_tracker.migrations import ensure_schema
+from src.expense_tracker.models import Expense
+from src.expense_tracker.records import ExpenseFilter, ExpenseRecord
+from src.expense_tracker.repositories import AsyncSQLAlchemyExpenseRepository
+
+
+@fixture
+def repo(tmp_path: Path) -> AsyncSQLAlchemyExpenseRepository:
+    url = f"sqlite:///{tmp_path}/async.db"
+
+    engine = create_engine(url)
+    ensure_schema(engine)
+    engine.dispose()
+
+    database = AsyncDatabase()
+    database.configure(async_url(url))
+
+    @asynccontextmanager
+    async def session_context():
+        async with database.session() as db:
+            yield db
+
+    yield AsyncSQLAlchemyExpenseRepository(session_context)
+    asyncio.run(database.aclose())
+
+
+def record(description: str, amount: float, date: datetime) -> ExpenseRecord:
+    return ExpenseRecord(None, description, "Food", amount, date, None)
+
+
+def test_async_url():
+    assert async_url("sqlite:///a.db") == "sqlite+aiosqlite:///a.db"
+    assert async_url("postgresql://u:p@h/db") == "postgresql+asyncpg://u:p@h/db"
+    assert async_url("sqlite+aiosqlite:///a.db") == "sqlite+aiosqlite:///a.db"
+
+
+def test_async_repository_round_trip(repo: AsyncSQLAlchemyExpenseRepository):
+    async def scenario():
+        expense_id = await repo.add(record("Coffee", 3.5, datetime(2025, 3, 4)))
+        await repo.bulk_insert([
+            {"description": "Lunch", "amount": 12.0, "category": "Food",
+             "date": datetime(2025, 3, 5)},
+            {"description": "Train", "amount": 8.0, "category": "Transport",
+             "date": datetime(2025, 4, 1)},
+        ])
+
+        expense = await repo.get(expense_id)
+        expense.amount = 4.0
+        await repo.update(expense)
+
+        listed = [e.description for e in await repo.list()]
+        streamed = [e.description async for e in repo.iter_expenses(batch_size=1)]
+        march = await repo.monthly_totals(3, 2025)
+        food = await repo.category_summary("food")
+
+        await repo.delete(expense)
+
+        return listed, streamed, march, food, await repo.category_summary()
+
+    listed, streamed, march, food, remaining = asyncio.run(scenario())
+
+    assert listed == streamed == ["Coffee", "Lunch", "Train"]
+    assert (march.total, march.count) == (16.0, 2)
+    assert food == (16.0, 2)
+    assert remaining == (20.0, 2)
+
+
+def test_async_summaries_run_concurrently(repo: AsyncSQLAlchemyExpenseRepository):
+    async def scenario():
+        await repo.add(record("Coffee", 3.5, datetime(2025, 3, 4)))
+
+        return await asyncio.gather(*(
+            repo.category_summary("Food") for _ in range(20)))
+
+    assert asyncio.run(scenario()) == [(3.5, 1)] * 20
+
+
+def test_async_repository_validates_arguments(repo: AsyncSQLAlchemyExpenseRepository):
+    with raises(ValueError):
+        asyncio.run(repo.get(0))
+
+    with raises(ValueError):
+        asyncio.run(repo.monthly_totals(13, 2025))
+
+
+def test_async_batch_operations(repo: AsyncSQLAlchemyExpenseRepository):
+    async def scenario():
+        await repo.add(record("Uber", 10.0, datetime(2025, 3, 4)))
+        await repo.add(record("Lunch", 12.0, datetime(2025, 3, 5)))
+
+        updated = await repo.update_many(
+            ExpenseFilter(description="Uber%"), {"category": "Transport"})
+        deleted = await repo.delete_many(ExpenseFilter(category="food"))
+
+        return updated, deleted, await repo.monthly_totals(3, 2025)
+
+    updated, deleted, totals = asyncio.run(scenario())
+
+    assert (updated, deleted) == (1, 1)
+    assert [tuple(c) for c in totals.categories] == [("Transport", 10.0, 1)]
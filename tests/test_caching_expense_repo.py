@@ -0,0 +1,185 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-import
+# pylint: disable=wrong-import-order
+
+from datetime import datetime
+
+from pytest import fixture, raises
+
+from .utils import clear_expenses, override_get_db
+from src.expense_tracker.cache import TTLCache
+from src.expense_tracker.models import Expense
+from src.expense_tracker.records import ExpenseRecord
+from src.expense_tracker.repositories import (
+    CachingExpenseRepository, SQLAlchemyExpenseRepository
+)
+
+
+class CountingRepository(SQLAlchemyExpenseRepository):
+    def __init__(self) -> None:
+        super().__init__(override_get_db)
+        self.calls: list[str] = []
+
+    def category_summary(self, category=None):
+        self.calls.append("category_summary")
+        return super().category_summary(category)
+
+    def monthly_totals(self, month, year):
+        self.calls.append("monthly_totals")
+        return super().monthly_totals(month, year)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@fixture
+def inner() -> CountingRepository:
+    clear_expenses()
+    yield CountingRepository()
+    clear_expenses()
+
+
+def record(category: str, date: datetime, amount: float = 10.0) -> ExpenseRecord:
+    return ExpenseRecord(None, "Expense", category, amount, date, None)
+
+
+def test_repeated_reads_are_cached(inner: CountingRepository):
+    repo = CachingExpenseRepository(inner)
+    repo.add(record("Food", datetime(2025, 3, 4)))
+
+    assert repo.category_summary("food") == (10.0, 1)
+    assert repo.category_summary("Food") == (10.0, 1)
+    assert repo.monthly_totals(3, 2025).total == 10.0
+    assert repo.monthly_totals(3, 2025).total == 10.0
+
+    assert inner.calls == ["category_summary", "monthly_totals"]
+
+    stats = repo.cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
+
+
+def test_writes_invalidate_only_affected_entries(inner: CountingRepository):
+    repo = CachingExpenseRepository(inner)
+    repo.add(record("Food", datetime(2025, 3, 4)))
+
+    repo.category_summary("Food")
+    repo.category_summary("Transport")
+    repo.monthly_totals(3, 2025)
+    repo.monthly_totals(4, 2025)
+    inner.calls.clear()
+
+    repo.add(record("Transport", datetime(2025, 4, 2), 5.0))
+
+    assert repo.category_summary("Food") == (10.0, 1)
+    assert repo.monthly_totals(3, 2025).total == 10.0
+    assert inner.calls == []
+
+    assert repo.category_summary("Transport") == (5.0, 1)
+    assert repo.monthly_totals(4, 2025).total == 5.0
+    assert inner.calls == ["category_summary", "monthly_totals"]
+    assert repo.cache_stats().invalidations == 2
+
+
+def test_update_invalidates_old_and_new_month(inner: CountingRepository):
+    repo = CachingExpenseRepository(inner)
+    expense_id = repo.add(record("Food", datetime(2025, 3, 4)))
+
+    assert repo.monthly_totals(3, 2025).count == 1
+    assert repo.monthly_totals(5, 2025).count == 0
+
+    expense = repo.get(expense_id)
+    expense.date = datetime(2025, 5, 1)
+    repo.update(expense)
+
+    assert repo.monthly_totals(3, 2025).count == 0
+    assert repo.monthly_totals(5, 2025).count == 1
+
+    repo.delete(expense)
+
+    assert repo.monthly_totals(5, 2025).count == 0
+
+
+def test_bulk_insert_invalidates_written_months(inner: CountingRepository):
+    repo = CachingExpenseRepository(inner)
+
+    assert repo.monthly_totals(1, 2025).count == 0
+
+    repo.bulk_insert(
+        {"description": "Row", "amount": 1.0, "category": "Food",
+         "date": datetime(2025, 1, day)}
+        for day in range(1, 11)
+    )
+
+    assert repo.monthly_totals(1, 2025).count == 10
+
+
+def test_entries_expire_and_evict():
+    clock = FakeClock()
+    cache = TTLCache(max_entries=2, ttl=10.0, clock=clock)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+
+    clock.now = 10.0
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert (stats.evictions, stats.expirations, stats.size) == (1, 1, 1)
+
+
+def test_put_is_dropped_after_concurrent_invalidation():
+    cache = TTLCache()
+    generation = cache.generation
+
+    cache.invalidate(lambda _: True)
+    cache.put("a", 1, generation=generation)
+
+    assert cache.get("a") is None
+
+
+def test_invalid_arguments(inner: CountingRepository):
+    with raises(ValueError):
+        TTLCache(max_entries=0)
+
+    with raises(TypeError):
+        CachingExpenseRepository(inner).category_summary(5)  # type: ignore
+
+
+def test_only_uncached_reads_are_forwarded(inner: CountingRepository):
+    repo = CachingExpenseRepository(inner)
+    expense_id = repo.add(record("Food", datetime(2025, 3, 4)))
+
+    assert repo.get(expense_id).category == "Food"
+    assert [e.id for e in repo.list()] == [expense_id]
+
+    with raises(AttributeError):
+        repo._db_context  # pylint: disable=protected-access,pointless-statement
+
+    with raises(AttributeError):
+        repo.bulk_upsert  # pylint: disable=pointless-statement
+
+
+def test_cached_results_cannot_be_changed_by_callers(inner: CountingRepository):
+    repo = CachingExpenseRepository(inner)
+    repo.add(record("Food", datetime(2025, 3, 4)))
+
+    expenses = repo.monthly_summary(3, 2025)
+    totals = repo.monthly_totals(3, 2025)
+
+    with raises(AttributeError):
+        expenses.append(expenses[0])  # type: ignore[attr-defined]
+
+    with raises(AttributeError):
+        totals.categories.clear()  # type: ignore[attr-defined]
+
+    assert len(repo.monthly_summary(3, 2025)) == 1
+    assert isinstance(repo.between(datetime(2025, 3, 1), datetime(2025, 4, 1)), tuple)
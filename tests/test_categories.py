@@ -0,0 +1,135 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=unused-import
+# pylint: disable=wrong-import-order
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from threading import Barrier, local
+from kink import di
+from sqlalchemy import create_engine, event, func, select
+
+from .utils import TestingSessionLocal, clear_expenses, count_statements, engine
+from src.expense_tracker.categories import CATEGORY_CACHE, CategoryCache
+from src.expense_tracker.migrations import ensure_schema
+from src.expense_tracker.models import Category, Expense
+from src.expense_tracker.protocols import ExpenseRepository
+from src.expense_tracker.repositories import SQLAlchemyExpenseRepository
+from src.expense_tracker.records import ExpenseFilter
+
+
+def category_names() -> list[str]:
+    with TestingSessionLocal() as db:
+        return db.scalars(select(Category.name).order_by(Category.name)).all()
+
+
+def test_categories_are_normalized_once_on_write():
+    clear_expenses()
+    repository = di[ExpenseRepository]
+
+    expense_id = repository.add(Expense(
+        description="Dinner", amount=30.0, category="fOOD", date=datetime(2024, 2, 10)))
+    repository.bulk_insert([
+        {"description": "Lunch", "amount": 12.0, "category": "food",
+         "date": datetime(2024, 2, 11)},
+        {"description": "Bus", "amount": 2.5, "category": None,
+         "date": datetime(2024, 2, 12)},
+    ])
+    updated = repository.update_by_id(expense_id, {"category": "groceries"})
+
+    assert updated.category == "Groceries"
+    assert repository.get(expense_id).category == "Groceries"
+    assert [e.category for e in repository.list()] == ["Groceries", "Food", None]
+    assert {"Food", "Groceries"} <= set(category_names())
+    assert repository.category_summary("FOOD") == (12.0, 1)
+    assert repository.update_many(ExpenseFilter(category="food"), {"category": "Groceries"}) == 1
+    assert repository.category_summary("groceries") == (42.0, 2)
+    assert repository.rebuild_rollups(dry_run=True) == []
+
+    clear_expenses()
+
+
+def test_unknown_category_matches_nothing():
+    clear_expenses()
+    repository = di[ExpenseRepository]
+    repository.add(Expense(description="Dinner", amount=30.0, category="Food"))
+
+    assert repository.list("Nonexistent") == []
+    assert repository.category_summary("Nonexistent") == (0.0, 0)
+    assert "Nonexistent" not in category_names()
+
+    clear_expenses()
+
+
+def test_cached_category_ids_skip_the_lookup():
+    clear_expenses()
+    repository = di[ExpenseRepository]
+    repository.add(Expense(description="Dinner", amount=30.0, category="Food"))
+
+    with count_statements() as statements:
+        repository.add(Expense(description="Lunch", amount=12.0, category="food"))
+
+    assert not any("categories.name = ?" in statement for statement in statements)
+
+    clear_expenses()
+
+
+def test_ids_created_in_a_rolled_back_transaction_are_not_cached():
+    cache = CategoryCache()
+
+    with engine.connect() as connection:
+        with connection.begin() as transaction:
+            created = cache.id_for(connection, "Ephemeral")
+            assert cache.id_for(connection, "ephemeral") == created
+            transaction.rollback()
+
+        with connection.begin():
+            assert connection.scalar(
+                select(func.count()).where(Category.name == "Ephemeral")) == 0
+
+    with engine.connect() as connection:
+        with connection.begin():
+            kept = cache.id_for(connection, "Ephemeral")
+
+        with connection.begin() as transaction:
+            assert cache.id_for(connection, "EPHEMERAL") == kept
+            connection.execute(Category.__table__.delete().where(Category.id == kept))
+            transaction.commit()
+
+
+def test_concurrent_writers_share_a_new_category(tmp_path: Path):
+    race_engine = create_engine(
+        f"sqlite:///{tmp_path}/race.db", connect_args={"timeout": 30})
+    ensure_schema(race_engine)
+    writers = 8
+    barrier = Barrier(writers, timeout=10)
+    looked_up = local()
+
+    # Every writer finds the name missing before any of them inserts it.
+    @event.listens_for(race_engine, "after_cursor_execute")
+    def wait_for_other_lookups(_conn, _cursor, statement, *_args):
+        if statement.startswith("SELECT categories.id") and not getattr(looked_up, "done", False):
+            looked_up.done = True
+            barrier.wait()
+
+    def create(_) -> int:
+        # Separate caches, as in separate processes.
+        cache = CategoryCache()
+
+        with race_engine.connect() as connection:
+            with connection.begin():
+                return cache.id_for(connection, "Race")
+
+    try:
+        with ThreadPoolExecutor(max_workers=writers) as pool:
+            ids = list(pool.map(create, range(writers)))
+
+        with race_engine.connect() as connection:
+            count = connection.scalar(
+                select(func.count()).where(Category.name == "Race"))
+    finally:
+        race_engine.dispose()
+
+    assert len(set(ids)) == 1
+    assert count == 1
@@ -0,0 +1,112 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-import
+# pylint: disable=wrong-import-order
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from pytest import fixture, raises
+
+from kink import di
+
+from sqlalchemy import text
+
+from .utils import override_get_db
+from src.expense_tracker.database import Database, sqlite_profile
+
+
+@fixture
+def database(tmp_path: Path) -> Database:
+    database = Database()
+    database.configure(f"sqlite:///{tmp_path}/nested/lazy.db")
+
+    yield database
+    database.dispose()
+
+
+def test_engine_is_built_on_first_use(database: Database, tmp_path: Path):
+    assert not (tmp_path / "nested").exists()
+
+    with database.session() as db:
+        assert db.scalar(text("SELECT 1")) == 1
+
+    assert (tmp_path / "nested" / "lazy.db").exists()
+
+
+def test_configure_replaces_engine(database: Database, tmp_path: Path):
+    first = database.engine
+
+    database.configure(f"sqlite:///{tmp_path}/other.db")
+
+    assert database.engine is not first
+    assert database.engine.url.database == f"{tmp_path}/other.db"
+
+
+def test_sqlite_pragmas_are_applied(database: Database):
+    database.configure(sqlite_pragmas={"journal_mode": "WAL", "cache_size": -4000})
+
+    with database.engine.connect() as connection:
+        assert connection.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert connection.scalar(text("PRAGMA cache_size")) == -4000
+
+
+def test_engine_hooks_run_once_per_engine(database: Database, tmp_path: Path):
+    seen = []
+
+    database.add_engine_hook(seen.append)
+    database.add_engine_hook(seen.append)
+    engine = database.engine
+    database.engine  # pylint: disable=pointless-statement
+
+    assert seen == [engine]
+
+    database.configure(f"sqlite:///{tmp_path}/other.db")
+
+    assert seen == [engine, database.engine]
+
+
+def test_engine_is_published_after_its_hooks(database: Database):
+    seen = []
+
+    def hook(engine):
+        seen.append(engine)
+
+        if len(seen) == 1:
+            raise RuntimeError("schema check failed")
+
+    database.add_engine_hook(hook)
+
+    with raises(RuntimeError):
+        database.engine  # pylint: disable=pointless-statement
+
+    assert database.engine is seen[1]
+    assert seen[0] is not seen[1]
+
+
+def test_engine_is_shared_between_threads(database: Database):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        engines = list(pool.map(lambda _: database.engine, range(32)))
+
+    assert all(engine is engines[0] for engine in engines)
+
+
+@fixture
+def sqlite_profile_setting():
+    previous = di["db_sqlite_profile"] if "db_sqlite_profile" in di else "stock"
+
+    yield
+
+    di["db_sqlite_profile"] = previous
+
+
+def test_sqlite_profile_is_read_from_di(database: Database, sqlite_profile_setting):
+    di["db_sqlite_profile"] = "performance"
+
+    with database.engine.connect() as connection:
+        assert connection.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert connection.scalar(text("PRAGMA synchronous")) == 1  # NORMAL
+        assert connection.scalar(text("PRAGMA temp_store")) == 2  # MEMORY
+
+
+def test_unknown_sqlite_profile():
+    with raises(ValueError):
+        sqlite_profile("turbo")
@@ -5,7 +5,9 @@
 
 from typer.testing import CliRunner
 
-from .utils import TestingSessionLocal, test_expense
+from datetime import datetime
+
+from .utils import TestingSessionLocal, clear_expenses, test_expense
 from src.expense_tracker.models import Expense
 from src.expense_tracker.cli import app
 
@@ -38,3 +40,38 @@ def test_delete_invalid_id_below_one():
 
     result = runner.invoke(app, ["delete", "-1"])
     assert result.exit_code == 2
+
+
+def test_delete_by_filter():
+    clear_expenses()
+
+    with TestingSessionLocal() as db:
+        db.add_all([
+            Expense(description="Bad row", amount=1.0, category="Import",
+                    date=datetime(2024, 2, 1)),
+            Expense(description="Bad row", amount=1.0, category="Import",
+                    date=datetime(2024, 2, 2)),
+            Expense(description="Keep", amount=1.0, category="Import",
+                    date=datetime(2024, 3, 1)),
+        ])
+        db.commit()
+
+    result = runner.invoke(
+        app, ["delete", "--category", "import", "--month", "2", "--year", "2024"])
+
+    assert result.exit_code == 0
+    assert "2 expenses deleted" in result.output
+
+    with TestingSessionLocal() as db:
+        assert [e.description for e in db.query(Expense).all()] == ["Keep"]
+
+    clear_expenses()
+
+
+def test_delete_requires_ids_or_filter():
+    result = runner.invoke(app, ["delete"])
+    assert result.exit_code == 2
+
+    result = runner.invoke(
+        app, ["delete", "--month", "2", "--start", "2024-01-01"])
+    assert result.exit_code == 2
@@ -3,13 +3,15 @@
 # pylint: disable=wrong-import-order
 # pylint: disable=unused-import
 
+import json
 from pathlib import Path
 from typer.testing import CliRunner
 import pandas as pd
 
-from .utils import TestingSessionLocal, test_expense
+from .utils import TestingSessionLocal, clear_expenses, count_statements, test_expense
 from src.expense_tracker.models import Expense
 from src.expense_tracker.cli import app
+from src.expense_tracker.commands.expenses import output_formats
 
 
 runner = CliRunner()
@@ -52,11 +54,93 @@ def test_list_expenses_export_to_csv(tmp_path: Path, test_expense: Expense):
     assert test_expense.description in df["Description"].values
 
 
+def test_list_export_reads_expenses_once(tmp_path: Path, test_expense: Expense):
+    with count_statements() as statements:
+        result = runner.invoke(
+            app, ["list", "--export", "--directory", str(tmp_path), "--filename", "once"])
+
+    assert result.exit_code == 0
+    assert len([s for s in statements if "FROM expenses" in s]) == 1
+    assert len(pd.read_csv(tmp_path / "once.csv")) == 1
+
+
 def test_list_expenses_no_results(tmp_path: Path):
-    with TestingSessionLocal() as db:
-        db.query(Expense).delete()
-        db.commit()
+    clear_expenses()
 
     result = runner.invoke(app, ["list"])
     assert result.exit_code == 0
     assert "No expenses found" in result.output
+
+
+def test_list_expenses_paginated(test_expense: Expense):
+    result = runner.invoke(
+        app, ["list", "--after-id", str(test_expense.id - 1), "--limit", "1"])
+
+    assert result.exit_code == 0
+    assert test_expense.description in result.output
+    assert "More expenses available" not in result.output
+
+    result = runner.invoke(app, ["list", "--after-id", str(test_expense.id)])
+
+    assert result.exit_code == 0
+    assert "No expenses found" in result.output
+
+
+def test_list_expenses_limit_hints_next_page(test_expense: Expense):
+    with TestingSessionLocal() as db:
+        db.add(Expense(description="Second", amount=1.0, category="Food"))
+        db.commit()
+
+    result = runner.invoke(app, ["list", "--limit", "1"])
+
+    assert result.exit_code == 0
+    assert test_expense.description in result.output
+    assert "Second" not in result.output
+    assert f"use --after-id {test_expense.id}" in result.output
+
+
+def test_list_expenses_streams_tsv(test_expense: Expense):
+    result = runner.invoke(
+        app, ["list", "--output", "tsv", "--after-id", str(test_expense.id - 1)])
+
+    assert result.exit_code == 0
+
+    header, row = result.stdout.splitlines()
+    assert header.split("\t") == [
+        "id", "description", "category", "amount", "date", "notes"]
+    assert row.split("\t")[:4] == [
+        str(test_expense.id), test_expense.description, test_expense.category,
+        str(test_expense.amount)]
+
+
+def test_list_expenses_jsonl_keeps_stdout_for_rows(test_expense: Expense):
+    with TestingSessionLocal() as db:
+        db.add(Expense(description="Second", amount=1.0))
+        db.commit()
+
+    result = runner.invoke(app, ["list", "-o", "jsonl", "--limit", "1"])
+
+    assert result.exit_code == 0
+    assert [json.loads(line)["description"] for line in result.stdout.splitlines()] == [
+        test_expense.description]
+    assert f"use --after-id {test_expense.id}" in result.stderr
+
+
+def test_list_expenses_previews_on_a_terminal(monkeypatch, test_expense: Expense):
+    with TestingSessionLocal() as db:
+        db.add_all([
+            Expense(description="Second", amount=1.0),
+            Expense(description="Third", amount=1.0),
+        ])
+        db.commit()
+
+    monkeypatch.setattr(output_formats, "stdout_is_terminal", lambda: True)
+    monkeypatch.setattr(output_formats, "PREVIEW_ROWS", 2)
+
+    result = runner.invoke(app, ["list", "--page-size", "1"])
+
+    assert result.exit_code == 0
+    assert "Second" in result.output
+    assert "Third" not in result.output
+    assert "Showing the first 2 expenses" in result.output
+    assert "use --after-id" in result.output
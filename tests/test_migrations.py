@@ -0,0 +1,173 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-import
+# pylint: disable=wrong-import-order
+
+from decimal import Decimal
+from pathlib import Path
+from pytest import fixture
+
+from sqlalchemy import create_engine, inspect, text, Engine
+
+from .utils import override_get_db
+from src.expense_tracker.migrations import (
+    SCHEMA_VERSION, ensure_schema, schema_version, upgrade
+)
+from src.expense_tracker.money import to_cents
+
+
+@fixture
+def legacy_engine(tmp_path: Path) -> Engine:
+    engine = create_engine(f"sqlite:///{tmp_path}/legacy.db")
+
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE expenses ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "description VARCHAR(100) NOT NULL, "
+            "category VARCHAR(50), "
+            "amount FLOAT NOT NULL, "
+            "date DATETIME NOT NULL, "
+            "notes VARCHAR(200))"
+        ))
+
+    yield engine
+    engine.dispose()
+
+
+def test_upgrade_adds_missing_indexes(legacy_engine: Engine):
+    changes = upgrade(legacy_engine)
+
+    indexes = {
+        index["name"]: index["column_names"]
+        for index in inspect(legacy_engine).get_indexes("expenses")
+    }
+    assert indexes == {
+        "ix_expenses_category_id": ["category_id"],
+        "ix_expenses_date": ["date"],
+        "ix_expenses_category_date": ["category_id", "date"],
+    }
+    assert len(changes) == 5
+
+
+def test_upgrade_is_idempotent(legacy_engine: Engine):
+    upgrade(legacy_engine)
+    assert upgrade(legacy_engine) == []
+
+
+def test_upgrade_populates_rollups_for_existing_rows(legacy_engine: Engine):
+    with legacy_engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO expenses (description, category, amount, date) VALUES "
+            "('Rent', 'Home', 900.0, '2024-01-01 00:00:00.000000'), "
+            "('Power', 'Home', 60.0, '2024-01-15 00:00:00.000000')"
+        ))
+
+    assert "populate expense_rollups" in upgrade(legacy_engine)
+
+    with legacy_engine.connect() as connection:
+        rows = connection.execute(text(
+            "SELECT year, month, name, total_cents, count FROM expense_rollups "
+            "JOIN categories ON categories.id = expense_rollups.category_id"
+        )).all()
+
+    assert [tuple(row) for row in rows] == [(2024, 1, "Home", 96000, 2)]
+
+
+def test_ensure_schema_runs_upgrade_once(legacy_engine: Engine):
+    assert schema_version(legacy_engine) == 0
+    assert len(ensure_schema(legacy_engine)) == 5
+    assert schema_version(legacy_engine) == SCHEMA_VERSION
+
+    with legacy_engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_expenses_date"))
+
+    assert ensure_schema(legacy_engine) == []
+
+
+def test_upgrade_converts_amounts_to_cents(legacy_engine: Engine):
+    with legacy_engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO expenses (description, category, amount, date) VALUES "
+            "('Coffee', 'Food', 0.1, '2024-01-01 00:00:00.000000'), "
+            "('Tea', 'Food', 0.2, '2024-01-02 00:00:00.000000'), "
+            "('Cake', 'Food', 4.355, '2024-01-03 00:00:00.000000')"
+        ))
+        connection.execute(text(
+            "CREATE TABLE expense_rollups ("
+            "year INTEGER, month INTEGER, category VARCHAR(50), "
+            "total FLOAT NOT NULL, count INTEGER NOT NULL, "
+            "PRIMARY KEY (year, month, category))"
+        ))
+        connection.execute(text(
+            "INSERT INTO expense_rollups VALUES (2024, 1, 'Food', 4.655, 3)"))
+
+    changes = upgrade(legacy_engine)
+
+    assert changes[:2] == [
+        "convert expenses.amount to amount_cents",
+        "recreate expense_rollups with total_cents",
+    ]
+    assert "populate expense_rollups" in changes
+
+    with legacy_engine.connect() as connection:
+        columns = {c["name"] for c in inspect(legacy_engine).get_columns("expenses")}
+        cents = connection.scalars(text(
+            "SELECT amount_cents FROM expenses ORDER BY id")).all()
+        total = connection.scalar(text("SELECT total_cents FROM expense_rollups"))
+
+    assert "amount" not in columns
+    assert cents == [10, 20, 436]
+    assert total == 466
+
+
+def test_upgrade_rounds_cents_like_to_cents(legacy_engine: Engine):
+    # Exact halves of a cent, where half-to-even and half-up disagree.
+    amounts = [0.125, 0.625, 2.5, 1.005]
+
+    with legacy_engine.begin() as connection:
+        for amount in amounts:
+            connection.execute(text(
+                "INSERT INTO expenses (description, amount, date) "
+                "VALUES ('Split', :amount, '2024-01-01 00:00:00.000000')"),
+                {"amount": amount})
+
+    upgrade(legacy_engine)
+
+    with legacy_engine.connect() as connection:
+        cents = connection.scalars(text(
+            "SELECT amount_cents FROM expenses ORDER BY id")).all()
+
+    assert cents == [to_cents(amount) for amount in amounts] == [13, 63, 250, 100]
+    assert to_cents(Decimal("0.125")) == 13
+    assert to_cents(-0.125) == -13
+
+
+def test_upgrade_moves_categories_to_table(legacy_engine: Engine):
+    with legacy_engine.begin() as connection:
+        connection.execute(text(
+            "CREATE INDEX ix_expenses_category ON expenses (category)"))
+        connection.execute(text(
+            "INSERT INTO expenses (description, category, amount, date) VALUES "
+            "('Rent', 'home', 900.0, '2024-01-01 00:00:00.000000'), "
+            "('Power', 'Home', 60.0, '2024-01-15 00:00:00.000000'), "
+            "('Bus', 'Transport', 2.5, '2024-01-16 00:00:00.000000'), "
+            "('Misc', NULL, 1.0, '2024-01-17 00:00:00.000000')"
+        ))
+
+    assert "move expenses.category to categories" in upgrade(legacy_engine)
+
+    with legacy_engine.connect() as connection:
+        rows = connection.execute(text(
+            "SELECT description, name FROM expenses "
+            "LEFT JOIN categories ON categories.id = expenses.category_id "
+            "ORDER BY expenses.id"
+        )).all()
+        names = connection.scalars(text("SELECT name FROM categories ORDER BY id")).all()
+
+    columns = {c["name"] for c in inspect(legacy_engine).get_columns("expenses")}
+
+    assert "category" not in columns
+    assert names == ["Home", "Transport"]
+    assert [tuple(row) for row in rows] == [
+        ("Rent", "Home"), ("Power", "Home"), ("Bus", "Transport"), ("Misc", None),
+    ]
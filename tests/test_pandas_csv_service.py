@@ -188,3 +188,41 @@ def test_export_monthly_summary_autoname_creates_file(
 
     df = pd.read_csv(output)
     assert "Total" in df["Description"].values
+
+
+def test_iter_import_batches_yields_row_dicts_in_chunks(
+    csv_service: PandasCSVService,
+    tmp_dir: Path
+):
+    data = pd.DataFrame([
+        {"Description": "Lunch", "Amount": 12.50, "Category": "Food"},
+        {"Description": "Taxi", "Amount": None, "Category": None},
+        {"Description": "Cinema", "Amount": 9.00, "Category": "Fun"},
+    ])
+    file = tmp_dir / "expenses_import.csv"
+    data.to_csv(file, index=False)
+
+    batches = list(csv_service.iter_import_batches(file, chunksize=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+
+    rows = [row for batch in batches for row in batch]
+    assert rows[0]["description"] == "Lunch"
+    assert rows[0]["amount"] == 12.50
+    assert rows[1]["amount"] == 0.0
+    assert rows[1]["category"] is None
+    assert all(row["notes"] is None for row in rows)
+    assert all(isinstance(row["date"], datetime) for row in rows)
+
+
+def test_iter_import_batches_validates_eagerly(
+    csv_service: PandasCSVService,
+    tmp_dir: Path
+):
+    invalid_file = tmp_dir / "invalid.csv"
+    pd.DataFrame([{"WrongColumn": "test"}]).to_csv(invalid_file, index=False)
+
+    with raises(FileNotFoundError):
+        csv_service.iter_import_batches(tmp_dir / "does_not_exist.csv")
+
+    with raises(ValueError):
+        csv_service.iter_import_batches(invalid_file)
@@ -0,0 +1,29 @@
+from datetime import datetime
+from pytest import mark, raises
+
+from src.expense_tracker.periods import month_range, quarter_range, year_range
+
+
+def test_month_range_is_half_open():
+    assert month_range(2025, 2) == (datetime(2025, 2, 1), datetime(2025, 3, 1))
+    assert month_range(2025, 12) == (datetime(2025, 12, 1), datetime(2026, 1, 1))
+
+
+def test_quarter_range():
+    assert quarter_range(2025, 4) == (datetime(2025, 10, 1), datetime(2026, 1, 1))
+
+
+def test_fiscal_year_range():
+    assert year_range(2025) == (datetime(2025, 1, 1), datetime(2026, 1, 1))
+    assert year_range(2025, 4) == (datetime(2025, 4, 1), datetime(2026, 4, 1))
+
+
+@mark.parametrize("args", [(2025, 0), (2025, 13), (2025, "1"), ("2025", 1)])
+def test_month_range_invalid(args):
+    with raises(ValueError):
+        month_range(*args)
+
+
+def test_quarter_range_invalid():
+    with raises(ValueError):
+        quarter_range(2025, 5)
@@ -0,0 +1,91 @@
+import threading
+from pathlib import Path
+from pytest import mark, raises
+
+from src.expense_tracker.pipeline import flatten, parse_files, prefetch
+
+
+def test_prefetch_preserves_order():
+    assert list(prefetch(iter(range(10)), depth=3)) == list(range(10))
+
+
+def test_prefetch_reraises_producer_errors():
+    def failing():
+        yield [1, 2]
+        raise ValueError("bad chunk")
+
+    consumed = []
+
+    with raises(ValueError, match="bad chunk"):
+        for item in prefetch(failing()):
+            consumed.append(item)
+
+    assert consumed == [[1, 2]]
+
+
+def test_prefetch_stops_producer_when_consumer_stops():
+    def endless():
+        count = 0
+        while True:
+            yield count
+            count += 1
+
+    before = set(threading.enumerate())
+    items = prefetch(endless(), depth=1)
+
+    assert next(items) == 0
+    producers = set(threading.enumerate()) - before
+    items.close()
+
+    for producer in producers:
+        producer.join(timeout=2)
+
+    assert producers
+    assert not any(producer.is_alive() for producer in producers)
+
+
+def test_prefetch_invalid_depth():
+    with raises(ValueError):
+        list(prefetch([], depth=0))
+
+
+def test_flatten_batches():
+    assert list(flatten([[1, 2], [], [3]])) == [1, 2, 3]
+
+
+def _parse_numbers(file: Path):
+    if not file.exists():
+        raise FileNotFoundError(f"Could not locate file at {file}.")
+
+    numbers = [int(line) for line in file.read_text().split()]
+    return ([{"value": n} for n in numbers[i:i + 2]]
+            for i in range(0, len(numbers), 2))
+
+
+@mark.parametrize("workers", [1, 2])
+def test_parse_files_yields_batches_and_end_markers(tmp_path: Path, workers: int):
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    first.write_text("1 2 3")
+    second.write_text("4 5")
+    missing = tmp_path / "missing.txt"
+
+    events = list(parse_files(_parse_numbers, [first, second, missing], workers))
+
+    values = {
+        file: [row["value"] for e in events if e.file == file and e.rows
+               for row in e.rows]
+        for file in (first, second)
+    }
+    assert values == {first: [1, 2, 3], second: [4, 5]}
+
+    ends = [e for e in events if e.rows is None]
+    assert len(ends) == 3
+    assert isinstance(
+        next(e.error for e in ends if e.file == missing), FileNotFoundError)
+    assert all(e.error is None for e in ends if e.file != missing)
+    assert all(e.started is not None for e in events)
+
+
+def test_parse_files_invalid_workers(tmp_path: Path):
+    with raises(ValueError):
+        list(parse_files(_parse_numbers, [tmp_path], workers=0))
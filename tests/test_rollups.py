@@ -0,0 +1,113 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=wrong-import-order
+# pylint: disable=unused-import
+
+from datetime import datetime
+from kink import di
+from typer.testing import CliRunner
+
+from sqlalchemy import select
+
+from .utils import TestingSessionLocal, clear_expenses, test_expense
+from src.expense_tracker.models import Category, Expense, ExpenseRollup
+from src.expense_tracker.protocols import ExpenseRepository
+from src.expense_tracker.rollups import apply_rollup_deltas
+from src.expense_tracker.cli import app
+
+
+runner = CliRunner()
+
+
+def rollups() -> dict[tuple[int, int, str], tuple[float, int]]:
+    with TestingSessionLocal() as db:
+        return {
+            (r.year, r.month, name or ""): (r.total, r.count)
+            for r, name in db.execute(
+                select(ExpenseRollup, Category.name)
+                .outerjoin(Category, Category.id == ExpenseRollup.category_id))
+        }
+
+
+def test_rollups_follow_repository_writes():
+    clear_expenses()
+    repository = di[ExpenseRepository]
+
+    expense_id = repository.add(Expense(
+        description="Dinner", amount=30.0, category="Food",
+        date=datetime(2024, 2, 10)))
+    repository.bulk_insert([
+        {"description": "Bus", "amount": 2.5, "category": "Transport",
+         "date": datetime(2024, 2, 11)},
+        {"description": "Lunch", "amount": 12.0, "category": "Food",
+         "date": datetime(2024, 3, 1)},
+    ])
+    repository.bulk_import([Expense(
+        description="Misc", amount=5.0, date=datetime(2024, 2, 12))])
+
+    assert rollups() == {
+        (2024, 2, "Food"): (30.0, 1),
+        (2024, 2, "Transport"): (2.5, 1),
+        (2024, 2, ""): (5.0, 1),
+        (2024, 3, "Food"): (12.0, 1),
+    }
+
+    expense = repository.get(expense_id)
+    expense.amount = 40.0
+    expense.date = datetime(2024, 3, 2)
+    repository.update(expense)
+
+    assert rollups()[(2024, 3, "Food")] == (52.0, 2)
+    assert (2024, 2, "Food") not in rollups()
+
+    repository.delete(repository.get(expense_id))
+    assert rollups()[(2024, 3, "Food")] == (12.0, 1)
+
+    totals = repository.monthly_totals(2, 2024)
+    assert (totals.total, totals.count) == (7.5, 2)
+    assert [c.category for c in totals.categories] == [None, "Transport"]
+
+    assert repository.category_summary("food") == (12.0, 1)
+    assert repository.rebuild_rollups(dry_run=True) == []
+
+    clear_expenses()
+
+
+def test_rebuild_rollups_command_repairs_drift(test_expense: Expense):
+    with TestingSessionLocal() as db:
+        db.add(Expense(description="Raw", amount=1.0, category="Food",
+                       date=datetime(2024, 1, 1)))
+        db.add(Expense(description="Loose", amount=2.0, date=datetime(2024, 1, 1)))
+        db.commit()
+
+    assert di[ExpenseRepository].rebuild_rollups(dry_run=True) == [
+        (2024, 1, None), (2024, 1, "Food")]
+
+    result = runner.invoke(app, ["rebuild-rollups", "--check"])
+    assert result.exit_code == 1
+    assert "2024-01 Food" in result.output
+    assert "2024-01 (uncategorised)" in result.output
+
+    result = runner.invoke(app, ["rebuild-rollups"])
+    assert result.exit_code == 0
+    assert "2 rollups rebuilt" in result.output
+    assert rollups()[(2024, 1, "Food")] == (1.0, 1)
+
+    result = runner.invoke(app, ["rebuild-rollups", "--check"])
+    assert result.exit_code == 0
+    assert "Rollups are up to date" in result.output
+
+
+def test_apply_rollup_deltas_upserts_and_prunes_touched_keys():
+    clear_expenses()
+
+    with TestingSessionLocal() as db:
+        db.add(ExpenseRollup(year=2020, month=1, category_id=0, total=0.0, count=0))
+        db.commit()
+
+        apply_rollup_deltas(db, {(2024, 1, 0): (5.0, 1), (2024, 2, 0): (1.0, 1)})
+        apply_rollup_deltas(db, {(2024, 1, 0): (2.5, 1), (2024, 2, 0): (-1.0, -1)})
+        db.commit()
+
+    # The pre-existing empty row was not one of the written keys.
+    assert rollups() == {(2024, 1, ""): (7.5, 2), (2020, 1, ""): (0.0, 0)}
@@ -0,0 +1,234 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=wrong-import-order
+# pylint: disable=unused-import
+
+import stat
+from datetime import datetime
+from os import umask
+from pathlib import Path
+from threading import Thread
+
+from kink import di
+from pytest import fixture, raises
+from typer.testing import CliRunner
+
+from .utils import TestingSessionLocal, clear_expenses, override_get_db
+from src.expense_tracker.bootstrap import initialize
+from src.expense_tracker.cli import app
+from src.expense_tracker.models import Expense
+from src.expense_tracker.protocols import ExpenseRepository
+from src.expense_tracker.records import ExpenseFilter, ExpenseRecord
+from src.expense_tracker.remote import RemoteExpenseRepository, server_is_running
+from src.expense_tracker.repositories import CachingExpenseRepository, SQLAlchemyExpenseRepository
+from src.expense_tracker.server import ExpenseServer
+
+
+runner = CliRunner()
+
+
+@fixture
+def socket_path(tmp_path: Path) -> str:
+    clear_expenses()
+
+    server = ExpenseServer(
+        str(tmp_path / "server.sock"), SQLAlchemyExpenseRepository(override_get_db))
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server.server_address
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+    clear_expenses()
+
+
+@fixture
+def remote(socket_path: str) -> RemoteExpenseRepository:
+    repo = RemoteExpenseRepository(
+        socket_path, fallback=lambda: SQLAlchemyExpenseRepository(override_get_db))
+
+    yield repo
+    repo.close()
+
+
+def record(description: str, amount: float, date: datetime) -> ExpenseRecord:
+    return ExpenseRecord(None, description, "Food", amount, date, None)
+
+
+def test_server_answers_repository_calls(remote: RemoteExpenseRepository):
+    expense_id = remote.add(record("Coffee", 3.5, datetime(2025, 3, 4)))
+    remote.add(record("Lunch", 12.0, datetime(2025, 3, 5)))
+
+    expenses = remote.list()
+    assert [e.description for e in expenses] == ["Coffee", "Lunch"]
+    assert expenses[0] == ExpenseRecord(
+        expense_id, "Coffee", "Food", 3.5, datetime(2025, 3, 4), None)
+
+    assert remote.category_summary("food") == (15.5, 2)
+
+    totals = remote.monthly_totals(3, 2025)
+    assert (totals.total, totals.count) == (15.5, 2)
+    assert totals.categories[0].category == "Food"
+
+    assert [e.description for e in remote.iter_between(
+        datetime(2025, 3, 5), datetime(2025, 4, 1))] == ["Lunch"]
+
+
+def test_server_streams_in_batches(remote: RemoteExpenseRepository):
+    remote.bulk_insert([
+        {"description": f"Expense {i}", "amount": 1.0, "date": datetime(2025, 1, 1)}
+        for i in range(1_234)
+    ])
+
+    assert sum(1 for _ in remote.iter_expenses()) == 1_234
+    assert len(remote.list(limit=10, after_id=5)) == 10
+
+
+def test_server_errors_are_reraised(remote: RemoteExpenseRepository):
+    with raises(ValueError):
+        remote.list(limit=0)
+
+    with raises(ValueError):
+        remote.monthly_totals(13, 2025)
+
+    # The connection is still usable after an error.
+    assert remote.category_summary() == (0.0, 0)
+
+
+def test_unserved_methods_use_fallback(remote: RemoteExpenseRepository):
+    expense_id = remote.add(record("Coffee", 3.5, datetime(2025, 3, 4)))
+
+    expense = remote.get(expense_id)
+    assert isinstance(expense, Expense)
+
+    expense.amount = 4.0
+    remote.update(expense)
+
+    assert remote.category_summary() == (4.0, 1)
+
+    with raises(AttributeError):
+        remote.close_all_sessions  # pylint: disable=pointless-statement
+
+
+def test_writes_go_through_the_server_cache(tmp_path: Path):
+    clear_expenses()
+
+    cached = CachingExpenseRepository(SQLAlchemyExpenseRepository(override_get_db))
+    server = ExpenseServer(str(tmp_path / "cached.sock"), cached)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    # A fallback that fails shows no write bypasses the server.
+    def no_fallback():
+        raise AssertionError("writes must go through the server")
+
+    remote = RemoteExpenseRepository(server.server_address, fallback=no_fallback)
+
+    try:
+        expense_id = remote.add(record("Coffee", 3.5, datetime(2025, 3, 4)))
+        assert remote.monthly_totals(3, 2025).total == 3.5
+
+        remote.update_by_id(expense_id, {"amount": 4.0})
+        assert remote.monthly_totals(3, 2025).total == 4.0
+
+        assert remote.bulk_insert([
+            {"description": "Lunch", "category": "Food", "amount": 12.0,
+             "date": datetime(2025, 3, 5), "notes": None},
+            {"description": "Bus", "category": "Transport", "amount": 2.0,
+             "date": datetime(2025, 3, 6), "notes": None},
+        ], batch_size=1) == 2
+        assert remote.monthly_totals(3, 2025).total == 18.0
+
+        assert remote.update_many(ExpenseFilter(category="Transport"), {"amount": 3.0}) == 1
+        assert remote.category_summary("Transport") == (3.0, 1)
+
+        assert remote.delete_by_id(expense_id).description == "Coffee"
+        assert remote.delete_many(ExpenseFilter(category="Food")) == 1
+        assert remote.monthly_totals(3, 2025).total == 3.0
+        assert remote.rebuild_rollups(dry_run=True) == []
+    finally:
+        remote.close()
+        server.shutdown()
+        server.server_close()
+        thread.join()
+        clear_expenses()
+
+
+def test_commands_use_running_server(socket_path: str):
+    previous = di["server_socket"]
+    di["server_socket"] = socket_path
+    initialize()
+
+    try:
+        result = runner.invoke(app, ["add", "Coffee", "3.50", "-c", "Food"])
+        assert result.exit_code == 0
+
+        assert isinstance(di[ExpenseRepository], RemoteExpenseRepository)
+        result = runner.invoke(app, ["list"])
+        assert result.exit_code == 0
+        assert "Coffee" in result.stdout
+    finally:
+        di["server_socket"] = previous
+        initialize()
+
+    with TestingSessionLocal() as db:
+        assert db.query(Expense).count() == 1
+
+
+def test_cli_update_is_seen_by_the_server_cache(tmp_path: Path):
+    clear_expenses()
+
+    cached = CachingExpenseRepository(SQLAlchemyExpenseRepository(override_get_db))
+    server = ExpenseServer(str(tmp_path / "cli.sock"), cached)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    previous = di["server_socket"]
+    di["server_socket"] = server.server_address
+    initialize()
+
+    try:
+        assert runner.invoke(app, ["add", "Coffee", "3.50", "-c", "Food"]).exit_code == 0
+        assert "3.50" in runner.invoke(app, ["summary"]).stdout
+
+        with TestingSessionLocal() as db:
+            expense_id = db.query(Expense).one().id
+
+        result = runner.invoke(app, ["update", str(expense_id), "--amount", "7.25"])
+        assert result.exit_code == 0
+
+        result = runner.invoke(app, ["summary"])
+        assert "7.25" in result.stdout
+        assert cached.cache_stats().invalidations
+    finally:
+        di["server_socket"] = previous
+        initialize()
+        server.shutdown()
+        server.server_close()
+        thread.join()
+        clear_expenses()
+
+
+def test_server_refuses_live_socket(socket_path: str):
+    assert server_is_running(socket_path)
+
+    with raises(OSError):
+        ExpenseServer(socket_path, SQLAlchemyExpenseRepository(override_get_db))
+
+
+def test_server_socket_is_created_owner_only(tmp_path: Path):
+    previous = umask(0)
+
+    try:
+        server = ExpenseServer(
+            str(tmp_path / "private.sock"), SQLAlchemyExpenseRepository(override_get_db))
+    finally:
+        restored = umask(previous)
+
+    try:
+        assert stat.S_IMODE((tmp_path / "private.sock").stat().st_mode) == 0o600
+        assert restored == 0
+    finally:
+        server.server_close()
@@ -0,0 +1,190 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=unused-argument
+# pylint: disable=wrong-import-order
+
+from pathlib import Path
+from datetime import datetime
+from pytest import fixture, importorskip, raises
+from typer.testing import CliRunner
+from kink import di
+
+importorskip("pyarrow")
+
+from .utils import clear_expenses, override_get_db
+from src.expense_tracker.bootstrap import initialize
+from src.expense_tracker.cli import app
+from src.expense_tracker.protocols import ExpenseRepository
+from src.expense_tracker.records import ExpenseRecord
+from src.expense_tracker.repositories import SQLAlchemyExpenseRepository
+from src.expense_tracker.snapshot import (
+    ReadOnlySnapshotError, SnapshotExpenseRepository, write_snapshot
+)
+
+
+runner = CliRunner()
+
+EXPENSES = [
+    ("Rent", "Housing", 1200.00, datetime(2024, 1, 1)),
+    ("Groceries", "Food", 52.30, datetime(2024, 1, 5)),
+    ("Train", None, 12.10, datetime(2024, 1, 20)),
+    ("Groceries", "Food", 47.95, datetime(2024, 2, 3)),
+    ("Cinema", "Fun", 18.00, datetime(2024, 2, 14)),
+    ("Rent", "Housing", 1200.00, datetime(2024, 2, 1)),
+    ("Coffee", "Food", 3.40, datetime(2023, 12, 31, 23, 59)),
+]
+
+
+@fixture
+def database() -> SQLAlchemyExpenseRepository:
+    clear_expenses()
+    repository = SQLAlchemyExpenseRepository(override_get_db)
+
+    for description, category, amount, date in EXPENSES:
+        repository.add(ExpenseRecord(None, description, category, amount, date, None))
+
+    yield repository
+
+    clear_expenses()
+
+
+@fixture
+def snapshot_path(tmp_path: Path, database: SQLAlchemyExpenseRepository) -> Path:
+    path = tmp_path / "expenses.arrow"
+    result = runner.invoke(app, ["snapshot", str(path), "--batch-size", "3"])
+
+    assert result.exit_code == 0
+    assert f"{len(EXPENSES)} expenses written" in result.output
+
+    return path
+
+
+def fields(expenses) -> list[tuple]:
+    return [
+        (e.id, e.description, e.category, e.amount, e.date, e.notes)
+        for e in expenses
+    ]
+
+
+def test_snapshot_answers_like_the_database(
+    snapshot_path: Path,
+    database: SQLAlchemyExpenseRepository,
+):
+    snapshot = SnapshotExpenseRepository(snapshot_path)
+
+    assert fields(snapshot.list()) == fields(database.list())
+    assert fields(snapshot.list("food", limit=2, after_id=1)) == fields(
+        database.list("food", limit=2, after_id=1))
+    assert fields(snapshot.iter_expenses(batch_size=2)) == fields(database.list())
+    assert snapshot.category_summary() == database.category_summary()
+    assert snapshot.category_summary("Food") == database.category_summary("Food")
+    assert fields(snapshot.monthly_summary(1, 2024)) == fields(
+        database.monthly_summary(1, 2024))
+    assert snapshot.monthly_totals(2, 2024) == database.monthly_totals(2, 2024)
+    assert snapshot.period_totals(
+        datetime(2023, 12, 1), datetime(2024, 3, 1), "food"
+    ) == database.period_totals(datetime(2023, 12, 1), datetime(2024, 3, 1), "food")
+
+
+def test_snapshot_loads_the_same_arrays(
+    snapshot_path: Path,
+    database: SQLAlchemyExpenseRepository,
+):
+    snapshot = SnapshotExpenseRepository(snapshot_path)
+
+    for category in (None, "Food"):
+        args = (datetime(2024, 1, 1), datetime(2024, 3, 1), category)
+        mapped, loaded = snapshot.expense_arrays(*args), database.expense_arrays(*args)
+
+        assert mapped.ids.tolist() == loaded.ids.tolist()
+        assert mapped.cents.tolist() == loaded.cents.tolist()
+        assert mapped.dates.tolist() == loaded.dates.tolist()
+        assert [mapped.names[c] for c in mapped.categories] == [
+            loaded.names[c] for c in loaded.categories]
+
+
+def test_unknown_category_matches_nothing(snapshot_path: Path):
+    snapshot = SnapshotExpenseRepository(snapshot_path)
+
+    assert snapshot.list("Travel") == []
+    assert snapshot.category_summary("Travel") == (0.0, 0)
+
+
+def test_snapshot_does_not_change_with_the_database(
+    snapshot_path: Path,
+    database: SQLAlchemyExpenseRepository,
+):
+    database.add(ExpenseRecord(None, "Taxi", None, 30.0, datetime(2024, 1, 9), None))
+
+    snapshot = SnapshotExpenseRepository(snapshot_path)
+
+    assert snapshot.monthly_totals(1, 2024).count == 3
+
+
+def test_snapshot_is_read_only(snapshot_path: Path):
+    snapshot = SnapshotExpenseRepository(snapshot_path)
+
+    with raises(ReadOnlySnapshotError):
+        snapshot.add(ExpenseRecord(None, "Taxi", None, 30.0, datetime.now(), None))
+
+    with raises(ReadOnlySnapshotError):
+        snapshot.delete_by_id(1)
+
+
+def test_failed_snapshot_leaves_no_files(tmp_path: Path):
+    def batches():
+        yield [(1, "Coffee", 1, 350, datetime(2024, 1, 1), None)]
+        raise RuntimeError("query failed")
+
+    with raises(RuntimeError):
+        write_snapshot(tmp_path / "expenses.arrow", {1: "Food"}, batches())
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_commands_read_configured_snapshot(snapshot_path: Path):
+    clear_expenses()
+    previous = di["snapshot_path"]
+    di["snapshot_path"] = str(snapshot_path)
+    initialize()
+
+    try:
+        assert isinstance(di[ExpenseRepository], SnapshotExpenseRepository)
+
+        result = runner.invoke(app, ["period", "--year", "2024", "--totals-only"])
+        assert result.exit_code == 0
+        assert "$2530.35" in result.output
+    finally:
+        di["snapshot_path"] = previous
+        initialize()
+
+
+def test_commands_report_snapshot_errors(snapshot_path: Path, tmp_path: Path):
+    previous = di["snapshot_path"]
+    di["snapshot_path"] = str(snapshot_path)
+    initialize()
+
+    csv_path = tmp_path / "expenses.csv"
+    csv_path.write_text("Description,Amount\nTaxi,30\n")
+
+    try:
+        for args in (
+            ["add", "Taxi", "30"],
+            ["bulk", str(csv_path)],
+            ["update", "1", "--amount", "5"],
+            ["delete", "1"],
+            ["recategorize", "Dining", "--category", "Food"],
+            ["rebuild-rollups"],
+        ):
+            result = runner.invoke(app, args)
+            assert result.exit_code == 2, args
+            assert "read-only" in result.output, args
+
+        di["snapshot_path"] = str(tmp_path / "missing.arrow")
+        initialize()
+
+        result = runner.invoke(app, ["summary"])
+        assert result.exit_code == 2
+        assert "Could not locate snapshot" in result.output
+    finally:
+        di["snapshot_path"] = previous
+        initialize()
@@ -8,11 +8,16 @@ from pytest import mark, raises
 from datetime import datetime
 from kink import di
 
-from .utils import test_expense, override_get_db
+from sqlalchemy import text
+
+from .utils import (
+    TestingSessionLocal, clear_expenses, count_statements, test_expense, override_get_db
+)
 
 from src.expense_tracker.repositories import SQLAlchemyExpenseRepository
 from src.expense_tracker.protocols import ExpenseRepository
 from src.expense_tracker.models import Expense
+from src.expense_tracker.records import ExpenseFilter, ExpenseRecord
 
 
 def test_get_expense(test_expense: Expense):
@@ -104,7 +109,7 @@ def test_list_expenses(test_expense: Expense):
     expense_list = repository.list()
 
     assert expense_list
-    assert all(isinstance(e, Expense) for e in expense_list)
+    assert all(isinstance(e, ExpenseRecord) for e in expense_list)
 
 
 def test_type_check():
@@ -154,7 +159,7 @@ def test_monthly_summary(test_expense: Expense):
 
     results = repository.monthly_summary(month, year)
     assert isinstance(results, list)
-    assert all(isinstance(e, Expense) for e in results)
+    assert all(isinstance(e, ExpenseRecord) for e in results)
 
 
 def test_list_type_check():
@@ -185,3 +190,271 @@ def test_monthly_summary_invalid_inputs(month, year, exc_type):
 
     with raises(exc_type):
         repository.monthly_summary(month, year)  # type: ignore
+
+
+def test_bulk_insert_in_batches(test_expense: Expense):
+    repository = di[ExpenseRepository]
+
+    rows = (
+        {"description": f"Row {i}", "amount": float(i), "category": "Bulk"}
+        for i in range(1, 6)
+    )
+
+    batches = []
+    inserted = repository.bulk_insert(
+        rows, batch_size=2, on_batch=batches.append)
+    assert inserted == 5
+    assert batches == [2, 2, 1]
+
+    with override_get_db() as db:
+        results = db.query(Expense).filter(Expense.category == "Bulk").all()
+        assert len(results) == 5
+        assert all(r.date is not None for r in results)
+
+
+def test_bulk_insert_invalid_batch_size():
+    repository = di[ExpenseRepository]
+
+    with raises(ValueError):
+        repository.bulk_insert([], batch_size=0)
+
+
+def test_between_is_half_open(test_expense: Expense):
+    repository = di[ExpenseRepository]
+
+    repository.bulk_insert([
+        {"description": "Start", "amount": 1.0, "category": "Range",
+         "date": datetime(2024, 3, 1)},
+        {"description": "Inside", "amount": 2.0, "category": "Range",
+         "date": datetime(2024, 3, 31, 23, 59)},
+        {"description": "End", "amount": 3.0, "category": "Range",
+         "date": datetime(2024, 4, 1)},
+    ])
+
+    results = repository.between(
+        datetime(2024, 3, 1), datetime(2024, 4, 1), category="range")
+    assert [e.description for e in results] == ["Start", "Inside"]
+
+    assert [e.description for e in repository.monthly_summary(4, 2024)] == ["End"]
+
+
+def test_between_invalid_range():
+    repository = di[ExpenseRepository]
+
+    with raises(ValueError):
+        repository.between(datetime(2024, 4, 1), datetime(2024, 3, 1))
+
+    with raises(TypeError):
+        repository.between("2024-03-01", datetime(2024, 4, 1))  # type: ignore
+
+
+def test_period_totals_groups_by_category(test_expense: Expense):
+    repository = di[ExpenseRepository]
+
+    repository.bulk_insert([
+        {"description": "Bus", "amount": 2.5, "category": "Transport",
+         "date": datetime(2024, 5, 2)},
+        {"description": "Train", "amount": 7.5, "category": "Transport",
+         "date": datetime(2024, 5, 3)},
+        {"description": "Lunch", "amount": 10.0, "category": "Food",
+         "date": datetime(2024, 5, 3)},
+        {"description": "Later", "amount": 99.0, "category": "Food",
+         "date": datetime(2024, 6, 1)},
+    ])
+
+    totals = repository.monthly_totals(5, 2024)
+    assert totals.total == 20.0
+    assert totals.count == 3
+    assert [tuple(c) for c in totals.categories] == [
+        ("Food", 10.0, 1), ("Transport", 10.0, 2)]
+
+    empty = repository.monthly_totals(1, 2000)
+    assert (empty.total, empty.count, empty.categories) == (0, 0, [])
+
+
+def test_list_keyset_pagination(test_expense: Expense):
+    repository = di[ExpenseRepository]
+    repository.bulk_insert(
+        {"description": f"Page {i}", "amount": 1.0, "category": "Paged"}
+        for i in range(5)
+    )
+
+    first = repository.list("paged", limit=2)
+    second = repository.list("paged", limit=2, after_id=first[-1].id)
+
+    assert [e.description for e in first] == ["Page 0", "Page 1"]
+    assert [e.description for e in second] == ["Page 2", "Page 3"]
+
+    streamed = repository.iter_expenses(
+        "paged", after_id=first[0].id, batch_size=2)
+    assert [e.description for e in streamed] == [
+        "Page 1", "Page 2", "Page 3", "Page 4"]
+
+
+def test_reads_return_plain_records(test_expense: Expense):
+    repository = di[ExpenseRepository]
+    repository.bulk_insert([
+        {"description": "Tagged", "amount": 12.5, "category": "rent",
+         "notes": "March", "date": datetime(2024, 3, 2)},
+        {"description": "Untagged", "amount": 3.0, "category": None,
+         "notes": None, "date": datetime(2024, 3, 5)},
+    ])
+
+    expected = [
+        ("Tagged", "Rent", 12.5, datetime(2024, 3, 2), "March"),
+        ("Untagged", None, 3.0, datetime(2024, 3, 5), None),
+    ]
+
+    for expenses in (
+        repository.monthly_summary(3, 2024),
+        list(repository.iter_between(datetime(2024, 3, 1), datetime(2024, 4, 1))),
+        repository.list(after_id=test_expense.id),
+    ):
+        assert all(type(e) is ExpenseRecord for e in expenses)
+        assert [tuple(e)[1:] for e in expenses] == expected
+
+
+@mark.parametrize("kwargs", [{"limit": 0}, {"after_id": "1"}])
+def test_list_pagination_invalid_inputs(kwargs):
+    repository = di[ExpenseRepository]
+
+    with raises(ValueError):
+        repository.list(**kwargs)
+
+
+def seed_batch_expenses(repository: ExpenseRepository) -> None:
+    clear_expenses()
+    repository.bulk_insert([
+        {"description": "Uber to airport", "amount": 30.0, "category": "Misc",
+         "date": datetime(2024, 3, 2)},
+        {"description": "Uber home", "amount": 12.0, "category": "Misc",
+         "date": datetime(2024, 4, 9)},
+        {"description": "Groceries", "amount": 50.0, "category": "Food",
+         "date": datetime(2024, 3, 5)},
+        {"description": "Cinema", "amount": 15.0, "category": "Misc",
+         "date": datetime(2024, 3, 20)},
+    ])
+
+
+def test_update_many_recategorizes_in_one_statement():
+    repository = di[ExpenseRepository]
+    seed_batch_expenses(repository)
+
+    updated = repository.update_many(
+        ExpenseFilter(description="Uber%"), {"category": "Transport"})
+
+    assert updated == 2
+    assert repository.category_summary("transport") == (42.0, 2)
+    assert repository.category_summary("misc") == (15.0, 1)
+    assert [tuple(c) for c in repository.monthly_totals(3, 2024).categories] == [
+        ("Food", 50.0, 1), ("Misc", 15.0, 1), ("Transport", 30.0, 1)]
+    assert repository.rebuild_rollups(dry_run=True) == []
+
+    clear_expenses()
+
+
+def test_delete_many_by_category_and_month():
+    repository = di[ExpenseRepository]
+    seed_batch_expenses(repository)
+
+    deleted = repository.delete_many(ExpenseFilter(
+        category="misc", start=datetime(2024, 3, 1), end=datetime(2024, 4, 1)))
+
+    assert deleted == 2
+    assert [e.description for e in repository.list()] == ["Uber home", "Groceries"]
+    assert repository.monthly_totals(3, 2024).total == 50.0
+    assert repository.rebuild_rollups(dry_run=True) == []
+
+    ids = [e.id for e in repository.list()]
+    assert repository.delete_many(ExpenseFilter(ids=ids)) == 2
+    assert repository.category_summary() == (0.0, 0)
+
+
+@mark.parametrize("expense_filter, values, exc_type", [
+    (ExpenseFilter(), {"category": "Food"}, ValueError),
+    (ExpenseFilter(ids=[0]), {"category": "Food"}, ValueError),
+    (ExpenseFilter(category="Food"), {"id": 5}, ValueError),
+    (ExpenseFilter(category="Food"), {}, ValueError),
+    (ExpenseFilter(start="2024-01-01"), {"category": "Food"}, TypeError),
+    ({"category": "Food"}, {"category": "Food"}, TypeError),
+])
+def test_batch_operations_invalid_inputs(expense_filter, values, exc_type):
+    repository = di[ExpenseRepository]
+
+    with raises(exc_type):
+        repository.update_many(expense_filter, values)
+
+
+def test_get_many_uses_one_query(test_expense: Expense):
+    repository = di[ExpenseRepository]
+    other = repository.add(Expense(
+        description="Taxi", amount=9.0, category="Transport", date=datetime.now()))
+
+    expense_id = test_expense.id
+
+    with count_statements() as statements:
+        expenses = repository.get_many([other, expense_id, 9999])
+
+    assert [e.id for e in expenses] == [expense_id, other]
+    assert len(statements) == 1
+
+
+def test_update_by_id_returns_new_row(test_expense: Expense):
+    repository = di[ExpenseRepository]
+    expense_id = test_expense.id
+
+    with count_statements() as statements:
+        updated = repository.update_by_id(expense_id, {"notes": "Edited"})
+
+    assert updated.notes == "Edited"
+    assert updated.description == test_expense.description
+    assert len(statements) == 1
+
+    moved = repository.update_by_id(
+        test_expense.id, {"category": "Household", "amount": 10.0})
+
+    assert (moved.category, moved.amount) == ("Household", 10.0)
+    assert repository.category_summary("household") == (10.0, 1)
+    assert repository.category_summary("food") == (0.0, 0)
+    assert repository.rebuild_rollups(dry_run=True) == []
+
+    assert repository.update_by_id(9999, {"notes": "Ghost"}) is None
+    assert repository.update_by_id(9999, {"amount": 1.0}) is None
+
+
+def test_delete_by_id_returns_deleted_row(test_expense: Expense):
+    repository = di[ExpenseRepository]
+
+    deleted = repository.delete_by_id(test_expense.id)
+
+    assert deleted.id == test_expense.id
+    assert deleted.amount == test_expense.amount
+    assert repository.get(test_expense.id) is None
+    assert repository.category_summary("food") == (0.0, 0)
+    assert repository.delete_by_id(test_expense.id) is None
+
+
+def test_amounts_are_summed_exactly_in_cents():
+    repository = di[ExpenseRepository]
+    clear_expenses()
+
+    repository.bulk_insert(
+        {"description": "Coffee", "amount": 0.1, "category": "Food",
+         "date": datetime(2025, 3, 4)}
+        for _ in range(10)
+    )
+    expense_id = repository.add(Expense(
+        description="Tea", amount=0.2, category="Food", date=datetime(2025, 3, 5)))
+
+    with TestingSessionLocal() as db:
+        cents = db.scalar(text(
+            "SELECT amount_cents FROM expenses WHERE id = :id"), {"id": expense_id})
+
+    assert cents == 20
+    assert repository.get(expense_id).amount == 0.2
+    assert repository.category_summary("food") == (1.2, 11)
+    assert repository.monthly_totals(3, 2025).total == 1.2
+    assert repository.period_totals(
+        datetime(2025, 3, 1), datetime(2025, 4, 1)).total == 1.2
+
+    clear_expenses()
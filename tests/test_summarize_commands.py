@@ -3,12 +3,13 @@
 # pylint: disable=wrong-import-order
 # pylint: disable=unused-import
 
+import json
 from pathlib import Path
 from datetime import datetime
 from typer.testing import CliRunner
 import pandas as pd
 
-from .utils import TestingSessionLocal, test_expense
+from .utils import TestingSessionLocal, clear_expenses, test_expense
 from src.expense_tracker.models import Expense
 from src.expense_tracker.cli import app
 
@@ -92,12 +93,108 @@ def test_month_command_export_creates_csv(tmp_path: Path, test_expense: Expense)
 
 
 def test_month_command_no_expenses(tmp_path: Path):
-    with TestingSessionLocal() as db:
-        db.query(Expense).delete()
-        db.commit()
+    clear_expenses()
 
     current_month = datetime.now().month
     result = runner.invoke(app, ["month", str(current_month)])
 
     assert result.exit_code == 0
     assert "No expenses found" in result.output
+
+
+def test_period_command_custom_range(test_expense: Expense):
+    today = datetime.now().strftime("%Y-%m-%d")
+    result = runner.invoke(app, ["period", "--start", today, "--end", today])
+
+    assert result.exit_code == 0
+    assert f"Expenses for {today} to {today}" in result.output
+    assert test_expense.description in result.output
+
+
+def test_period_command_quarter(test_expense: Expense):
+    quarter = (datetime.now().month - 1) // 3 + 1
+    result = runner.invoke(app, ["period", "--quarter", str(quarter)])
+
+    assert result.exit_code == 0
+    assert test_expense.description in result.output
+
+
+def test_period_command_requires_both_bounds():
+    result = runner.invoke(app, ["period", "--start", "2025-01-01"])
+
+    assert result.exit_code == 2
+    assert "--start and --end must be used together" in result.output
+
+
+def test_month_command_totals_only(test_expense: Expense):
+    current_month = datetime.now().month
+    result = runner.invoke(app, ["month", str(current_month), "--totals-only"])
+
+    assert result.exit_code == 0
+    assert "Totals for" in result.output
+    assert test_expense.category in result.output
+    assert test_expense.description not in result.output
+    assert f"${test_expense.amount:.2f}" in result.output
+
+
+def test_month_command_totals_only_export_streams_rows(
+    tmp_path: Path,
+    test_expense: Expense
+):
+    current_month = datetime.now().month
+    result = runner.invoke(
+        app,
+        ["month", str(current_month), "--totals-only", "--export",
+         "--directory", str(tmp_path), "--filename", "monthly"],
+    )
+
+    assert result.exit_code == 0
+
+    df = pd.read_csv(tmp_path / "monthly.csv")
+    assert list(df["Description"]) == [test_expense.description, "Total"]
+    assert list(df["Amount"]) == [test_expense.amount, test_expense.amount]
+
+
+def test_month_command_streams_rows(test_expense: Expense):
+    current_month = str(datetime.now().month)
+
+    result = runner.invoke(app, ["month", current_month, "--output", "jsonl"])
+
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [(r["id"], r["amount"]) for r in rows] == [(test_expense.id, test_expense.amount)]
+    assert "Total for" in result.stderr
+
+    result = runner.invoke(app, ["month", current_month, "-t", "-o", "plain"])
+
+    assert result.exit_code == 0
+    assert result.stdout.splitlines()[0].split() == ["Category", "Entries", "Total"]
+    assert result.stdout.splitlines()[1].split() == [
+        test_expense.category, "1", f"{test_expense.amount:.2f}"]
+
+
+def test_report_command_breaks_down_period(test_expense: Expense):
+    result = runner.invoke(
+        app, ["report", "--percentile", "50", "--top", "1", "--category", "food"])
+
+    assert result.exit_code == 0
+    assert "By category" in result.output
+    assert "Running total" in result.output
+    assert datetime.now().strftime("%A") in result.output
+    assert "p50" in result.output
+    assert test_expense.description in result.output
+    assert f"${test_expense.amount:.2f}" in result.output
+
+
+def test_report_command_no_expenses():
+    result = runner.invoke(app, ["report", "--year", "1990"])
+
+    assert result.exit_code == 0
+    assert "No expenses found" in result.output
+
+
+def test_report_command_rejects_conflicting_ranges():
+    result = runner.invoke(
+        app, ["report", "--start", "2025-01-01", "--end", "2025-01-31", "--quarter", "1"])
+
+    assert result.exit_code == 2
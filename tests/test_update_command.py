@@ -5,7 +5,7 @@
 
 from typer.testing import CliRunner
 
-from .utils import TestingSessionLocal, test_expense
+from .utils import TestingSessionLocal, clear_expenses, test_expense
 from src.expense_tracker.models import Expense
 from src.expense_tracker.cli import app
 
@@ -58,3 +58,19 @@ def test_update_invalid_id_below_one():
     result = runner.invoke(
         app, ["update", "-1", "--description", "Invalid ID"])
     assert result.exit_code == 2
+
+
+def test_recategorize_by_description(test_expense: Expense):
+    result = runner.invoke(
+        app, ["recategorize", "Groceries", "--description", "Grocer%"])
+
+    assert result.exit_code == 0
+    assert "1 expenses recategorized as Groceries" in result.output
+
+    with TestingSessionLocal() as db:
+        assert db.get(Expense, test_expense.id).category == "Groceries"
+
+
+def test_recategorize_requires_filter():
+    result = runner.invoke(app, ["recategorize", "Food"])
+    assert result.exit_code == 2
@@ -11,7 +11,7 @@ from datetime import datetime
 from pytest import fixture
 from kink import di
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -48,10 +48,11 @@ di["db_url"] = SQLALCHEMY_DATABASE_URL
 
 # Dependency injection must happen before BASE and Task are imported.
 # Both of these modules depend on the "db_url" and "db_session_context".
-from src.expense_tracker.database import BASE
+from src.expense_tracker.migrations import ensure_schema
 from src.expense_tracker.models import Expense
+from src.expense_tracker.rollups import rebuild_rollups
 
-BASE.metadata.create_all(bind=engine)
+ensure_schema(engine)
 
 
 @fixture
@@ -69,8 +70,33 @@ def test_expense():
     db.add(expense)
     db.commit()
 
+    with TestingSessionLocal() as rollup_db:
+        rebuild_rollups(rollup_db)
+        rollup_db.commit()
+
     yield expense
 
+    clear_expenses()
+
+
+def clear_expenses():
     with engine.connect() as connection:
         connection.execute(text("DELETE FROM expenses;"))
+        connection.execute(text("DELETE FROM expense_rollups;"))
         connection.commit()
+
+
+@contextmanager
+def count_statements():
+    """Collect the SQL statements run on the test engine in the block."""
+    statements: list[str] = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)